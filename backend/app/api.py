@@ -1,5 +1,7 @@
 from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Query, Body
+import logging
+from fastapi import APIRouter, HTTPException, Query, Body, Header
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from .schemas import GraphResponse, AddressProfile
 from .core import driver, ingest_address, expand_graph
@@ -23,7 +25,18 @@ from .graphql_api import GraphQLResolver
 from .rate_limiter import rate_limiter
 from .webhook_system import get_webhook_manager
 
-router = APIRouter(prefix="/api", tags=["api"])
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    # Bulk results are always sent as JSON
+    MSGPACK_AVAILABLE = False
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+logger = logging.getLogger("aml.api")
+
+router = APIRouter(prefix="/api", tags=["api"], default_response_class=ORJSONResponse)
 
 # Initialize modules
 pattern_detector = PatternDetector(driver)
@@ -39,6 +52,14 @@ graphql_resolver = GraphQLResolver(driver)
 webhook_manager = get_webhook_manager(driver)
 
 
+def _notify_webhooks(event: str, payload: Dict[str, Any]):
+    """Queue a webhook event (coalesced per subscriber); never fails the request"""
+    try:
+        webhook_manager.enqueue_webhook(event, payload)
+    except Exception as e:
+        logger.error("Could not queue webhook event %s: %s", event, e)
+
+
 @router.post("/ingest/{address}")
 def ingest(address: str) -> Dict[str, Any]:
     try:
@@ -701,6 +722,7 @@ def create_alert(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
         )
         
         results = alert_manager.process_alert(alert)
+        _notify_webhooks("alert.created", alert)
         return {"ok": True, **results}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -747,13 +769,33 @@ def generate_pdf(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     try:
         report = report_generator.generate_pdf_report(
             data=data.get("data", {}),
-            report_type=data.get("report_type", "investigation")
+            report_type=data.get("report_type", "investigation"),
+            base64_encode=True
         )
+        report.pop("pdf_bytes", None)  # JSON envelope carries pdf_data (base64)
         return {"ok": True, **report}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/reports/pdf/download")
+def download_pdf(data: Dict[str, Any] = Body(...)):
+    """
+    Generate PDF report and return the raw file (no base64 envelope).
+    """
+    report = report_generator.generate_pdf_report(
+        data=data.get("data", {}),
+        report_type=data.get("report_type", "investigation")
+    )
+    if report["status"] != "success":
+        raise HTTPException(status_code=500, detail=report.get("error") or report.get("message"))
+    return Response(
+        content=report["pdf_bytes"],
+        media_type="application/pdf",
+        headers={"Content-Disposition": 'attachment; filename="ethguardian-report.pdf"'}
+    )
+
+
 @router.post("/reports/excel")
 def generate_excel(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """
@@ -762,13 +804,33 @@ def generate_excel(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     try:
         report = report_generator.generate_excel_report(
             data=data.get("data", {}),
-            report_type=data.get("report_type", "investigation")
+            report_type=data.get("report_type", "investigation"),
+            base64_encode=True
         )
+        report.pop("excel_bytes", None)  # JSON envelope carries excel_data (base64)
         return {"ok": True, **report}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/reports/excel/download")
+def download_excel(data: Dict[str, Any] = Body(...)):
+    """
+    Generate Excel report and return the raw .xlsx file (no base64 envelope).
+    """
+    report = report_generator.generate_excel_report(
+        data=data.get("data", {}),
+        report_type=data.get("report_type", "investigation")
+    )
+    if report["status"] != "success":
+        raise HTTPException(status_code=500, detail=report.get("error"))
+    return Response(
+        content=report["excel_bytes"],
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Content-Disposition": 'attachment; filename="ethguardian-report.xlsx"'}
+    )
+
+
 @router.post("/reports/html")
 def generate_html(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """
@@ -776,11 +838,37 @@ def generate_html(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """
     try:
         report = report_generator.generate_html_report(data.get("data", {}))
+        report.pop("html_bytes", None)
         return {"ok": True, **report}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/reports/html/download")
+def download_html(data: Dict[str, Any] = Body(...)):
+    """
+    Generate HTML report and return the page itself (already UTF-8 encoded).
+    """
+    report = report_generator.generate_html_report(data.get("data", {}), as_text=False)
+    return Response(content=report["html_bytes"], media_type="text/html; charset=utf-8")
+
+
+@router.post("/reports/html/batch")
+def generate_html_batch(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+    """
+    Generate HTML reports for several payloads at once.
+    
+    Body: {"items": [{...report data...}, ...]}
+    """
+    try:
+        reports = report_generator.generate_html_reports(data.get("items", []))
+        for report in reports:
+            report.pop("html_bytes", None)
+        return {"ok": True, "reports": reports, "count": len(reports)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/reports/json")
 def generate_json_report(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """
@@ -994,8 +1082,30 @@ def get_watchlist_monitoring_status() -> Dict[str, Any]:
 # BULK ANALYSIS ENDPOINTS
 # ============================================================================
 
+def _prefers_msgpack(accept: Optional[str]) -> bool:
+    """True when the Accept header ranks MessagePack at least as high as JSON"""
+    if not MSGPACK_AVAILABLE or not accept:
+        return False
+    
+    quality = {}
+    for media_range in accept.split(","):
+        media_type, _, params = media_range.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        quality[media_type.strip().lower()] = q
+    
+    msgpack_q = quality.get(MSGPACK_MEDIA_TYPE, 0.0)
+    return msgpack_q > 0 and msgpack_q >= quality.get("application/json", 0.0)
+
+
 @router.post("/bulk/analyze")
-def bulk_analyze(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+def bulk_analyze(data: Dict[str, Any] = Body(...), accept: Optional[str] = Header(None)):
     """
     Analyze thousands of addresses in batch.
     
@@ -1003,6 +1113,8 @@ def bulk_analyze(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
         "addresses": ["0x...", "0x...", ...],
         "parallel": true
     }
+    
+    Send "Accept: application/x-msgpack" to receive the results as MessagePack.
     """
     try:
         addresses = data.get("addresses", [])
@@ -1015,6 +1127,9 @@ def bulk_analyze(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
             raise HTTPException(status_code=400, detail="Maximum 10000 addresses per batch")
         
         result = bulk_analyzer.bulk_analyze(addresses, parallel)
+        if _prefers_msgpack(accept):
+            return Response(msgpack.packb({"ok": True, **result}, default=str),
+                            media_type=MSGPACK_MEDIA_TYPE)
         return {"ok": True, **result}
     except HTTPException:
         raise
@@ -1242,6 +1357,7 @@ def create_case(request: CreateCaseRequest) -> Dict[str, Any]:
             request.created_by,
             request.description
         )
+        _notify_webhooks("case.created", result)
         return {"ok": True, **result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
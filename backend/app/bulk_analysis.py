@@ -3,7 +3,7 @@ Bulk Address Analysis Module
 Analyze thousands of addresses in batch
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -16,8 +16,8 @@ class BulkAnalyzer:
         self.driver = neo4j_driver
         self.max_workers = 10
     
-    def analyze_address_quick(self, address: str) -> Dict[str, Any]:
-        """Quick analysis of single address"""
+    def analyze_address_quick(self, address: str, risk_score: Optional[float] = None) -> Dict[str, Any]:
+        """Quick analysis of single address (risk_score may be precomputed in batch)"""
         from .pattern_detection import PatternDetector
         from .fraud_detection import FraudDetector
         from .ml_models import get_address_risk_score
@@ -30,7 +30,8 @@ class BulkAnalyzer:
             layering = pattern_detector.detect_layering(address, depth=3, time_window_hours=24)
             wash_trading = pattern_detector.detect_wash_trading(address)
             phishing = fraud_detector.detect_phishing(address)
-            risk_score = get_address_risk_score(self.driver, address)
+            if risk_score is None:
+                risk_score = get_address_risk_score(self.driver, address)
             
             return {
                 "address": address,
@@ -58,14 +59,22 @@ class BulkAnalyzer:
         Returns:
             Analysis results for all addresses
         """
+        from .ml_models import get_address_risk_scores
+        
         start_time = datetime.now()
         results = []
         
+        # Risk scores for the whole batch in one vectorized pass
+        try:
+            scores = get_address_risk_scores(self.driver, addresses)
+        except Exception:
+            scores = {}
+        
         if parallel and len(addresses) > 1:
             # Parallel processing
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 future_to_address = {
-                    executor.submit(self.analyze_address_quick, addr): addr 
+                    executor.submit(self.analyze_address_quick, addr, scores.get(addr)): addr 
                     for addr in addresses
                 }
                 
@@ -83,7 +92,7 @@ class BulkAnalyzer:
         else:
             # Sequential processing
             for addr in addresses:
-                result = self.analyze_address_quick(addr)
+                result = self.analyze_address_quick(addr, scores.get(addr))
                 results.append(result)
         
         end_time = datetime.now()
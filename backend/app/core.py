@@ -11,7 +11,11 @@ load_dotenv()
 logger = logging.getLogger("aml.core")
 logging.basicConfig(level=logging.INFO)
 
-NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+# Backend Bolt: "neo4j" (referência) ou "memgraph" (mesmo driver/protocolo)
+GRAPH_BACKEND = os.getenv("GRAPH_BACKEND", "neo4j").lower()
+IS_MEMGRAPH = GRAPH_BACKEND == "memgraph"
+
+NEO4J_URI = os.getenv("NEO4J_URI", "bolt://memgraph:7687" if IS_MEMGRAPH else "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "neo4j")
 ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY", "")
@@ -21,18 +25,66 @@ driver: Driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWOR
 
 
 def init_constraints() -> None:
-    """Cria constraints idempotentes para Address, Transaction e Alert."""
+    """Cria constraints e índices idempotentes para Address, Transaction, Alert e Meta."""
     cyphers = [
         "CREATE CONSTRAINT address_unique IF NOT EXISTS FOR (a:Address) REQUIRE a.address IS UNIQUE",
         "CREATE CONSTRAINT tx_hash_unique IF NOT EXISTS FOR (t:Transaction) REQUIRE t.hash IS UNIQUE",
         "CREATE CONSTRAINT alert_id_unique IF NOT EXISTS FOR (al:Alert) REQUIRE al.id IS UNIQUE",
+        "CREATE CONSTRAINT meta_id_unique IF NOT EXISTS FOR (m:Meta) REQUIRE m.id IS UNIQUE",
+        "CREATE RANGE INDEX tx_block_idx IF NOT EXISTS FOR (t:Transaction) ON (t.block)",
+        "CREATE RANGE INDEX alert_created_idx IF NOT EXISTS FOR (al:Alert) ON (al.created_at)",
+        "CREATE RANGE INDEX case_created_idx IF NOT EXISTS FOR (c:Case) ON (c.created_at)",
+        "CREATE RANGE INDEX tx_rel_ts_idx IF NOT EXISTS FOR ()-[t:TRANSACTION]-() ON (t.timestamp)",
+        "CREATE RANGE INDEX tx_rel_value_idx IF NOT EXISTS FOR ()-[t:TRANSACTION]-() ON (t.value_eth)",
     ]
+    if IS_MEMGRAPH:
+        _init_memgraph_constraints()
+        return
     with driver.session() as session:
         for c in cyphers:
             session.execute_write(lambda tx: tx.run(c))
     logger.info("Constraints ok.")
 
 
+def _init_memgraph_constraints() -> None:
+    """Equivalentes Memgraph (sem IF NOT EXISTS; DDL fora de transação explícita)."""
+    cyphers = [
+        "CREATE CONSTRAINT ON (a:Address) ASSERT a.address IS UNIQUE",
+        "CREATE CONSTRAINT ON (t:Transaction) ASSERT t.hash IS UNIQUE",
+        "CREATE CONSTRAINT ON (al:Alert) ASSERT al.id IS UNIQUE",
+        "CREATE CONSTRAINT ON (m:Meta) ASSERT m.id IS UNIQUE",
+        "CREATE INDEX ON :Address(address)",
+        "CREATE INDEX ON :Transaction(block)",
+        "CREATE INDEX ON :Alert(created_at)",
+        "CREATE INDEX ON :Case(created_at)",
+        "CREATE EDGE INDEX ON :TRANSACTION(timestamp)",
+        "CREATE EDGE INDEX ON :TRANSACTION(value_eth)",
+    ]
+    with driver.session() as session:
+        for c in cyphers:
+            try:
+                session.run(c).consume()
+            except Exception as e:
+                logger.info("Memgraph schema: %s (%s)", c, e)
+    logger.info("Constraints ok (memgraph).")
+
+
+def warm_up_queries(queries: List[Tuple[str, Dict]]) -> int:
+    """
+    Pré-planeja consultas com EXPLAIN (não executa) para popular o cache de
+    planos do Neo4j antes do tráfego real. Retorna quantas foram planejadas.
+    """
+    planned = 0
+    with driver.session() as session:
+        for cypher, params in queries:
+            try:
+                session.run("EXPLAIN " + cypher, **params).consume()
+                planned += 1
+            except Exception as e:
+                logger.warning("Warm-up falhou: %s", e)
+    return planned
+
+
 class EtherscanClient:
     BASE = "https://api.etherscan.io/v2/api"  # V2 API endpoint
 
@@ -103,23 +155,8 @@ def _prepare_tx_rows(raw_txs: List[Dict]) -> List[Dict]:
     return rows
 
 
-def ingest_address(address: str, limit: int | None = None) -> Dict:
-    """Ingestão de transações do Etherscan e *MERGE* no Neo4j."""
-    client = EtherscanClient(chain_id=ETHERSCAN_CHAIN_ID)
-    logger.info("Ingesting from Etherscan V2 (Chain ID: %d) for %s", ETHERSCAN_CHAIN_ID, address)
-    raw = client.get_txlist(address)
-    if limit:
-        raw = raw[:limit]
-    rows = _prepare_tx_rows(raw)
-
-    if not rows:
-        logger.info("Nenhuma transação para %s", address)
-        return {"ingested": 0}
-
-    cypher = """
-    UNWIND $txs AS tx
-    WITH tx
-    WHERE tx.to IS NOT NULL AND tx.to <> ''
+# Corpo do MERGE por linha (tx) — compartilhado entre ingestão simples e em lote
+_TX_MERGE_CYPHER = """
     MERGE (a:Address {address: tx.from})
       ON CREATE SET a.first_seen = tx.ts, a.total_in = 0.0, a.total_out = 0.0
       SET a.last_seen = CASE WHEN a.last_seen IS NULL OR a.last_seen < tx.ts THEN tx.ts ELSE a.last_seen END,
@@ -135,13 +172,96 @@ def ingest_address(address: str, limit: int | None = None) -> Dict:
     MERGE (a)-[r:TRANSFER]->(b)
       ON CREATE SET r.count = 0, r.value_sum = 0.0, r.last_ts = tx.ts
       SET r.count = r.count + 1, r.value_sum = r.value_sum + tx.value, r.last_ts = tx.ts
-    """
+    MERGE (a)-[e:TRANSACTION {hash: tx.hash}]->(b)
+      ON CREATE SET e.from = tx.from, e.to = tx.to, e.value_eth = tx.value,
+                    e.timestamp = tx.ts, e.block_number = tx.block
+"""
+
+INGEST_CYPHER = """
+    UNWIND $txs AS tx
+    WITH tx
+    WHERE tx.to IS NOT NULL AND tx.to <> ''
+""" + _TX_MERGE_CYPHER + """
+    WITH max(tx.block) AS max_block
+    MERGE (m:Meta {id: 'monitor'})
+      SET m.last_block = CASE WHEN m.last_block IS NULL OR m.last_block < max_block THEN max_block ELSE m.last_block END
+"""
+
+# Commits periódicos no servidor: exige transação implícita (session.run)
+BATCH_INGEST_CYPHER = """
+    UNWIND $txs AS tx
+    WITH tx
+    WHERE tx.to IS NOT NULL AND tx.to <> ''
+    CALL {
+      WITH tx
+""" + _TX_MERGE_CYPHER + """
+    } IN TRANSACTIONS OF $batch_size ROWS
+"""
+
+META_LAST_BLOCK_CYPHER = """
+    MERGE (m:Meta {id: 'monitor'})
+      SET m.last_block = CASE WHEN m.last_block IS NULL OR m.last_block < $block THEN $block ELSE m.last_block END
+"""
+
+
+def ingest_address(address: str, limit: int | None = None) -> Dict:
+    """Ingestão de transações do Etherscan e *MERGE* no Neo4j."""
+    client = EtherscanClient(chain_id=ETHERSCAN_CHAIN_ID)
+    logger.info("Ingesting from Etherscan V2 (Chain ID: %d) for %s", ETHERSCAN_CHAIN_ID, address)
+    raw = client.get_txlist(address)
+    if limit:
+        raw = raw[:limit]
+    rows = _prepare_tx_rows(raw)
+
+    if not rows:
+        logger.info("Nenhuma transação para %s", address)
+        return {"ingested": 0}
+
     with driver.session() as session:
-        session.execute_write(lambda tx: tx.run(cypher, txs=rows))
+        session.execute_write(lambda tx: tx.run(INGEST_CYPHER, txs=rows))
     logger.info("Ingested %d tx rows.", len(rows))
     return {"ingested": len(rows)}
 
 
+def ingest_addresses(addresses: List[str], limit: int | None = None, batch_size: int = 500) -> Dict:
+    """
+    Ingestão em lote: busca várias addresses no Etherscan e grava tudo com um
+    único UNWIND ... CALL { } IN TRANSACTIONS OF N ROWS.
+    Linhas repetidas (mesmo hash vindo de duas addresses) são descartadas.
+    """
+    client = EtherscanClient(chain_id=ETHERSCAN_CHAIN_ID)
+    rows_by_hash: Dict[str, Dict] = {}
+    failed: List[str] = []
+    for address in addresses:
+        try:
+            raw = client.get_txlist(address)
+        except Exception as e:
+            logger.warning("Falha ao buscar %s: %s", address, e)
+            failed.append(address)
+            continue
+        if limit:
+            raw = raw[:limit]
+        for row in _prepare_tx_rows(raw):
+            rows_by_hash.setdefault(row["hash"], row)
+
+    rows = list(rows_by_hash.values())
+    if not rows:
+        logger.info("Nenhuma transação para %d addresses", len(addresses))
+        return {"ingested": 0, "failed": failed}
+
+    with driver.session() as session:
+        if IS_MEMGRAPH:
+            # Memgraph não suporta CALL { } IN TRANSACTIONS: lotes explícitos
+            for i in range(0, len(rows), batch_size):
+                chunk = rows[i:i + batch_size]
+                session.execute_write(lambda tx: tx.run(INGEST_CYPHER, txs=chunk))
+        else:
+            session.run(BATCH_INGEST_CYPHER, txs=rows, batch_size=batch_size).consume()
+            session.run(META_LAST_BLOCK_CYPHER, block=max(r["block"] for r in rows)).consume()
+    logger.info("Ingested %d tx rows for %d addresses.", len(rows), len(addresses))
+    return {"ingested": len(rows), "failed": failed}
+
+
 def expand_graph(address: str, hops: int = 2, limit_nodes: int = 400) -> Tuple[List[Dict], List[Dict]]:
     """
     Retorna nós (endereços) e arestas (TRANSFER) até N hops.
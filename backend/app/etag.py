@@ -0,0 +1,77 @@
+"""
+ETag Middleware
+Conditional GETs for the JSON API:
+- Weak ETag (content hash) on complete 200 responses to GET /api/*
+- 304 Not Modified when If-None-Match already names that ETag
+
+Streamed responses (more than one body message) pass through untagged.
+"""
+
+from typing import List, Optional
+import hashlib
+
+
+def _etag_for(body: bytes) -> bytes:
+    """Weak validator derived from the response body"""
+    return b'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode("ascii") + b'"'
+
+
+def _matches(if_none_match: Optional[bytes], etag: bytes) -> bool:
+    """If-None-Match comparison (weak, as GET conditional requests use)"""
+    if if_none_match is None:
+        return False
+    candidates: List[bytes] = [tag.strip() for tag in if_none_match.split(b",")]
+    return b"*" in candidates or etag in candidates or etag[2:] in candidates
+
+
+class ETagMiddleware:
+    """ASGI middleware adding ETag / 304 handling to GET /api responses"""
+    
+    def __init__(self, app, prefix: str = "/api/"):
+        self.app = app
+        self.prefix = prefix
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or not scope["path"].startswith(self.prefix):
+            await self.app(scope, receive, send)
+            return
+        
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value
+                break
+        
+        # The start message of a 200 response is held until its body is known
+        pending = None
+        
+        async def send_with_etag(message):
+            nonlocal pending
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                pending = message
+                return
+            if pending is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+            
+            start, pending = pending, None
+            if message.get("more_body", False):
+                await send(start)
+                await send(message)
+                return
+            
+            etag = _etag_for(message.get("body", b""))
+            headers = [(name, value) for name, value in start.get("headers", []) if name != b"etag"]
+            headers.append((b"etag", etag))
+            
+            if _matches(if_none_match, etag):
+                headers = [(name, value) for name, value in headers
+                           if name not in (b"content-length", b"content-type")]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            
+            await send({**start, "headers": headers})
+            await send(message)
+        
+        await self.app(scope, receive, send_with_etag)
@@ -17,6 +17,7 @@ type Address {
     transactionCount: Int
     features: AddressFeatures
     alerts: [Alert]
+    transactions: [Transaction]
 }
 
 type AddressFeatures {
@@ -63,10 +64,11 @@ type Case {
 
 type Query {
     address(address: String!): Address
+    addressPanel(address: String!, limit: Int, alertLimit: Int): Address
     transactions(address: String!, limit: Int): [Transaction]
-    alerts(limit: Int): [Alert]
+    alerts(limit: Int, before: Int): [Alert]
     patterns(address: String!): [Pattern]
-    cases(status: String): [Case]
+    cases(status: String, limit: Int, before: Int): [Case]
     searchAddresses(query: String!): [Address]
 }
 
@@ -82,6 +84,127 @@ type Subscription {
 }
 """
 
+ADDRESS_CYPHER = """
+MATCH (a:Address {address: $address})
+OPTIONAL MATCH (a)-[t_out:TRANSACTION]->()
+OPTIONAL MATCH (a)<-[t_in:TRANSACTION]-()
+RETURN 
+    a.address as address,
+    a.risk_score as riskScore,
+    sum(t_out.value_eth) as totalOutEth,
+    sum(t_in.value_eth) as totalInEth,
+    count(t_out) + count(t_in) as transactionCount,
+    a.pagerank as pagerank,
+    a.degree as degree,
+    a.inDegree as inDegree,
+    a.outDegree as outDegree,
+    a.louvain as louvain,
+    a.triangles as triangles
+"""
+
+TRANSACTIONS_CYPHER = """
+MATCH (a:Address {address: $address})-[t:TRANSACTION]-()
+RETURN 
+    t.hash as hash,
+    t.from as from_addr,
+    t.to as to_addr,
+    t.value_eth as valueEth,
+    t.timestamp as timestamp,
+    t.block_number as blockNumber
+ORDER BY t.timestamp DESC
+LIMIT $limit
+"""
+
+# Address + transactions + alerts in one round-trip (dashboard panel)
+ADDRESS_PANEL_CYPHER = """
+MATCH (a:Address {address: $address})
+CALL {
+    WITH a
+    OPTIONAL MATCH (a)-[t_out:TRANSACTION]->()
+    RETURN sum(t_out.value_eth) AS totalOutEth, count(t_out) AS outCount
+}
+CALL {
+    WITH a
+    OPTIONAL MATCH (a)<-[t_in:TRANSACTION]-()
+    RETURN sum(t_in.value_eth) AS totalInEth, count(t_in) AS inCount
+}
+CALL {
+    WITH a
+    OPTIONAL MATCH (a)-[t:TRANSACTION]-()
+    WITH t
+    ORDER BY t.timestamp DESC
+    LIMIT $limit
+    RETURN collect(t {
+        .hash,
+        from_addr: t.from,
+        to_addr: t.to,
+        valueEth: t.value_eth,
+        .timestamp,
+        blockNumber: t.block_number
+    }) AS transactions
+}
+CALL {
+    WITH a
+    OPTIONAL MATCH (a)<-[:FOR]-(al:Alert)
+    WITH al
+    ORDER BY al.created_at DESC
+    LIMIT $alert_limit
+    RETURN collect(al {.id, .type, .score, .created_at}) AS alerts
+}
+RETURN
+    a.address as address,
+    a.risk_score as riskScore,
+    totalOutEth,
+    totalInEth,
+    outCount + inCount as transactionCount,
+    a.pagerank as pagerank,
+    a.degree as degree,
+    a.inDegree as inDegree,
+    a.outDegree as outDegree,
+    a.louvain as louvain,
+    a.triangles as triangles,
+    transactions,
+    alerts
+"""
+
+# Keyset pagination: clients pass the last seen createdAt as `before`.
+# Without a cursor the sentinel below keeps the same (index-backed) query.
+CURSOR_MAX = 2 ** 62
+
+ALERTS_CYPHER = """
+MATCH (alert:Alert)
+WHERE alert.created_at < $before
+RETURN alert
+ORDER BY alert.created_at DESC
+LIMIT $limit
+"""
+
+CASES_CYPHER = """
+MATCH (c:Case)
+WHERE c.created_at < $before
+RETURN c
+ORDER BY c.created_at DESC
+LIMIT $limit
+"""
+
+CASES_WITH_STATUS_CYPHER = """
+MATCH (c:Case)
+WHERE c.status = $status AND c.created_at < $before
+RETURN c
+ORDER BY c.created_at DESC
+LIMIT $limit
+"""
+
+# Hot resolver queries, planned at startup with dummy parameters
+_WARMUP_QUERIES = [
+    (ADDRESS_CYPHER, {"address": ""}),
+    (TRANSACTIONS_CYPHER, {"address": "", "limit": 1}),
+    (ADDRESS_PANEL_CYPHER, {"address": "", "limit": 1, "alert_limit": 1}),
+    (ALERTS_CYPHER, {"before": CURSOR_MAX, "limit": 1}),
+    (CASES_CYPHER, {"before": CURSOR_MAX, "limit": 1}),
+    (CASES_WITH_STATUS_CYPHER, {"status": "", "before": CURSOR_MAX, "limit": 1}),
+]
+
 
 class GraphQLResolver:
     """GraphQL query and mutation resolvers"""
@@ -89,147 +212,128 @@ class GraphQLResolver:
     def __init__(self, neo4j_driver):
         self.driver = neo4j_driver
     
+    def warm_up(self) -> int:
+        """Prime Neo4j's plan cache for the resolver queries (EXPLAIN only)"""
+        from .core import warm_up_queries
+        return warm_up_queries(_WARMUP_QUERIES)
+    
     def resolve_address(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve address query"""
         address = args.get("address")
         
-        query = """
-        MATCH (a:Address {address: $address})
-        OPTIONAL MATCH (a)-[t_out:TRANSACTION]->()
-        OPTIONAL MATCH (a)<-[t_in:TRANSACTION]-()
-        RETURN 
-            a.address as address,
-            a.risk_score as riskScore,
-            sum(t_out.value_eth) as totalOutEth,
-            sum(t_in.value_eth) as totalInEth,
-            count(t_out) + count(t_in) as transactionCount,
-            a.pagerank as pagerank,
-            a.degree as degree,
-            a.inDegree as inDegree,
-            a.outDegree as outDegree,
-            a.louvain as louvain,
-            a.triangles as triangles
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, address=address)
+            result = session.run(ADDRESS_CYPHER, address=address)
             record = result.single()
             
             if not record:
                 return None
             
-            return {
-                "address": record["address"],
-                "riskScore": float(record["riskScore"] or 0),
-                "totalInEth": float(record["totalInEth"] or 0),
-                "totalOutEth": float(record["totalOutEth"] or 0),
-                "transactionCount": record["transactionCount"] or 0,
-                "features": {
-                    "pagerank": float(record["pagerank"] or 0),
-                    "degree": int(record["degree"] or 0),
-                    "inDegree": int(record["inDegree"] or 0),
-                    "outDegree": int(record["outDegree"] or 0),
-                    "louvain": int(record["louvain"] or 0),
-                    "triangles": int(record["triangles"] or 0)
+            return self._address_from_record(record)
+    
+    def resolve_address_panel(self, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Resolve address, its latest transactions and alerts in a single query"""
+        address = args.get("address")
+        limit = args.get("limit", 50)
+        alert_limit = args.get("alertLimit", 50)
+        
+        with self.driver.session() as session:
+            record = session.run(ADDRESS_PANEL_CYPHER, address=address, limit=limit,
+                                 alert_limit=alert_limit).single()
+            
+            if not record:
+                return None
+            
+            panel = self._address_from_record(record)
+            panel["transactions"] = [self._transaction_from_record(t) for t in record["transactions"]]
+            panel["alerts"] = [
+                {
+                    "id": alert.get("id"),
+                    "address": address,
+                    "type": alert.get("type"),
+                    "score": float(alert.get("score") or 0),
+                    "createdAt": alert.get("created_at")
                 }
+                for alert in record["alerts"]
+            ]
+            return panel
+    
+    @staticmethod
+    def _address_from_record(record) -> Dict[str, Any]:
+        return {
+            "address": record["address"],
+            "riskScore": float(record["riskScore"] or 0),
+            "totalInEth": float(record["totalInEth"] or 0),
+            "totalOutEth": float(record["totalOutEth"] or 0),
+            "transactionCount": record["transactionCount"] or 0,
+            "features": {
+                "pagerank": float(record["pagerank"] or 0),
+                "degree": int(record["degree"] or 0),
+                "inDegree": int(record["inDegree"] or 0),
+                "outDegree": int(record["outDegree"] or 0),
+                "louvain": int(record["louvain"] or 0),
+                "triangles": int(record["triangles"] or 0)
             }
+        }
+    
+    @staticmethod
+    def _transaction_from_record(record) -> Dict[str, Any]:
+        return {
+            "hash": record["hash"],
+            "from": record["from_addr"],
+            "to": record["to_addr"],
+            "valueEth": float(record["valueEth"] or 0),
+            "timestamp": record["timestamp"],
+            "blockNumber": record["blockNumber"]
+        }
     
     def resolve_transactions(self, args: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Resolve transactions query"""
         address = args.get("address")
         limit = args.get("limit", 50)
         
-        query = """
-        MATCH (a:Address {address: $address})-[t:TRANSACTION]-(other)
-        RETURN 
-            t.hash as hash,
-            CASE WHEN startNode(t).address = $address THEN $address ELSE other.address END as from_addr,
-            CASE WHEN endNode(t).address = $address THEN $address ELSE other.address END as to_addr,
-            t.value_eth as valueEth,
-            t.timestamp as timestamp,
-            t.block_number as blockNumber
-        ORDER BY t.timestamp DESC
-        LIMIT $limit
-        """
-        
         with self.driver.session() as session:
-            result = session.run(query, address=address, limit=limit)
-            records = list(result)
-            
-            transactions = []
-            for record in records:
-                transactions.append({
-                    "hash": record["hash"],
-                    "from": record["from_addr"],
-                    "to": record["to_addr"],
-                    "valueEth": float(record["valueEth"] or 0),
-                    "timestamp": record["timestamp"],
-                    "blockNumber": record["blockNumber"]
-                })
-            
-            return transactions
+            result = session.run(TRANSACTIONS_CYPHER, address=address, limit=limit)
+            return [self._transaction_from_record(record) for record in result]
     
     def resolve_alerts(self, args: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Resolve alerts query"""
         limit = args.get("limit", 50)
-        
-        query = """
-        MATCH (alert:Alert)
-        RETURN alert
-        ORDER BY alert.created_at DESC
-        LIMIT $limit
-        """
+        before = args.get("before") or CURSOR_MAX
         
         with self.driver.session() as session:
-            result = session.run(query, limit=limit)
-            records = list(result)
-            
-            alerts = []
-            for record in records:
-                alert = dict(record["alert"])
-                alerts.append({
+            result = session.run(ALERTS_CYPHER, limit=limit, before=before)
+            return [
+                {
                     "id": alert.get("id"),
                     "address": alert.get("address"),
                     "type": alert.get("type"),
                     "score": float(alert.get("score", 0)),
                     "createdAt": alert.get("created_at")
-                })
-            
-            return alerts
+                }
+                for alert in (record["alert"] for record in result)
+            ]
     
     def resolve_cases(self, args: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Resolve cases query"""
         status = args.get("status")
+        limit = args.get("limit", 50)
+        before = args.get("before") or CURSOR_MAX
         
-        where_clause = "WHERE c.status = $status" if status else ""
-        
-        query = f"""
-        MATCH (c:Case)
-        {where_clause}
-        RETURN c
-        ORDER BY c.created_at DESC
-        LIMIT 50
-        """
-        
-        params = {"status": status} if status else {}
+        query = CASES_WITH_STATUS_CYPHER if status else CASES_CYPHER
         
         with self.driver.session() as session:
-            result = session.run(query, **params)
-            records = list(result)
-            
-            cases = []
-            for record in records:
-                case = dict(record["c"])
-                cases.append({
+            result = session.run(query, status=status, limit=limit, before=before)
+            return [
+                {
                     "caseId": case.get("case_id"),
                     "title": case.get("title"),
                     "status": case.get("status"),
                     "priority": case.get("priority"),
                     "assignedTo": case.get("assigned_to"),
                     "createdAt": case.get("created_at")
-                })
-            
-            return cases
+                }
+                for case in (record["c"] for record in result)
+            ]
     
     def mutation_create_alert(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Create alert mutation"""
@@ -245,4 +349,3 @@ class GraphQLResolver:
     def get_schema(self) -> str:
         """Return GraphQL schema"""
         return GRAPHQL_SCHEMA
-
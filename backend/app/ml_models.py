@@ -1,6 +1,7 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from neo4j import Driver
 import math
+import numpy as np
 
 # Opcional: uso do client Python da GDS
 # from graphdatascience import GraphDataScience
@@ -36,26 +37,24 @@ def run_gds_feature_engineering(driver: Driver) -> Dict[str, Any]:
             )
         )
 
-        # PageRank
+        # Algoritmos em modo mutate (só no grafo em memória); a escrita no
+        # store acontece uma única vez por projeção via writeNodeProperties.
+        for cypher in (
+            "CALL gds.pageRank.mutate('amlGraph', {mutateProperty: 'pagerank'})",
+            "CALL gds.degree.mutate('amlGraph', {mutateProperty: 'degree'})",
+            "CALL gds.louvain.mutate('amlGraph', {mutateProperty: 'louvain'})",
+            "CALL gds.triangleCount.mutate('amlGraph', {mutateProperty: 'triangles'})",
+        ):
+            session.execute_write(lambda tx: tx.run(cypher))
         session.execute_write(
             lambda tx: tx.run(
                 """
-                CALL gds.pageRank.write('amlGraph', {writeProperty: 'pagerank'})
-                YIELD nodePropertiesWritten
+                CALL gds.graph.nodeProperties.write('amlGraph', ['pagerank', 'degree', 'louvain', 'triangles'])
                 """
             )
         )
         results["pagerank"] = True
 
-        # Degree
-        session.execute_write(
-            lambda tx: tx.run(
-                """
-                CALL gds.degree.write('amlGraph', {writeProperty: 'degree'})
-                YIELD nodePropertiesWritten
-                """
-            )
-        )
         # In/Out degree com grafo direcionado
         session.execute_write(
             lambda tx: tx.run(
@@ -75,35 +74,15 @@ def run_gds_feature_engineering(driver: Driver) -> Dict[str, Any]:
                 """
             )
         )
+        for cypher in (
+            "CALL gds.degree.mutate('amlGraphDir', { relationshipTypes: ['TRANSFER'], orientation: 'REVERSE', mutateProperty: 'inDegree' })",
+            "CALL gds.degree.mutate('amlGraphDir', { relationshipTypes: ['TRANSFER'], orientation: 'NATURAL', mutateProperty: 'outDegree' })",
+        ):
+            session.execute_write(lambda tx: tx.run(cypher))
         session.execute_write(
             lambda tx: tx.run(
                 """
-                CALL gds.degree.write('amlGraphDir', { relationshipTypes: ['TRANSFER'], orientation: 'REVERSE', writeProperty: 'inDegree' })
-                """
-            )
-        )
-        session.execute_write(
-            lambda tx: tx.run(
-                """
-                CALL gds.degree.write('amlGraphDir', { relationshipTypes: ['TRANSFER'], orientation: 'NATURAL', writeProperty: 'outDegree' })
-                """
-            )
-        )
-
-        # Louvain
-        session.execute_write(
-            lambda tx: tx.run(
-                """
-                CALL gds.louvain.write('amlGraph', {writeProperty: 'louvain'})
-                """
-            )
-        )
-
-        # Triangle Count
-        session.execute_write(
-            lambda tx: tx.run(
-                """
-                CALL gds.triangleCount.write('amlGraph', {writeProperty: 'triangles'})
+                CALL gds.graph.nodeProperties.write('amlGraphDir', ['inDegree', 'outDegree'])
                 """
             )
         )
@@ -139,6 +118,27 @@ except Exception:
 
 
 # ---- Scoring baseado em features GDS ----------------------------------------
+# Projeção das features a partir de `a`, compartilhada pela consulta unitária e pela em lote
+_RISK_FEATURES_PROJECTION = """
+OPTIONAL MATCH (a)<-[:FOR]-(al:Alert)
+WITH a, count(al) AS alerts
+RETURN a.address AS address,
+       coalesce(a.pagerank, 0.0) AS pr,
+       coalesce(a.degree, 0.0) AS degree,
+       coalesce(a.inDegree, 0.0) AS indeg,
+       coalesce(a.outDegree, 0.0) AS outdeg,
+       coalesce(a.triangles, 0.0) AS triangles,
+       alerts AS alerts
+"""
+
+RISK_FEATURES_CYPHER = """
+MATCH (a:Address {address: $address})""" + _RISK_FEATURES_PROJECTION
+
+RISK_FEATURES_BATCH_CYPHER = """
+UNWIND $addresses AS address
+MATCH (a:Address {address: address})""" + _RISK_FEATURES_PROJECTION
+
+
 def _normalize(x: float, lo: float, hi: float) -> float:
     if hi <= lo:
         return 0.0
@@ -146,30 +146,8 @@ def _normalize(x: float, lo: float, hi: float) -> float:
     return (x - lo) / (hi - lo)
 
 
-def get_address_risk_score(driver: Driver, address: str) -> float:
-    """
-    Combina features GDS + alertas para um score 0–100.
-    Heurística determinística:
-      - PageRank (0..0.01+), Degree/In/Out, Triangles (saturação em p95 aproximado),
-      - Bônus por alertas (máx 40)
-    """
-    cypher = """
-    MATCH (a:Address {address: $address})
-    OPTIONAL MATCH (a)<-[:FOR]-(al:Alert)
-    WITH a, count(al) AS alerts
-    RETURN coalesce(a.pagerank, 0.0) AS pr,
-           coalesce(a.degree, 0.0) AS degree,
-           coalesce(a.inDegree, 0.0) AS indeg,
-           coalesce(a.outDegree, 0.0) AS outdeg,
-           coalesce(a.triangles, 0.0) AS triangles,
-           alerts AS alerts
-    """
-    with driver.session() as session:
-        rec = session.execute_read(lambda tx: tx.run(cypher, address=address).single())
-
-    if not rec:
-        return 0.0
-
+def _score_from_features(rec) -> float:
+    """Aplica a heurística ponderada sobre o registro de features de um Address."""
     pr = float(rec["pr"])
     degree = float(rec["degree"])
     indeg = float(rec["indeg"])
@@ -189,15 +167,69 @@ def get_address_risk_score(driver: Driver, address: str) -> float:
     alerts_bonus = min(40, alerts * 10)
 
     score = base + alerts_bonus
-    score = max(0.0, min(100.0, score))
+    return max(0.0, min(100.0, score))
 
-    # Persistir no nó Address
+
+def get_address_risk_score(driver: Driver, address: str) -> float:
+    """
+    Combina features GDS + alertas para um score 0–100.
+    Heurística determinística:
+      - PageRank (0..0.01+), Degree/In/Out, Triangles (saturação em p95 aproximado),
+      - Bônus por alertas (máx 40)
+    """
     with driver.session() as session:
+        rec = session.execute_read(lambda tx: tx.run(RISK_FEATURES_CYPHER, address=address).single())
+        if not rec:
+            return 0.0
+
+        score = _score_from_features(rec)
+
+        # Persistir no nó Address (mesma sessão: uma única conexão do pool)
         session.execute_write(
             lambda tx: tx.run(
-                "MATCH (a:Address {address: $address}) SET a.risk_score = $score RETURN a",
+                "MATCH (a:Address {address: $address}) SET a.risk_score = $score",
                 address=address,
                 score=score,
             )
         )
     return score
+
+
+# Colunas de features lidas em lote, e pesos / faixas de saturação na mesma ordem
+_FEATURE_COLUMNS = ("pr", "degree", "triangles", "indeg", "outdeg")
+_FEATURE_WEIGHTS = np.array([30.0, 15.0, 15.0, 10.0, 10.0])
+_FEATURE_HI = np.array([0.01, 100.0, 50.0, 60.0, 60.0])
+
+
+def get_address_risk_scores(driver: Driver, addresses: List[str]) -> Dict[str, float]:
+    """
+    Versão em lote de get_address_risk_score: uma leitura UNWIND, score
+    vetorizado (matriz N×5 @ pesos) e uma escrita UNWIND de risk_score.
+    """
+    with driver.session() as session:
+        records = session.execute_read(
+            lambda tx: tx.run(RISK_FEATURES_BATCH_CYPHER, addresses=addresses).values(
+                "address", *_FEATURE_COLUMNS, "alerts"
+            )
+        )
+        if not records:
+            return {}
+
+        found = [r[0] for r in records]
+        data = np.array([r[1:] for r in records], dtype=np.float64)
+        features = np.clip(data[:, :5], 0.0, _FEATURE_HI) / _FEATURE_HI
+        alerts_bonus = np.minimum(40.0, data[:, 5] * 10.0)
+        scores = np.clip(features @ _FEATURE_WEIGHTS + alerts_bonus, 0.0, 100.0)
+
+        rows = [{"address": a, "score": float(sc)} for a, sc in zip(found, scores)]
+        session.execute_write(
+            lambda tx: tx.run(
+                """
+                UNWIND $rows AS row
+                MATCH (a:Address {address: row.address})
+                SET a.risk_score = row.score
+                """,
+                rows=rows,
+            )
+        )
+    return {row["address"]: row["score"] for row in rows}
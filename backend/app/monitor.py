@@ -2,16 +2,102 @@
 Real-time Blockchain Monitor - Large Transaction Detection
 Monitors recent blockchain activity for high-value transactions and auto-analyzes them.
 """
-import time
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional
+import math
+import os
+from typing import List, Dict, Iterator, Optional
 from datetime import datetime, timedelta
-from .core import EtherscanClient, driver, ingest_address
+from .core import EtherscanClient, driver, ingest_addresses, warm_up_queries
 from .aml_analytics import run_all_analytics
-from .ml_models import get_address_risk_score, run_gds_feature_engineering
+from .ml_models import get_address_risk_score, run_gds_feature_engineering, RISK_FEATURES_CYPHER
+from .enrichment import enricher
 
 logger = logging.getLogger("aml.monitor")
 
+CURRENT_BLOCK_CYPHER = "MATCH (m:Meta {id: 'monitor'}) RETURN m.last_block AS block"
+SEED_CURRENT_BLOCK_CYPHER = """
+MATCH (t:Transaction) WHERE t.block IS NOT NULL
+WITH t.block AS block ORDER BY block DESC LIMIT 1
+MERGE (m:Meta {id: 'monitor'})
+  SET m.last_block = block
+RETURN m.last_block AS block
+"""
+
+# Query existing transactions in DB
+FIND_LARGE_TRANSACTIONS_CYPHER = """
+MATCH (t:Transaction)
+WHERE t.block >= $start_block AND t.block <= $end_block
+  AND t.value >= $min_value
+MATCH (from:Address)-[:EMITTED]->(t)-[:RECEIVED_BY]->(to:Address)
+RETURN DISTINCT
+  t.hash AS hash,
+  from.address AS from_address,
+  to.address AS to_address,
+  t.value AS value_eth,
+  t.value * $eth_price AS value_usd,
+  t.time AS timestamp,
+  t.block AS block
+ORDER BY t.value DESC
+LIMIT $limit
+"""
+
+_WARMUP_QUERIES = [
+    (CURRENT_BLOCK_CYPHER, {}),
+    (FIND_LARGE_TRANSACTIONS_CYPHER, {"start_block": 0, "end_block": 0, "min_value": 0.0, "eth_price": 0.0, "limit": 1}),
+    (RISK_FEATURES_CYPHER, {"address": ""}),
+]
+
+MONITOR_BLOOM_PATH = os.getenv("MONITOR_BLOOM_PATH", "monitored.bloom")
+
+
+class AddressBloomFilter:
+    """
+    Compact Bloom filter of already-ingested addresses, persisted to disk so
+    known addresses survive restarts without a Neo4j round-trip.
+    False positives (rate ~error_rate) only skip a re-ingest; never a miss.
+    """
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001, path: Optional[str] = None):
+        self.num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.path = path
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        if path and os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                if len(data) == len(self.bits):
+                    self.bits = bytearray(data)
+            except OSError as e:
+                logger.warning(f"Could not load bloom filter from {path}: {e}")
+    
+    def _positions(self, address: str) -> Iterator[int]:
+        digest = hashlib.blake2b(address.lower().encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def __contains__(self, address: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(address))
+    
+    def add(self, address: str):
+        for p in self._positions(address):
+            self.bits[p >> 3] |= 1 << (p & 7)
+    
+    def save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(self.bits)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist bloom filter to {self.path}: {e}")
+
 
 class BlockchainMonitor:
     """
@@ -21,14 +107,15 @@ class BlockchainMonitor:
     def __init__(
         self,
         min_value_usd: float = 100000.0,
-        eth_price_usd: float = 2000.0,  # Approximate, should fetch from API
+        eth_price_usd: Optional[float] = None,  # None = live price (5 min cache)
         check_interval_seconds: int = 3600,
         auto_analyze: bool = True,
         max_transactions_per_check: int = 100
     ):
         self.min_value_usd = min_value_usd
-        self.eth_price_usd = eth_price_usd
-        self.min_value_eth = min_value_usd / eth_price_usd
+        self.fixed_eth_price = eth_price_usd is not None
+        self.eth_price_usd = eth_price_usd or 2000.0
+        self.min_value_eth = min_value_usd / self.eth_price_usd
         self.check_interval_seconds = check_interval_seconds
         self.auto_analyze = auto_analyze
         self.max_transactions_per_check = max_transactions_per_check
@@ -38,6 +125,7 @@ class BlockchainMonitor:
         self.client = EtherscanClient(chain_id=ETHERSCAN_CHAIN_ID)
         self.last_check_block = None
         self.monitored_addresses: set = set()
+        self.ingested_bloom = AddressBloomFilter(path=MONITOR_BLOOM_PATH)
         self.stats = {
             "checks_completed": 0,
             "large_transactions_found": 0,
@@ -48,7 +136,23 @@ class BlockchainMonitor:
     
     def start_monitoring(self, duration_hours: Optional[int] = None):
         """
-        Start continuous monitoring.
+        Start continuous monitoring (blocking wrapper around start_monitoring_async).
+        
+        Args:
+            duration_hours: How long to monitor (None = indefinite)
+        """
+        try:
+            return asyncio.run(self.start_monitoring_async(duration_hours))
+        except KeyboardInterrupt:
+            logger.info("Monitor stopped by user")
+            return self.get_stats()
+    
+    async def start_monitoring_async(self, duration_hours: Optional[int] = None):
+        """
+        Start continuous monitoring on the running event loop.
+        
+        Each check runs in a worker thread (blocking Neo4j/Etherscan I/O) and the
+        interval is an asyncio sleep, so several monitors can share one loop.
         
         Args:
             duration_hours: How long to monitor (None = indefinite)
@@ -66,16 +170,17 @@ class BlockchainMonitor:
                 break
             
             try:
-                self._check_recent_activity()
+                await asyncio.to_thread(self._check_recent_activity)
                 self.stats["checks_completed"] += 1
                 logger.info(f"Check #{self.stats['checks_completed']} complete. Sleeping {self.check_interval_seconds}s")
-                time.sleep(self.check_interval_seconds)
-            except KeyboardInterrupt:
-                logger.info("Monitor stopped by user")
-                break
+                await asyncio.sleep(self.check_interval_seconds)
+            except asyncio.CancelledError:
+                # Re-raised so whoever cancelled the task sees the cancellation
+                logger.info("Monitor task cancelled")
+                raise
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(60)  # Wait a bit before retrying
+                await asyncio.sleep(60)  # Wait a bit before retrying
         
         return self.get_stats()
     
@@ -106,6 +211,7 @@ class BlockchainMonitor:
             List of large transaction details
         """
         large_txs = []
+        self._refresh_eth_price()
         
         # Get recent block number
         current_block = self._get_current_block()
@@ -132,20 +238,37 @@ class BlockchainMonitor:
         # Auto-analyze involved addresses
         if self.auto_analyze and large_txs:
             logger.info(f"Auto-analyzing {len(large_txs)} large transactions")
+            self._ingest_new_addresses(large_txs)
             for tx in large_txs:
                 self._analyze_transaction_addresses(tx)
         
         return large_txs
     
+    def _refresh_eth_price(self):
+        """Refresh ETH/USD (TTL-cached by the enricher) and the ETH threshold derived from it."""
+        if self.fixed_eth_price:
+            return
+        try:
+            price = float(enricher.get_eth_price())
+        except Exception as e:
+            logger.warning(f"Could not refresh ETH price: {e}")
+            return
+        if price > 0:
+            self.eth_price_usd = price
+            self.min_value_eth = self.min_value_usd / price
+    
     def _get_current_block(self) -> Optional[int]:
         """Get current block number from blockchain."""
         try:
-            # Use a recent transaction to get block number
+            # Highest ingested block is kept on the (:Meta {id:'monitor'}) singleton
+            # by the ingest functions; fall back to the tx_block_idx range index and seed it.
             # In production, use web3 or dedicated API
-            cypher = "MATCH (t:Transaction) RETURN t.block AS block ORDER BY t.block DESC LIMIT 1"
             with driver.session() as session:
-                result = session.execute_read(lambda tx: tx.run(cypher).single())
-                if result:
+                result = session.execute_read(lambda tx: tx.run(CURRENT_BLOCK_CYPHER).single())
+                if result and result["block"] is not None:
+                    return int(result["block"])
+                result = session.execute_write(lambda tx: tx.run(SEED_CURRENT_BLOCK_CYPHER).single())
+                if result and result["block"] is not None:
                     return int(result["block"])
         except Exception as e:
             logger.warning(f"Could not get current block from DB: {e}")
@@ -164,48 +287,56 @@ class BlockchainMonitor:
         
         For now, we'll scan known addresses in our DB.
         """
-        # Query existing transactions in DB
-        cypher = """
-        MATCH (t:Transaction)
-        WHERE t.block >= $start_block AND t.block <= $end_block
-          AND t.value >= $min_value
-        MATCH (from:Address)-[:EMITTED]->(t)-[:RECEIVED_BY]->(to:Address)
-        RETURN DISTINCT
-          t.hash AS hash,
-          from.address AS from_address,
-          to.address AS to_address,
-          t.value AS value_eth,
-          t.time AS timestamp,
-          t.block AS block
-        ORDER BY t.value DESC
-        LIMIT $limit
-        """
-        
         with driver.session() as session:
-            records = session.execute_read(
-                lambda tx: list(tx.run(
-                    cypher,
-                    start_block=start_block,
-                    end_block=end_block,
-                    min_value=self.min_value_eth,
-                    limit=self.max_transactions_per_check
-                ))
+            large_txs = session.execute_read(
+                lambda tx: list(self._iter_large_transactions(tx, start_block, end_block))
             )
         
-        large_txs = []
-        for rec in records:
-            large_txs.append({
+        logger.info(f"Found {len(large_txs)} large transactions in block range")
+        return large_txs
+    
+    def _iter_large_transactions(self, tx, start_block: int, end_block: int) -> Iterator[Dict]:
+        """Yield large transactions straight off the driver result, one record at a time."""
+        result = tx.run(
+            FIND_LARGE_TRANSACTIONS_CYPHER,
+            start_block=start_block,
+            end_block=end_block,
+            min_value=self.min_value_eth,
+            eth_price=self.eth_price_usd,
+            limit=self.max_transactions_per_check
+        )
+        for rec in result:
+            yield {
                 "hash": rec["hash"],
                 "from": rec["from_address"],
                 "to": rec["to_address"],
                 "value_eth": float(rec["value_eth"]),
-                "value_usd": float(rec["value_eth"]) * self.eth_price_usd,
+                "value_usd": rec["value_usd"],
                 "timestamp": rec["timestamp"],
                 "block": rec["block"]
-            })
+            }
+    
+    def _ingest_new_addresses(self, large_txs: List[Dict]):
+        """Ingest every not-yet-analyzed address of this cycle in one batched write."""
+        pending = list(dict.fromkeys(
+            address
+            for tx in large_txs
+            for address in (tx["from"], tx["to"])
+            if address not in self.monitored_addresses and address not in self.ingested_bloom
+        ))
+        if not pending:
+            return
+        try:
+            result = ingest_addresses(pending, limit=500)
+        except Exception as e:
+            logger.error(f"Batch ingest failed for {len(pending)} addresses: {e}")
+            return
         
-        logger.info(f"Found {len(large_txs)} large transactions in block range")
-        return large_txs
+        failed = set(result.get("failed", []))
+        for address in pending:
+            if address not in failed:
+                self.ingested_bloom.add(address)
+        self.ingested_bloom.save()
     
     def _analyze_transaction_addresses(self, tx: Dict):
         """Analyze both sender and receiver of a large transaction."""
@@ -216,9 +347,6 @@ class BlockchainMonitor:
             try:
                 logger.info(f"Auto-analyzing address {address} (large tx: ${tx['value_usd']:,.0f})")
                 
-                # Ingest if not already in DB
-                ingest_address(address, limit=500)
-                
                 # Run analytics
                 with driver.session() as session:
                     analytics = session.execute_write(lambda tx_db: run_all_analytics(tx_db, address))
@@ -238,10 +366,7 @@ class BlockchainMonitor:
     
     def _calculate_quick_risk(self, analytics: Dict) -> float:
         """Quick risk calculation without full GDS."""
-        score = 0.0
-        for alert_list in analytics.values():
-            score += len(alert_list) * 10
-        return min(100, score)
+        return min(100.0, 10.0 * sum(map(len, analytics.values())))
     
     def get_stats(self) -> Dict:
         """Get monitoring statistics."""
@@ -279,3 +404,7 @@ def start_monitor(
     else:
         return monitor.check_once()
 
+
+def warm_up() -> int:
+    """Prime Neo4j's plan cache for the monitor's hot queries (EXPLAIN only)."""
+    return warm_up_queries(_WARMUP_QUERIES)
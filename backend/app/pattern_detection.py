@@ -10,9 +10,204 @@ Detects suspicious patterns in blockchain transactions including:
 - Wash trading
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime, timedelta
-import statistics
+import heapq
+
+import numpy as np
+
+from .scoring_kernels import score_layering, count_round_amounts, is_strictly_decreasing, score_time
+
+# Sorted table of "round" ETH amounts used by detect_round_amounts
+_ROUND_NUMBERS = np.array([1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 500.0, 1000.0], dtype=np.float64)
+
+# Records pulled per Bolt round-trip; bounds client buffering on large results
+FETCH_SIZE = 1000
+
+# Caps on server-side collect() so hub addresses cannot blow up a single row
+BUNDLE_MAX_TXS = 10000  # most recent outgoing transactions kept in the bundle
+SAMPLE_SIZE = 20  # example amounts / trades returned by dust and wash trading
+
+# Detector queries live at module level so the query text (and Neo4j plan cache key) is stable
+LAYERING_QUERY = """
+MATCH path = (start:Address {address: $address})-[first:TRANSACTION]->(:Address)-[:TRANSACTION*2..4]->(end:Address)
+WHERE start <> end
+AND all(rel in relationships(path)[1..] WHERE rel.timestamp >= first.timestamp
+        AND rel.timestamp - first.timestamp < $time_window)
+WITH path, length(path) as depth,
+     [rel in relationships(path) | rel.timestamp] as timestamps,
+     [rel in relationships(path) | rel.value_eth] as values
+RETURN
+    depth,
+    [n in nodes(path) | n.address] as chain,
+    timestamps,
+    values,
+    reduce(total = 0.0, val in values | total + val) as total_value
+ORDER BY depth DESC
+LIMIT 50
+"""
+
+# Most recent outgoing transactions of an address as parallel lists ordered by
+# timestamp (shared by the peel chain, round amount and time pattern detectors)
+TX_BUNDLE_QUERY = """
+MATCH (a:Address {address: $address})-[t:TRANSACTION]->(next:Address)
+WITH t, next
+ORDER BY coalesce(t.timestamp, 0) DESC
+LIMIT $max_txs
+WITH t, next
+ORDER BY t.timestamp
+WITH collect(t) as txs, collect(next.address) as counterparties
+RETURN
+    [t in txs | t.timestamp] as timestamps,
+    [t in txs | t.value_eth] as values,
+    counterparties
+"""
+
+DUST_ATTACK_QUERY = """
+MATCH (a:Address {address: $address})
+CALL {
+    WITH a
+    MATCH (a)<-[t:TRANSACTION]-(sender:Address)
+    WHERE t.value_eth < $dust_threshold AND t.value_eth > 0
+    RETURN count(t) as dust_tx_count, count(DISTINCT sender) as unique_dust_senders
+}
+CALL {
+    WITH a
+    MATCH (a)<-[t:TRANSACTION]-(:Address)
+    WHERE t.value_eth < $dust_threshold AND t.value_eth > 0
+    WITH t
+    LIMIT $sample_size
+    RETURN collect(t.value_eth) as dust_amounts
+}
+RETURN dust_tx_count, unique_dust_senders, dust_amounts
+"""
+
+# Outgoing transfers are grouped per counterparty first, so the return edges
+# of each counterparty are expanded once instead of once per outgoing transfer.
+# Matches are counted in full but only $sample_size of them are collected.
+WASH_TRADING_QUERY = """
+MATCH (a:Address {address: $address})
+CALL {
+    WITH a
+    MATCH (a)-[t1:TRANSACTION]->(b:Address)
+    WITH a, b, collect({value: t1.value_eth, timestamp: t1.timestamp}) as outs
+    MATCH (b)-[t2:TRANSACTION]->(a)
+    UNWIND outs as out
+    WITH out, t2
+    WHERE out.timestamp < t2.timestamp
+    AND abs(out.value - t2.value_eth) < 0.01
+    RETURN count(*) as wash_count
+}
+CALL {
+    WITH a
+    MATCH (a)-[t1:TRANSACTION]->(b:Address)
+    WITH a, b, collect({value: t1.value_eth, timestamp: t1.timestamp}) as outs
+    MATCH (b)-[t2:TRANSACTION]->(a)
+    UNWIND outs as out
+    WITH b, out, t2
+    WHERE out.timestamp < t2.timestamp
+    AND abs(out.value - t2.value_eth) < 0.01
+    WITH b, out, t2
+    LIMIT $sample_size
+    RETURN collect({
+        counterparty: b.address,
+        value: out.value,
+        time_diff: t2.timestamp - out.timestamp
+    }) as wash_trades
+}
+RETURN wash_count, wash_trades
+"""
+
+# All six detectors in one query: each CALL subquery aggregates to exactly one row
+ALL_PATTERNS_QUERY = """
+MATCH (a:Address {address: $address})
+CALL {
+    WITH a
+    MATCH path = (a)-[first:TRANSACTION]->(:Address)-[:TRANSACTION*2..4]->(end:Address)
+    WHERE a <> end
+    AND all(rel in relationships(path)[1..] WHERE rel.timestamp >= first.timestamp
+            AND rel.timestamp - first.timestamp < $time_window)
+    WITH length(path) as depth,
+         [n in nodes(path) | n.address] as chain,
+         [rel in relationships(path) | rel.timestamp] as timestamps,
+         [rel in relationships(path) | rel.value_eth] as values
+    ORDER BY depth DESC
+    LIMIT 50
+    RETURN collect({
+        depth: depth,
+        chain: chain,
+        timestamps: timestamps,
+        values: values,
+        total_value: reduce(total = 0.0, val in values | total + val)
+    }) as layering
+}
+CALL {
+    WITH a
+    MATCH (a)-[t:TRANSACTION]->(next:Address)
+    WITH t, next
+    ORDER BY coalesce(t.timestamp, 0) DESC
+    LIMIT $max_txs
+    WITH t, next
+    ORDER BY t.timestamp
+    WITH collect(t) as txs, collect(next.address) as counterparties
+    RETURN {
+        timestamps: [t in txs | t.timestamp],
+        values: [t in txs | t.value_eth],
+        counterparties: counterparties
+    } as bundle
+}
+CALL {
+    WITH a
+    MATCH (a)<-[t:TRANSACTION]-(sender:Address)
+    WHERE t.value_eth < $dust_threshold AND t.value_eth > 0
+    RETURN count(t) as dust_tx_count, count(DISTINCT sender) as unique_dust_senders
+}
+CALL {
+    WITH a
+    MATCH (a)<-[t:TRANSACTION]-(:Address)
+    WHERE t.value_eth < $dust_threshold AND t.value_eth > 0
+    WITH t
+    LIMIT $sample_size
+    RETURN collect(t.value_eth) as dust_amounts
+}
+CALL {
+    WITH a
+    MATCH (a)-[t1:TRANSACTION]->(b:Address)
+    WITH a, b, collect({value: t1.value_eth, timestamp: t1.timestamp}) as outs
+    MATCH (b)-[t2:TRANSACTION]->(a)
+    UNWIND outs as out
+    WITH out, t2
+    WHERE out.timestamp < t2.timestamp
+    AND abs(out.value - t2.value_eth) < 0.01
+    RETURN count(*) as wash_count
+}
+CALL {
+    WITH a
+    MATCH (a)-[t1:TRANSACTION]->(b:Address)
+    WITH a, b, collect({value: t1.value_eth, timestamp: t1.timestamp}) as outs
+    MATCH (b)-[t2:TRANSACTION]->(a)
+    UNWIND outs as out
+    WITH b, out, t2
+    WHERE out.timestamp < t2.timestamp
+    AND abs(out.value - t2.value_eth) < 0.01
+    WITH b, out, t2
+    LIMIT $sample_size
+    RETURN collect({
+        counterparty: b.address,
+        value: out.value,
+        time_diff: t2.timestamp - out.timestamp
+    }) as wash_trades
+}
+RETURN
+    layering,
+    bundle,
+    {
+        dust_tx_count: dust_tx_count,
+        unique_dust_senders: unique_dust_senders,
+        dust_amounts: dust_amounts
+    } as dust,
+    {wash_count: wash_count, wash_trades: wash_trades} as wash
+"""
 
 
 class PatternDetector:
@@ -21,301 +216,90 @@ class PatternDetector:
     def __init__(self, neo4j_driver):
         self.driver = neo4j_driver
     
+    def _read(self, query: str, **params) -> List[Any]:
+        """Run a read query in one managed transaction and return its records"""
+        with self.driver.session(fetch_size=FETCH_SIZE) as session:
+            return session.execute_read(lambda tx: list(tx.run(query, **params)))
+    
+    def _stream(self, query: str, consume: Callable[[Any], Any], **params) -> Any:
+        """Run a read query and fold its records in one pass over the open cursor"""
+        with self.driver.session(fetch_size=FETCH_SIZE) as session:
+            return session.execute_read(lambda tx: consume(tx.run(query, **params)))
+    
+    def _read_single(self, query: str, **params) -> Optional[Any]:
+        records = self._read(query, **params)
+        return records[0] if records else None
+    
+    def _fetch_tx_bundle(self, address: str) -> Dict[str, Any]:
+        """Outgoing transactions of an address as parallel arrays (one query)"""
+        return self._tx_bundle(self._read_single(TX_BUNDLE_QUERY, address=address, max_txs=BUNDLE_MAX_TXS))
+    
+    @staticmethod
+    def _tx_bundle(record) -> Dict[str, Any]:
+        """
+        Convert a bundle record to arrays ordered by timestamp.
+        Missing timestamps / values become NaN so the arrays stay aligned.
+        """
+        if not record:
+            empty = np.empty(0, dtype=np.float64)
+            return {"timestamps": empty, "values": empty, "counterparties": []}
+        return {
+            "timestamps": np.array(record["timestamps"], dtype=np.float64),
+            "values": np.array(record["values"], dtype=np.float64),
+            "counterparties": record["counterparties"]
+        }
+    
     def detect_layering(self, address: str, depth: int = 5, time_window_hours: int = 24) -> Dict[str, Any]:
         """
         Detect layering patterns - multiple rapid transfers to obfuscate origin
         Layering is a key money laundering technique
         """
-        query = """
-        MATCH path = (start:Address {address: $address})-[:TRANSACTION*1..5]->(end:Address)
-        WHERE start <> end
-        WITH path, length(path) as depth, 
-             [rel in relationships(path) | rel.timestamp] as timestamps,
-             [rel in relationships(path) | rel.value_eth] as values
-        WHERE depth >= 3
-        AND (timestamps[-1] - timestamps[0]) < $time_window
-        RETURN 
-            depth,
-            [n in nodes(path) | n.address] as chain,
-            timestamps,
-            values,
-            reduce(total = 0.0, val in values | total + val) as total_value
-        ORDER BY depth DESC
-        LIMIT 50
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(
-                query, 
-                address=address, 
-                time_window=time_window_hours * 3600
-            )
-            
-            chains = []
-            for record in result:
-                chains.append({
-                    "depth": record["depth"],
-                    "chain": record["chain"],
-                    "timestamps": record["timestamps"],
-                    "values": record["values"],
-                    "total_value": record["total_value"],
-                    "time_span_hours": (record["timestamps"][-1] - record["timestamps"][0]) / 3600
-                })
-            
-            # Calculate layering score
-            score = 0
-            if chains:
-                # More chains = higher score
-                score += min(len(chains) * 10, 40)
-                # Deeper chains = higher score
-                avg_depth = statistics.mean([c["depth"] for c in chains])
-                score += min(avg_depth * 5, 30)
-                # Faster chains = higher score
-                if chains:
-                    avg_time = statistics.mean([c["time_span_hours"] for c in chains])
-                    if avg_time < 1:
-                        score += 30
-                    elif avg_time < 6:
-                        score += 20
-                    elif avg_time < 24:
-                        score += 10
-            
-            return {
-                "pattern": "layering",
-                "detected": len(chains) > 0,
-                "risk_score": min(score, 100),
-                "chains_found": len(chains),
-                "details": chains[:10]  # Return top 10
-            }
+        return self._stream(
+            LAYERING_QUERY,
+            self._layering_result,
+            address=address,
+            time_window=time_window_hours * 3600
+        )
     
     def detect_peel_chains(self, address: str, min_outputs: int = 5) -> Dict[str, Any]:
         """
         Detect peel chains - pattern where value is gradually "peeled off"
         Common in tumbling operations
         """
-        query = """
-        MATCH (a:Address {address: $address})-[t:TRANSACTION]->(next:Address)
-        WITH a, collect({to: next.address, value: t.value_eth, timestamp: t.timestamp}) as txs
-        WHERE size(txs) >= $min_outputs
-        RETURN 
-            txs,
-            reduce(total = 0.0, tx in txs | total + tx.value) as total_value,
-            size(txs) as tx_count
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(query, address=address, min_outputs=min_outputs)
-            
-            peel_chains = []
-            for record in result:
-                txs = sorted(record["txs"], key=lambda x: x["timestamp"])
-                
-                # Check if values are decreasing (peel pattern)
-                values = [tx["value"] for tx in txs]
-                is_peeling = all(values[i] > values[i+1] for i in range(len(values)-1))
-                
-                if is_peeling:
-                    peel_chains.append({
-                        "transactions": txs,
-                        "total_value": record["total_value"],
-                        "tx_count": record["tx_count"],
-                        "value_decrease_pattern": values
-                    })
-            
-            score = min(len(peel_chains) * 25, 100) if peel_chains else 0
-            
-            return {
-                "pattern": "peel_chain",
-                "detected": len(peel_chains) > 0,
-                "risk_score": score,
-                "peel_chains_found": len(peel_chains),
-                "details": peel_chains[:5]
-            }
+        return self._peel_result(self._fetch_tx_bundle(address), min_outputs)
     
     def detect_round_amounts(self, address: str, threshold: float = 0.9) -> Dict[str, Any]:
         """
         Detect suspicious round amount transactions
         Money launderers often use round numbers
         """
-        query = """
-        MATCH (a:Address {address: $address})-[t:TRANSACTION]->()
-        WHERE t.value_eth IS NOT NULL
-        WITH a, collect(t.value_eth) as values
-        RETURN values
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(query, address=address)
-            record = result.single()
-            
-            if not record:
-                return {
-                    "pattern": "round_amounts",
-                    "detected": False,
-                    "risk_score": 0,
-                    "round_count": 0
-                }
-            
-            values = record["values"]
-            if not values:
-                return {
-                    "pattern": "round_amounts",
-                    "detected": False,
-                    "risk_score": 0,
-                    "round_count": 0
-                }
-            
-            # Check for round numbers (1.0, 5.0, 10.0, 100.0, etc.)
-            round_numbers = [1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 500.0, 1000.0]
-            round_count = sum(1 for v in values if any(abs(v - r) < 0.01 for r in round_numbers))
-            
-            round_percentage = round_count / len(values) if values else 0
-            
-            score = 0
-            if round_percentage > threshold:
-                score = min(round_percentage * 100, 100)
-            
-            return {
-                "pattern": "round_amounts",
-                "detected": round_percentage > threshold,
-                "risk_score": score,
-                "round_count": round_count,
-                "total_transactions": len(values),
-                "round_percentage": round_percentage * 100
-            }
+        return self._round_result(self._fetch_tx_bundle(address), threshold)
     
     def detect_time_patterns(self, address: str) -> Dict[str, Any]:
         """
         Detect suspicious time patterns (e.g., activity at unusual hours)
         Most legitimate activity happens during business hours
         """
-        query = """
-        MATCH (a:Address {address: $address})-[t:TRANSACTION]->()
-        WHERE t.timestamp IS NOT NULL
-        RETURN collect(t.timestamp) as timestamps
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(query, address=address)
-            record = result.single()
-            
-            if not record or not record["timestamps"]:
-                return {
-                    "pattern": "time_anomaly",
-                    "detected": False,
-                    "risk_score": 0
-                }
-            
-            timestamps = record["timestamps"]
-            
-            # Convert to hours (0-23)
-            hours = [datetime.fromtimestamp(ts).hour for ts in timestamps]
-            
-            # Count transactions in suspicious hours (2am - 6am)
-            suspicious_hours = sum(1 for h in hours if 2 <= h <= 6)
-            suspicious_percentage = suspicious_hours / len(hours) if hours else 0
-            
-            # Count weekend activity
-            weekdays = [datetime.fromtimestamp(ts).weekday() for ts in timestamps]
-            weekend_count = sum(1 for d in weekdays if d >= 5)
-            weekend_percentage = weekend_count / len(weekdays) if weekdays else 0
-            
-            score = 0
-            if suspicious_percentage > 0.3:  # More than 30% at night
-                score += 50
-            if weekend_percentage > 0.5:  # More than 50% on weekends
-                score += 30
-            
-            return {
-                "pattern": "time_anomaly",
-                "detected": score > 0,
-                "risk_score": min(score, 100),
-                "suspicious_hours_percentage": suspicious_percentage * 100,
-                "weekend_percentage": weekend_percentage * 100,
-                "most_active_hours": statistics.mode(hours) if hours else None
-            }
+        return self._time_result(self._fetch_tx_bundle(address))
     
     def detect_dust_attacks(self, address: str, dust_threshold: float = 0.0001) -> Dict[str, Any]:
         """
         Detect dust attacks - tiny amounts sent to track wallet
         """
-        query = """
-        MATCH (a:Address {address: $address})<-[t:TRANSACTION]-(sender:Address)
-        WHERE t.value_eth < $dust_threshold AND t.value_eth > 0
-        RETURN 
-            count(t) as dust_tx_count,
-            collect(DISTINCT sender.address) as dust_senders,
-            collect(t.value_eth) as dust_amounts
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(query, address=address, dust_threshold=dust_threshold)
-            record = result.single()
-            
-            if not record:
-                return {
-                    "pattern": "dust_attack",
-                    "detected": False,
-                    "risk_score": 0
-                }
-            
-            dust_count = record["dust_tx_count"]
-            unique_senders = len(record["dust_senders"])
-            
-            score = 0
-            if dust_count > 10:
-                score = min(dust_count * 5, 80)
-            if unique_senders > 5:
-                score += 20
-            
-            return {
-                "pattern": "dust_attack",
-                "detected": dust_count > 5,
-                "risk_score": min(score, 100),
-                "dust_transactions": dust_count,
-                "unique_dust_senders": unique_senders,
-                "dust_amounts": record["dust_amounts"][:20]
-            }
+        record = self._read_single(
+            DUST_ATTACK_QUERY,
+            address=address,
+            dust_threshold=dust_threshold,
+            sample_size=SAMPLE_SIZE
+        )
+        return self._dust_result(record)
     
     def detect_wash_trading(self, address: str) -> Dict[str, Any]:
         """
         Detect wash trading - transactions between same entities
         """
-        query = """
-        MATCH (a:Address {address: $address})-[t1:TRANSACTION]->(b:Address)
-        MATCH (b)-[t2:TRANSACTION]->(a)
-        WHERE t1.timestamp < t2.timestamp
-        AND abs(t1.value_eth - t2.value_eth) < 0.01
-        RETURN 
-            count(*) as wash_count,
-            collect({
-                counterparty: b.address,
-                value: t1.value_eth,
-                time_diff: t2.timestamp - t1.timestamp
-            }) as wash_trades
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(query, address=address)
-            record = result.single()
-            
-            if not record:
-                return {
-                    "pattern": "wash_trading",
-                    "detected": False,
-                    "risk_score": 0
-                }
-            
-            wash_count = record["wash_count"]
-            score = min(wash_count * 15, 100) if wash_count > 0 else 0
-            
-            return {
-                "pattern": "wash_trading",
-                "detected": wash_count > 0,
-                "risk_score": score,
-                "wash_trades_count": wash_count,
-                "details": record["wash_trades"][:10]
-            }
+        record = self._read_single(WASH_TRADING_QUERY, address=address, sample_size=SAMPLE_SIZE)
+        return self._wash_result(record)
     
     def detect_all_patterns(self, address: str) -> Dict[str, Any]:
         """
@@ -327,18 +311,205 @@ class PatternDetector:
             "patterns": {}
         }
         
-        # Run all detections
-        results["patterns"]["layering"] = self.detect_layering(address)
-        results["patterns"]["peel_chains"] = self.detect_peel_chains(address)
-        results["patterns"]["round_amounts"] = self.detect_round_amounts(address)
-        results["patterns"]["time_anomaly"] = self.detect_time_patterns(address)
-        results["patterns"]["dust_attack"] = self.detect_dust_attacks(address)
-        results["patterns"]["wash_trading"] = self.detect_wash_trading(address)
+        # One round-trip: every detector's raw aggregates come back in a single record
+        record = self._read_single(
+            ALL_PATTERNS_QUERY,
+            address=address,
+            time_window=24 * 3600,
+            dust_threshold=0.0001,
+            max_txs=BUNDLE_MAX_TXS,
+            sample_size=SAMPLE_SIZE
+        )
+        
+        patterns = results["patterns"]
+        patterns["layering"] = self._layering_result(record["layering"] if record else [])
+        bundle = self._tx_bundle(record["bundle"] if record else None)
+        patterns["peel_chains"] = self._peel_result(bundle, 5)
+        patterns["round_amounts"] = self._round_result(bundle, 0.9)
+        patterns["time_anomaly"] = self._time_result(bundle)
+        patterns["dust_attack"] = self._dust_result(record["dust"] if record else None)
+        patterns["wash_trading"] = self._wash_result(record["wash"] if record else None)
         
         # Calculate overall suspicious pattern score
         pattern_scores = [p["risk_score"] for p in results["patterns"].values()]
-        results["overall_pattern_score"] = statistics.mean(pattern_scores) if pattern_scores else 0
+        results["overall_pattern_score"] = float(np.mean(pattern_scores)) if pattern_scores else 0
         results["patterns_detected"] = sum(1 for p in results["patterns"].values() if p["detected"])
         
         return results
-
+    
+    # ------------------------------------------------------------------
+    # Scoring helpers (shared by the single detectors and detect_all_patterns)
+    # ------------------------------------------------------------------
+    
+    def _layering_result(self, rows, top_k: int = 10) -> Dict[str, Any]:
+        # Single pass: running sums for the score, only the top_k deepest chains kept
+        chain_count = 0
+        depth_sum = 0.0
+        time_span_sum = 0.0
+        top = []  # min-heap of (depth, -position, time_span_hours, record)
+        for position, record in enumerate(rows):
+            timestamps = record["timestamps"]
+            time_span_hours = (timestamps[-1] - timestamps[0]) / 3600
+            chain_count += 1
+            depth_sum += record["depth"]
+            time_span_sum += time_span_hours
+            
+            item = (record["depth"], -position, time_span_hours, record)
+            if len(top) < top_k:
+                heapq.heappush(top, item)
+            elif item[:2] > top[0][:2]:
+                heapq.heapreplace(top, item)
+        
+        chains = [
+            {
+                "depth": record["depth"],
+                "chain": record["chain"],
+                "timestamps": record["timestamps"],
+                "values": record["values"],
+                "total_value": record["total_value"],
+                "time_span_hours": time_span_hours
+            }
+            for _, _, time_span_hours, record in sorted(top, key=lambda item: item[:2], reverse=True)
+        ]
+        
+        # Calculate layering score
+        score = score_layering(
+            chain_count,
+            depth_sum / chain_count if chain_count else 0.0,
+            time_span_sum / chain_count if chain_count else 0.0
+        )
+        
+        return {
+            "pattern": "layering",
+            "detected": chain_count > 0,
+            "risk_score": float(score),
+            "chains_found": chain_count,
+            "details": chains  # Return top 10
+        }
+    
+    def _peel_result(self, bundle, min_outputs: int) -> Dict[str, Any]:
+        # Outgoing values ordered by timestamp must be strictly decreasing
+        values = bundle["values"]
+        peel_chains = []
+        if len(values) >= min_outputs and is_strictly_decreasing(values):
+            txs = [
+                {"to": to, "value": float(value), "timestamp": None if np.isnan(ts) else int(ts)}
+                for to, value, ts in zip(bundle["counterparties"], values, bundle["timestamps"])
+            ]
+            peel_chains.append({
+                "transactions": txs,
+                "total_value": float(values.sum()),
+                "tx_count": len(txs),
+                "value_decrease_pattern": values.tolist()
+            })
+        
+        score = min(len(peel_chains) * 25, 100) if peel_chains else 0
+        
+        return {
+            "pattern": "peel_chain",
+            "detected": len(peel_chains) > 0,
+            "risk_score": score,
+            "peel_chains_found": len(peel_chains),
+            "details": peel_chains[:5]
+        }
+    
+    def _round_result(self, bundle, threshold: float) -> Dict[str, Any]:
+        values = bundle["values"]
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return {
+                "pattern": "round_amounts",
+                "detected": False,
+                "risk_score": 0,
+                "round_count": 0
+            }
+        
+        # Check for round numbers (1.0, 5.0, 10.0, 100.0, etc.)
+        round_count = int(count_round_amounts(values, _ROUND_NUMBERS, 0.01))
+        
+        round_percentage = round_count / len(values)
+        
+        score = 0
+        if round_percentage > threshold:
+            score = min(round_percentage * 100, 100)
+        
+        return {
+            "pattern": "round_amounts",
+            "detected": round_percentage > threshold,
+            "risk_score": score,
+            "round_count": round_count,
+            "total_transactions": len(values),
+            "round_percentage": round_percentage * 100
+        }
+    
+    def _time_result(self, bundle) -> Dict[str, Any]:
+        timestamps = bundle["timestamps"]
+        timestamps = timestamps[~np.isnan(timestamps)]
+        if len(timestamps) == 0:
+            return {
+                "pattern": "time_anomaly",
+                "detected": False,
+                "risk_score": 0
+            }
+        
+        # Convert to UTC hours (0-23) and weekdays (Mon=0) with integer math;
+        # 1970-01-01 was a Thursday, hence the +3 offset
+        ts = timestamps.astype(np.int64)
+        hours = (ts // 3600) % 24
+        weekdays = (ts // 86400 + 3) % 7
+        
+        score, suspicious_percentage, weekend_percentage = score_time(hours, weekdays)
+        
+        return {
+            "pattern": "time_anomaly",
+            "detected": score > 0,
+            "risk_score": float(score),
+            "suspicious_hours_percentage": float(suspicious_percentage) * 100,
+            "weekend_percentage": float(weekend_percentage) * 100,
+            "most_active_hours": int(np.bincount(hours, minlength=24).argmax())
+        }
+    
+    def _dust_result(self, record) -> Dict[str, Any]:
+        if not record:
+            return {
+                "pattern": "dust_attack",
+                "detected": False,
+                "risk_score": 0
+            }
+        
+        dust_count = record["dust_tx_count"]
+        unique_senders = record["unique_dust_senders"]
+        
+        score = 0
+        if dust_count > 10:
+            score = min(dust_count * 5, 80)
+        if unique_senders > 5:
+            score += 20
+        
+        return {
+            "pattern": "dust_attack",
+            "detected": dust_count > 5,
+            "risk_score": min(score, 100),
+            "dust_transactions": dust_count,
+            "unique_dust_senders": unique_senders,
+            "dust_amounts": record["dust_amounts"]
+        }
+    
+    def _wash_result(self, record) -> Dict[str, Any]:
+        if not record:
+            return {
+                "pattern": "wash_trading",
+                "detected": False,
+                "risk_score": 0
+            }
+        
+        wash_count = record["wash_count"]
+        score = min(wash_count * 15, 100) if wash_count > 0 else 0
+        
+        return {
+            "pattern": "wash_trading",
+            "detected": wash_count > 0,
+            "risk_score": score,
+            "wash_trades_count": wash_count,
+            "details": record["wash_trades"][:10]
+        }
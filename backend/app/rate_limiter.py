@@ -1,12 +1,89 @@
-c"""
+"""
 Rate Limiting Module
 Implement rate limiting by tier and IP address
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime, timedelta
-from collections import defaultdict
+import threading
 import time
+import os
+
+import numpy as np
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Shared bucket store for multi-worker deployments (in-memory when unset)
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Token bucket windows and their lengths in seconds (column order of the bucket arrays)
+WINDOWS = ("rpm", "rph", "rpd")
+WINDOW_SECONDS = (60.0, 3600.0, 86400.0)
+
+# Atomic token bucket over one key per window.
+# ARGV: cost, now, then limit / refill rate / ttl for each key in KEYS order.
+# Returns {denied_index (0 = allowed), retry_after, remaining per window...}
+TOKEN_BUCKET_LUA = """
+local n = #KEYS
+local cost = tonumber(ARGV[1])
+local now = tonumber(ARGV[2])
+local tokens = {}
+local denied = 0
+for i = 1, n do
+    local limit = tonumber(ARGV[2 + i])
+    local rate = tonumber(ARGV[2 + n + i])
+    local bucket = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local t = tonumber(bucket[1]) or limit
+    local ts = tonumber(bucket[2]) or now
+    t = math.min(limit, t + math.max(0, now - ts) * rate)
+    tokens[i] = t
+    if denied == 0 and t < cost then
+        denied = i
+    end
+end
+local retry_after = 0
+if denied > 0 then
+    retry_after = math.floor((cost - tokens[denied]) / tonumber(ARGV[2 + n + denied]))
+end
+local result = {denied, retry_after}
+for i = 1, n do
+    if denied == 0 then
+        tokens[i] = tokens[i] - cost
+    end
+    redis.call('HSET', KEYS[i], 'tokens', tostring(tokens[i]), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[i], tonumber(ARGV[2 + 2 * n + i]))
+    result[2 + i] = math.floor(tokens[i])
+end
+return result
+"""
+
+
+def _make_checker(limit_vec: np.ndarray, rate_vec: np.ndarray):
+    """
+    Build the token bucket check for one tier with its limits and refill
+    rates bound in the closure, so the hot path does no per-call lookups.
+    The returned function refills and charges one bucket row in place.
+    Returns: (index of the first exhausted window or -1, retry_after)
+    """
+    minimum = np.minimum
+    
+    def _check(tokens: np.ndarray, last_update: np.ndarray, now: float, cost: int) -> Tuple[int, int]:
+        # Refill all three windows at once, then a single min-of-three check
+        minimum(limit_vec, tokens + (now - last_update) * rate_vec, out=tokens)
+        last_update[:] = now
+        
+        if tokens.min() < cost:
+            i = int((tokens < cost).argmax())  # first exhausted window
+            return i, int((cost - tokens[i]) / rate_vec[i])
+        
+        # Deduct tokens from all buckets
+        tokens -= cost
+        return -1, 0
+    
+    return _check
 
 
 class RateLimiter:
@@ -21,18 +98,83 @@ class RateLimiter:
             "enterprise": {"rpm": 1000, "rph": 50000, "rpd": 500000}
         }
         
-        # In-memory storage (in production, use Redis)
-        self.buckets = defaultdict(lambda: {
-            "rpm": {"tokens": 0, "last_update": time.time()},
-            "rph": {"tokens": 0, "last_update": time.time()},
-            "rpd": {"tokens": 0, "last_update": time.time()}
-        })
+        self._tier_names = frozenset(self.tiers)
+        
+        # Per-tier constants in WINDOWS order, derived once from self.tiers
+        self._limits = {
+            tier: np.array([lim[window] for window in WINDOWS], dtype=np.float64)
+            for tier, lim in self.tiers.items()
+        }
+        self._rates = {
+            tier: limits / np.array(WINDOW_SECONDS)
+            for tier, limits in self._limits.items()
+        }
+        self._checkers = {
+            tier: _make_checker(self._limits[tier], self._rates[tier])
+            for tier in self.tiers
+        }
+        
+        # In-memory storage (used when REDIS_URL is not set), structure-of-arrays:
+        # one row per user, one column per window in WINDOWS order
+        self._rows: Dict[str, int] = {}  # user_id -> row
+        self._tokens = np.zeros((0, len(WINDOWS)), dtype=np.float64)
+        self._last_update = np.zeros((0, len(WINDOWS)), dtype=np.float64)
+        # Guards the arrays: growth swaps them, so row lookup and update share the lock
+        self._lock = threading.RLock()
+        
+        # Shared Redis store: one EVALSHA per check, state survives restarts
+        self._redis = None
+        self._bucket_script = None
+        if redis is not None and REDIS_URL:
+            self._redis = redis.Redis.from_url(REDIS_URL)
+            self._bucket_script = self._redis.register_script(TOKEN_BUCKET_LUA)
         
         self.user_tiers = {}  # user_id -> tier mapping
     
+    def _row(self, user_id: str, tier: str) -> int:
+        """Row of a user in the bucket arrays; new users start with full buckets"""
+        row = self._rows.get(user_id)
+        if row is not None:
+            return row
+        
+        with self._lock:
+            row = self._rows.get(user_id)
+            if row is not None:
+                return row
+            
+            row = len(self._rows)
+            if row == self._tokens.shape[0]:
+                # Grow by doubling so appends stay amortized O(1)
+                capacity = max(16, 2 * row)
+                tokens = np.zeros((capacity, len(WINDOWS)), dtype=np.float64)
+                last_update = np.zeros((capacity, len(WINDOWS)), dtype=np.float64)
+                tokens[:row] = self._tokens[:row]
+                last_update[:row] = self._last_update[:row]
+                self._tokens, self._last_update = tokens, last_update
+            
+            self._tokens[row] = self._limits[tier]
+            self._last_update[row] = time.time()
+            self._rows[user_id] = row
+            return row
+    
+    def _redis_consume(self, user_id: str, tier: str, cost: int) -> Tuple[int, int, List[int]]:
+        """
+        Run the token bucket script for all windows in one round-trip
+        Returns: (denied window index or -1, retry_after, remaining per window)
+        """
+        limits = self._limits[tier].tolist()
+        rates = self._rates[tier].tolist()
+        ttls = [int(seconds) for seconds in WINDOW_SECONDS]
+        # {user_id} is a hash tag: all three keys land in the same cluster slot
+        keys = [f"rl:{{{user_id}}}:{window}" for window in WINDOWS]
+        
+        result = self._bucket_script(keys=keys, args=[cost, time.time(), *limits, *rates, *ttls])
+        denied, retry_after = int(result[0]), int(result[1])
+        return denied - 1, retry_after, [int(r) for r in result[2:]]
+    
     def set_user_tier(self, user_id: str, tier: str):
         """Set tier for a user"""
-        if tier not in self.tiers:
+        if tier not in self._tier_names:
             raise ValueError(f"Invalid tier: {tier}")
         self.user_tiers[user_id] = tier
     
@@ -44,51 +186,51 @@ class RateLimiter:
         tier = self.user_tiers.get(user_id, "free")
         limits = self.tiers[tier]
         
-        user_bucket = self.buckets[user_id]
-        current_time = time.time()
-        
-        # Check all time windows
-        for window, limit in [("rpm", limits["rpm"]), ("rph", limits["rph"]), ("rpd", limits["rpd"])]:
-            bucket = user_bucket[window]
-            
-            # Refill tokens based on time passed
-            time_passed = current_time - bucket["last_update"]
-            
-            if window == "rpm":
-                refill_rate = limit / 60.0  # tokens per second
-                window_seconds = 60
-            elif window == "rph":
-                refill_rate = limit / 3600.0
-                window_seconds = 3600
-            else:  # rpd
-                refill_rate = limit / 86400.0
-                window_seconds = 86400
-            
-            tokens_to_add = time_passed * refill_rate
-            bucket["tokens"] = min(limit, bucket["tokens"] + tokens_to_add)
-            bucket["last_update"] = current_time
-            
-            # Check if we have enough tokens
-            if bucket["tokens"] < cost:
-                retry_after = int((cost - bucket["tokens"]) / refill_rate)
+        if self._redis is not None:
+            i, retry_after, remaining = self._redis_consume(user_id, tier, cost)
+            if i >= 0:
+                window = WINDOWS[i]
                 return {
                     "allowed": False,
                     "retry_after": retry_after,
-                    "limit": limit,
-                    "remaining": int(bucket["tokens"]),
+                    "limit": limits[window],
+                    "remaining": remaining[i],
                     "tier": tier,
                     "window": window,
-                    "reset_at": int(current_time + retry_after)
+                    "reset_at": int(time.time() + retry_after)
                 }
+            return {
+                "allowed": True,
+                "limit": limits["rpm"],
+                "remaining": remaining[0],
+                "tier": tier
+            }
         
-        # Deduct tokens from all buckets
-        for window in ["rpm", "rph", "rpd"]:
-            user_bucket[window]["tokens"] -= cost
+        # Resolved under the lock so a concurrent grow can't leave us updating the old arrays
+        with self._lock:
+            row = self._row(user_id, tier)
+            current_time = time.time()
+            i, retry_after = self._checkers[tier](
+                self._tokens[row], self._last_update[row], current_time, cost
+            )
+            remaining = int(self._tokens[row, max(i, 0)])
+        
+        if i >= 0:
+            window = WINDOWS[i]
+            return {
+                "allowed": False,
+                "retry_after": retry_after,
+                "limit": limits[window],
+                "remaining": remaining,
+                "tier": tier,
+                "window": window,
+                "reset_at": int(current_time + retry_after)
+            }
         
         return {
             "allowed": True,
             "limit": limits["rpm"],
-            "remaining": int(user_bucket["rpm"]["tokens"]),
+            "remaining": remaining,
             "tier": tier
         }
     
@@ -96,34 +238,28 @@ class RateLimiter:
         """Get current usage statistics for a user"""
         tier = self.user_tiers.get(user_id, "free")
         limits = self.tiers[tier]
-        user_bucket = self.buckets[user_id]
         
         # Update buckets
-        self.check_rate_limit(user_id, cost=0)
+        if self._redis is not None:
+            _, _, tokens = self._redis_consume(user_id, tier, 0)
+        else:
+            with self._lock:
+                self.check_rate_limit(user_id, cost=0)
+                tokens = self._tokens[self._rows[user_id]].copy()
         
         return {
             "tier": tier,
             "limits": limits,
             "usage": {
-                "rpm": {
-                    "limit": limits["rpm"],
-                    "remaining": int(user_bucket["rpm"]["tokens"]),
-                    "used": limits["rpm"] - int(user_bucket["rpm"]["tokens"])
-                },
-                "rph": {
-                    "limit": limits["rph"],
-                    "remaining": int(user_bucket["rph"]["tokens"]),
-                    "used": limits["rph"] - int(user_bucket["rph"]["tokens"])
-                },
-                "rpd": {
-                    "limit": limits["rpd"],
-                    "remaining": int(user_bucket["rpd"]["tokens"]),
-                    "used": limits["rpd"] - int(user_bucket["rpd"]["tokens"])
+                window: {
+                    "limit": limits[window],
+                    "remaining": int(tokens[i]),
+                    "used": limits[window] - int(tokens[i])
                 }
+                for i, window in enumerate(WINDOWS)
             }
         }
 
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
-
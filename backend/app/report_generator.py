@@ -8,10 +8,502 @@ Generate professional reports in multiple formats:
 """
 
 from typing import Dict, Any, List, Optional
+from collections import OrderedDict
 from datetime import datetime
+import hashlib
+import threading
+import time
 import json
 import io
 import base64
+import logging
+import html as html_lib
+from string import Template
+import math
+import zipfile
+from xml.sax.saxutils import escape as xml_escape
+
+import numpy as np
+
+logger = logging.getLogger("aml.reports")
+
+try:
+    import orjson
+    
+    def _json_dumps_pretty(obj) -> bytes:
+        """Indented UTF-8 JSON (orjson: numpy values and non-str keys allowed)"""
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        )
+    
+    def _json_dumps_canonical(obj) -> bytes:
+        """Compact JSON with sorted keys, used only for hashing"""
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        )
+except ImportError:
+    def _json_dumps_pretty(obj) -> bytes:
+        """Indented UTF-8 JSON"""
+        return json.dumps(obj, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+    
+    def _json_dumps_canonical(obj) -> bytes:
+        """Compact JSON with sorted keys, used only for hashing"""
+        return json.dumps(obj, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    REPORTLAB_AVAILABLE = True
+    
+    # PDF styles are immutable once built: share them across reports
+    _PDF_STYLES = getSampleStyleSheet()
+    _PDF_TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_PDF_STYLES['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#a855f7'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    _PDF_METADATA_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0ff')),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey)
+    ])
+    _PDF_RISK_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#a855f7')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# XlsxWriter format properties (formats belong to a workbook, so they are
+# registered once per workbook from these shared definitions)
+_XLSX_FORMATS = {
+    "title": {"font_size": 16, "bold": True, "font_color": "#a855f7", "align": "center"},
+    "sheet_title": {"font_size": 14, "bold": True},
+    "bold": {"bold": True},
+    "header": {"bold": True, "bg_color": "#a855f7", "font_color": "white"}
+}
+
+_TX_HEADERS = ('Timestamp', 'From', 'To', 'Value (ETH)', 'Type')
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.writer.excel import ExcelWriter
+    from openpyxl.styles import Font, PatternFill
+    OPENPYXL_AVAILABLE = True
+    
+    # Style objects are built once and shared by every cell and report
+    _XLSX_TITLE_FONT = Font(size=16, bold=True, color="a855f7")
+    _XLSX_SHEET_TITLE_FONT = Font(size=14, bold=True)
+    _XLSX_BOLD_FONT = Font(bold=True)
+    _XLSX_HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _XLSX_HEADER_FILL = PatternFill(start_color="a855f7", end_color="a855f7", fill_type="solid")
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+
+def _styled_cells(ws, values, font, fill=None) -> list:
+    """Write-only cells sharing one font (and fill) for a styled row"""
+    cells = []
+    for value in values:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        cells.append(cell)
+    return cells
+
+
+# ------------------------------------------------------------------
+# Direct OOXML emission (no per-cell objects): used for very large
+# transaction lists and when neither Excel library is installed
+# ------------------------------------------------------------------
+
+# Transaction rows above which the raw writer is used even if a library is installed
+RAW_XLSX_MIN_ROWS = 5000
+
+# zlib level for the .xlsx ZIP container (raw and openpyxl writers): reports are
+# generated per request and cached as built, so favour speed over the last few %
+XLSX_COMPRESSLEVEL = 1
+
+_OOXML_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_OOXML_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_OOXML_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_OOXML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_OOXML_ROOT_RELS = (
+    f'{_OOXML_DECL}<Relationships xmlns="{_OOXML_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_OOXML_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+# Cell style ids (cellXfs order): 0 default, 1 bold, 2 title, 3 sheet title, 4 header
+_RAW_BOLD, _RAW_TITLE, _RAW_SHEET_TITLE, _RAW_HEADER = 1, 2, 3, 4
+
+_OOXML_STYLES = (
+    f'{_OOXML_DECL}<styleSheet xmlns="{_OOXML_MAIN_NS}">'
+    '<fonts count="5">'
+    '<font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="16"/><color rgb="FFA855F7"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="14"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/></font>'
+    '</fonts>'
+    '<fills count="3">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFA855F7"/><bgColor indexed="64"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1">'
+    '<alignment horizontal="center"/></xf>'
+    '<xf numFmtId="0" fontId="3" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="4" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+_COLUMNS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _raw_row(row_idx: int, values, style=0) -> str:
+    """
+    One <row> element: numbers as values, everything else as inline strings.
+    style is a cell style id for the whole row or a tuple with one id per cell.
+    """
+    styles = style if isinstance(style, tuple) else (style,) * len(values)
+    cells = []
+    for col, value, cell_style in zip(_COLUMNS, values, styles):
+        if value is None:
+            continue
+        attrs = f' r="{col}{row_idx}"' + (f' s="{cell_style}"' if cell_style else '')
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+            cells.append(f'<c{attrs}><v>{value!r}</v></c>')
+        else:
+            cells.append(f'<c{attrs} t="inlineStr"><is><t>{xml_escape(str(value))}</t></is></c>')
+    return f'<row r="{row_idx}">{"".join(cells)}</row>'
+
+
+def _raw_xlsx(sheets) -> bytes:
+    """
+    Build an .xlsx archive from (name, rows, merge_ref) sheets where rows
+    yields (row_idx, values, style). Each worksheet part is streamed into
+    the ZIP row by row.
+    """
+    count = len(sheets)
+    content_types = (
+        f'{_OOXML_DECL}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        + "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in range(1, count + 1)
+        )
+        + '</Types>'
+    )
+    workbook = (
+        f'{_OOXML_DECL}<workbook xmlns="{_OOXML_MAIN_NS}" xmlns:r="{_OOXML_REL_NS}"><sheets>'
+        + "".join(
+            f'<sheet name="{xml_escape(name)}" sheetId="{i}" r:id="rId{i}"/>'
+            for i, (name, _, _) in enumerate(sheets, 1)
+        )
+        + '</sheets></workbook>'
+    )
+    workbook_rels = (
+        f'{_OOXML_DECL}<Relationships xmlns="{_OOXML_PKG_REL_NS}">'
+        + "".join(
+            f'<Relationship Id="rId{i}" Type="{_OOXML_REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, count + 1)
+        )
+        + f'<Relationship Id="rId{count + 1}" Type="{_OOXML_REL_NS}/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    )
+    
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=XLSX_COMPRESSLEVEL) as zf:
+        zf.writestr("[Content_Types].xml", content_types)
+        zf.writestr("_rels/.rels", _OOXML_ROOT_RELS)
+        zf.writestr("xl/workbook.xml", workbook)
+        zf.writestr("xl/_rels/workbook.xml.rels", workbook_rels)
+        zf.writestr("xl/styles.xml", _OOXML_STYLES)
+        
+        for i, (_, rows, merge_ref) in enumerate(sheets, 1):
+            with zf.open(f"xl/worksheets/sheet{i}.xml", "w") as part:
+                part.write(f'{_OOXML_DECL}<worksheet xmlns="{_OOXML_MAIN_NS}"><sheetData>'.encode())
+                for row_idx, values, style in rows:
+                    part.write(_raw_row(row_idx, values, style).encode())
+                part.write(b'</sheetData>')
+                if merge_ref:
+                    part.write(f'<mergeCells count="1"><mergeCell ref="{merge_ref}"/></mergeCells>'.encode())
+                part.write(b'</worksheet>')
+    
+    return buffer.getvalue()
+
+
+# Static parts of the HTML report (the CSS block never depends on the data),
+# encoded to UTF-8 once at import
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>EthGuardian AI Report</title>
+    <style>
+        * { box-sizing: border-box; }
+        body {
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+            background: linear-gradient(135deg, #0a0118 0%, #1a0b2e 50%, #0f051d 100%);
+            color: #f0f0ff;
+            margin: 0;
+            padding: 20px;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: rgba(20, 10, 40, 0.8);
+            border-radius: 16px;
+            padding: 40px;
+            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 40px;
+            padding-bottom: 20px;
+            border-bottom: 2px solid rgba(168, 85, 247, 0.3);
+        }
+        h1 {
+            font-size: 36px;
+            background: linear-gradient(90deg, #a855f7, #06b6d4);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            margin: 0;
+        }
+        .badge {
+            display: inline-block;
+            padding: 8px 16px;
+            border-radius: 999px;
+            background: linear-gradient(135deg, #a855f7, #06b6d4);
+            color: white;
+            font-weight: 700;
+            margin: 10px 0;
+        }
+        .section {
+            margin: 30px 0;
+            padding: 20px;
+            background: rgba(13, 10, 25, 0.6);
+            border-radius: 12px;
+            border: 1px solid rgba(168, 85, 247, 0.2);
+        }
+        .section h2 {
+            color: #a855f7;
+            margin-top: 0;
+        }
+        .metric {
+            display: grid;
+            grid-template-columns: 200px 1fr;
+            gap: 20px;
+            padding: 12px 0;
+            border-bottom: 1px solid rgba(168, 85, 247, 0.1);
+        }
+        .metric:last-child {
+            border-bottom: none;
+        }
+        .metric-label {
+            color: #a78bfa;
+            font-weight: 600;
+        }
+        .metric-value {
+            color: #f0f0ff;
+        }
+        .risk-high { color: #f43f5e; }
+        .risk-medium { color: #FFA94D; }
+        .risk-low { color: #10b981; }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+        th {
+            background: linear-gradient(135deg, #a855f7, #06b6d4);
+            color: white;
+            padding: 12px;
+            text-align: left;
+        }
+        td {
+            padding: 10px 12px;
+            border-bottom: 1px solid rgba(168, 85, 247, 0.1);
+        }
+        code {
+            background: rgba(0, 0, 0, 0.4);
+            padding: 2px 6px;
+            border-radius: 4px;
+            font-family: 'Monaco', monospace;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+""".encode('utf-8')
+
+# Dynamic parts: compiled once, values are HTML-escaped before substitution
+_HTML_SUMMARY = Template("""        <div class="header">
+            <h1>🛡️ EthGuardian AI</h1>
+            <div class="badge">Investigation Report</div>
+            <p>Generated: ${generated}</p>
+        </div>
+        
+        <div class="section">
+            <h2>Report Summary</h2>
+            <div class="metric">
+                <div class="metric-label">Report ID:</div>
+                <div class="metric-value">${report_id}</div>
+            </div>
+            <div class="metric">
+                <div class="metric-label">Address:</div>
+                <div class="metric-value"><code>${address}</code></div>
+            </div>
+            <div class="metric">
+                <div class="metric-label">Risk Score:</div>
+                <div class="metric-value ${risk_class}">${risk_score}/100</div>
+            </div>
+        </div>
+        
+""")
+
+_HTML_RISK_ROW = Template("""                <tr>
+                    <td>${label}</td>
+                    <td>${score}</td>
+                    <td class="${css_class}">${status}</td>
+                </tr>
+""")
+
+_HTML_RISK_TABLE_HEAD = """        <div class="section">
+            <h2>Risk Assessment</h2>
+            <table>
+                <tr>
+                    <th>Metric</th>
+                    <th>Score</th>
+                    <th>Status</th>
+                </tr>
+""".encode('utf-8')
+
+_HTML_FINDINGS_HEAD = """            </table>
+        </div>
+        
+        <div class="section">
+            <h2>Findings</h2>
+            <pre style="background: rgba(0,0,0,0.3); padding: 20px; border-radius: 8px; overflow-x: auto;">
+""".encode('utf-8')
+
+_HTML_FOOT = """
+            </pre>
+        </div>
+        
+        <div class="section">
+            <p style="text-align: center; color: #a78bfa; font-size: 12px;">
+                Generated by EthGuardian AI - Ethereum AML Monitoring Platform
+            </p>
+        </div>
+    </div>
+</body>
+</html>
+""".encode('utf-8')
+
+
+# Risk level labels indexed by (score >= 40) + (score >= 70)
+_RISK_STATUS = ("LOW RISK", "MEDIUM RISK", "HIGH RISK")
+_RISK_CLASS = ("risk-low", "risk-medium", "risk-high")
+
+# Score rows of the risk assessment table: (label, payload field)
+_SCORE_FIELDS = (
+    ('Overall Risk', 'risk_score'),
+    ('Pattern Score', 'pattern_score'),
+    ('Fraud Score', 'fraud_score'),
+    ('Analytics Score', 'analytics_score')
+)
+
+# Rendered report bodies are memoized per (format, report type, payload)
+REPORT_CACHE_SIZE = 64
+REPORT_CACHE_TTL = 300  # seconds; bodies embed their generation time
+
+
+def _truncate_json(obj: Any, max_chars: int) -> str:
+    """
+    Indented JSON of obj cut to max_chars. A dict is serialized one top-level
+    entry at a time and stops once max_chars is reached, so large findings are
+    never dumped in full just to be truncated.
+    """
+    if not isinstance(obj, dict) or not obj:
+        return json.dumps(obj, indent=2, default=str)[:max_chars]
+    
+    parts = ["{\n"]
+    used = 2
+    for i, (key, value) in enumerate(obj.items()):
+        item = (
+            ("  " if i == 0 else ",\n  ")
+            + json.dumps(str(key))
+            + ": "
+            + json.dumps(value, indent=2, default=str).replace("\n", "\n  ")
+        )
+        parts.append(item)
+        used += len(item)
+        if used >= max_chars:
+            break
+    else:
+        parts.append("\n}")
+    return "".join(parts)[:max_chars]
+
+
+def _hash_payload(data: Any, prefix: bytes = b"") -> bytes:
+    """16-byte blake2b digest of the canonical (compact, key-sorted) JSON of data"""
+    digest = hashlib.blake2b(prefix, digest_size=16)
+    digest.update(_json_dumps_canonical(data))
+    return digest.digest()
+
+
+def _report_cache_key(kind: str, report_type: str, data: Dict[str, Any]) -> Optional[bytes]:
+    """Digest of a report request, or None when the payload cannot be keyed"""
+    try:
+        return _hash_payload(data, f"{kind}:{report_type}:".encode())
+    except TypeError:  # e.g. mixed key types cannot be sorted
+        return None
 
 
 class ReportGenerator:
@@ -19,12 +511,37 @@ class ReportGenerator:
     
     def __init__(self):
         self.templates = {}
+        self._cache: "OrderedDict[bytes, tuple]" = OrderedDict()  # key -> (stored_at, fields)
+        self._cache_lock = threading.Lock()
+    
+    def _cache_get(self, key: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """Cached report fields for key (LRU touch), or None on miss / expiry"""
+        if key is None:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > REPORT_CACHE_TTL:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+    
+    def _cache_put(self, key: Optional[bytes], fields: Dict[str, Any]):
+        if key is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), fields)
+            self._cache.move_to_end(key)
+            while len(self._cache) > REPORT_CACHE_SIZE:
+                self._cache.popitem(last=False)
     
-    def generate_pdf_report(self, data: Dict[str, Any], report_type: str = "investigation") -> Dict[str, Any]:
+    def generate_pdf_report(self, data: Dict[str, Any], report_type: str = "investigation",
+                            base64_encode: bool = False) -> Dict[str, Any]:
         """
-        Generate PDF report
-        Note: In production, use libraries like ReportLab or WeasyPrint
-        This is a placeholder that returns report metadata
+        Generate PDF report with ReportLab
+        Returns report metadata only when ReportLab is not installed
         """
         report = {
             "format": "PDF",
@@ -34,32 +551,27 @@ class ReportGenerator:
             "note": "PDF generation requires reportlab library (pip install reportlab)"
         }
         
+        if not REPORTLAB_AVAILABLE:
+            report["status"] = "library_not_available"
+            report["message"] = "Install reportlab: pip install reportlab"
+            return report
+        
+        cache_key = _report_cache_key("pdf", report_type, data)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self._attach_body(report, cached, "pdf_bytes", "pdf_data", base64_encode)
+            report["cached"] = True
+            return report
+        
         try:
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            from reportlab.lib import colors
-            from reportlab.lib.enums import TA_CENTER, TA_LEFT
-            
             # Create PDF in memory
             buffer = io.BytesIO()
             doc = SimpleDocTemplate(buffer, pagesize=letter)
-            styles = getSampleStyleSheet()
             story = []
             
             # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#a855f7'),
-                spaceAfter=30,
-                alignment=TA_CENTER
-            )
-            
-            story.append(Paragraph("🛡️ EthGuardian AI", title_style))
-            story.append(Paragraph(f"{report_type.upper()} REPORT", title_style))
+            story.append(Paragraph("🛡️ EthGuardian AI", _PDF_TITLE_STYLE))
+            story.append(Paragraph(f"{report_type.upper()} REPORT", _PDF_TITLE_STYLE))
             story.append(Spacer(1, 0.5*inch))
             
             # Report metadata
@@ -71,28 +583,20 @@ class ReportGenerator:
             ]
             
             metadata_table = Table(metadata_data, colWidths=[2*inch, 4*inch])
-            metadata_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0ff')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey)
-            ]))
+            metadata_table.setStyle(_PDF_METADATA_TABLE_STYLE)
             
             story.append(metadata_table)
             story.append(Spacer(1, 0.5*inch))
             
             # Executive Summary
-            story.append(Paragraph("Executive Summary", styles['Heading2']))
+            story.append(Paragraph("Executive Summary", _PDF_STYLES['Heading2']))
             story.append(Spacer(1, 0.2*inch))
             summary_text = data.get('summary', 'No summary available.')
-            story.append(Paragraph(summary_text, styles['Normal']))
+            story.append(Paragraph(summary_text, _PDF_STYLES['Normal']))
             story.append(Spacer(1, 0.3*inch))
             
             # Risk Assessment
-            story.append(Paragraph("Risk Assessment", styles['Heading2']))
+            story.append(Paragraph("Risk Assessment", _PDF_STYLES['Heading2']))
             story.append(Spacer(1, 0.2*inch))
             
             risk_data = [
@@ -104,15 +608,7 @@ class ReportGenerator:
             ]
             
             risk_table = Table(risk_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-            risk_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#a855f7')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            risk_table.setStyle(_PDF_RISK_TABLE_STYLE)
             
             story.append(risk_table)
             story.append(Spacer(1, 0.3*inch))
@@ -120,62 +616,51 @@ class ReportGenerator:
             # Findings
             if 'findings' in data:
                 story.append(PageBreak())
-                story.append(Paragraph("Detailed Findings", styles['Heading2']))
+                story.append(Paragraph("Detailed Findings", _PDF_STYLES['Heading2']))
                 story.append(Spacer(1, 0.2*inch))
                 
-                findings_text = json.dumps(data['findings'], indent=2)
-                story.append(Paragraph(f"<pre>{findings_text[:2000]}</pre>", styles['Code']))
+                findings_text = html_lib.escape(_truncate_json(data['findings'], 2000))
+                story.append(Paragraph(f"<pre>{findings_text}</pre>", _PDF_STYLES['Code']))
             
             # Build PDF
             doc.build(story)
             pdf_bytes = buffer.getvalue()
             buffer.close()
             
-            report["pdf_data"] = base64.b64encode(pdf_bytes).decode('utf-8')
-            report["size_bytes"] = len(pdf_bytes)
-            report["status"] = "success"
+            body = {"pdf_bytes": pdf_bytes}
+            self._cache_put(cache_key, body)
+            self._attach_body(report, body, "pdf_bytes", "pdf_data", base64_encode)
             
-        except ImportError:
-            report["status"] = "library_not_available"
-            report["message"] = "Install reportlab: pip install reportlab"
         except Exception as e:
+            logger.exception("PDF report generation failed")
             report["status"] = "error"
             report["error"] = str(e)
         
         return report
     
-    def generate_excel_report(self, data: Dict[str, Any], report_type: str = "investigation") -> Dict[str, Any]:
+    def generate_excel_report(self, data: Dict[str, Any], report_type: str = "investigation",
+                            base64_encode: bool = False) -> Dict[str, Any]:
         """
         Generate Excel report
-        Note: In production, use libraries like openpyxl or xlsxwriter
+        Uses XlsxWriter when installed, openpyxl (write-only) otherwise, and
+        writes the OOXML directly for huge sheets or when neither is available
         """
         report = {
             "format": "EXCEL",
             "report_type": report_type,
             "generated_at": datetime.now().isoformat(),
             "status": "generated",
-            "note": "Excel generation requires openpyxl library (pip install openpyxl)"
+            "note": "Install xlsxwriter (pip install xlsxwriter) for the fastest Excel generation"
         }
         
+        cache_key = _report_cache_key("excel", report_type, data)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self._attach_body(report, cached, "excel_bytes", "excel_data", base64_encode)
+            report["cached"] = True
+            return report
+        
         try:
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-            
-            wb = Workbook()
-            
-            # Summary Sheet
-            ws_summary = wb.active
-            ws_summary.title = "Summary"
-            
-            # Header
-            ws_summary['A1'] = "EthGuardian AI - Investigation Report"
-            ws_summary['A1'].font = Font(size=16, bold=True, color="a855f7")
-            ws_summary['A1'].alignment = Alignment(horizontal='center')
-            ws_summary.merge_cells('A1:D1')
-            
-            # Metadata
-            row = 3
             metadata_fields = [
                 ('Report ID', data.get('report_id', 'N/A')),
                 ('Generated', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
@@ -183,75 +668,156 @@ class ReportGenerator:
                 ('Risk Score', f"{data.get('risk_score', 0)}/100"),
             ]
             
-            for label, value in metadata_fields:
-                ws_summary[f'A{row}'] = label
-                ws_summary[f'A{row}'].font = Font(bold=True)
-                ws_summary[f'B{row}'] = value
-                row += 1
-            
-            # Risk Scores Sheet
-            ws_risk = wb.create_sheet("Risk Scores")
-            ws_risk['A1'] = "Risk Assessment"
-            ws_risk['A1'].font = Font(size=14, bold=True)
-            
-            headers = ['Metric', 'Score', 'Status']
-            for col, header in enumerate(headers, 1):
-                cell = ws_risk.cell(row=3, column=col)
-                cell.value = header
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color="a855f7", end_end_color="a855f7", fill_type="solid")
-                cell.font = Font(bold=True, color="FFFFFF")
-            
-            risk_scores = [
-                ('Overall Risk', data.get('risk_score', 0)),
-                ('Pattern Score', data.get('pattern_score', 0)),
-                ('Fraud Score', data.get('fraud_score', 0)),
-                ('Analytics Score', data.get('analytics_score', 0))
+            risk_rows = [
+                (metric, score, self._get_risk_status(score))
+                for metric, score in (
+                    ('Overall Risk', data.get('risk_score', 0)),
+                    ('Pattern Score', data.get('pattern_score', 0)),
+                    ('Fraud Score', data.get('fraud_score', 0)),
+                    ('Analytics Score', data.get('analytics_score', 0))
+                )
             ]
             
-            for idx, (metric, score) in enumerate(risk_scores, 4):
-                ws_risk[f'A{idx}'] = metric
-                ws_risk[f'B{idx}'] = score
-                ws_risk[f'C{idx}'] = self._get_risk_status(score)
-            
-            # Transactions Sheet (if available)
+            tx_rows = None
             if 'transactions' in data:
-                ws_tx = wb.create_sheet("Transactions")
-                ws_tx['A1'] = "Transaction History"
-                ws_tx['A1'].font = Font(size=14, bold=True)
-                
-                tx_headers = ['Timestamp', 'From', 'To', 'Value (ETH)', 'Type']
-                for col, header in enumerate(tx_headers, 1):
-                    cell = ws_tx.cell(row=3, column=col)
-                    cell.value = header
-                    cell.font = Font(bold=True)
-                
-                for idx, tx in enumerate(data['transactions'][:100], 4):  # Limit to 100
-                    ws_tx[f'A{idx}'] = tx.get('timestamp', 'N/A')
-                    ws_tx[f'B{idx}'] = tx.get('from', 'N/A')
-                    ws_tx[f'C{idx}'] = tx.get('to', 'N/A')
-                    ws_tx[f'D{idx}'] = tx.get('value', 0)
-                    ws_tx[f'E{idx}'] = tx.get('type', 'N/A')
+                tx_rows = [
+                    (
+                        tx.get('timestamp', 'N/A'),
+                        tx.get('from', 'N/A'),
+                        tx.get('to', 'N/A'),
+                        tx.get('value', 0),
+                        tx.get('type', 'N/A')
+                    )
+                    for tx in data['transactions'][:100]  # Limit to 100
+                ]
             
-            # Save to bytes
-            buffer = io.BytesIO()
-            wb.save(buffer)
-            excel_bytes = buffer.getvalue()
-            buffer.close()
+            if len(tx_rows or ()) > RAW_XLSX_MIN_ROWS or not (XLSXWRITER_AVAILABLE or OPENPYXL_AVAILABLE):
+                excel_bytes = self._excel_raw(metadata_fields, risk_rows, tx_rows)
+            elif XLSXWRITER_AVAILABLE:
+                excel_bytes = self._excel_xlsxwriter(metadata_fields, risk_rows, tx_rows)
+            else:
+                excel_bytes = self._excel_openpyxl(metadata_fields, risk_rows, tx_rows)
             
-            report["excel_data"] = base64.b64encode(excel_bytes).decode('utf-8')
-            report["size_bytes"] = len(excel_bytes)
-            report["status"] = "success"
+            body = {"excel_bytes": excel_bytes}
+            self._cache_put(cache_key, body)
+            self._attach_body(report, body, "excel_bytes", "excel_data", base64_encode)
             
-        except ImportError:
-            report["status"] = "library_not_available"
-            report["message"] = "Install openpyxl: pip install openpyxl"
         except Exception as e:
+            logger.exception("Excel report generation failed")
             report["status"] = "error"
             report["error"] = str(e)
         
         return report
     
+    @staticmethod
+    def _attach_body(report: Dict[str, Any], body: Dict[str, Any], bytes_key: str, data_key: str,
+                     base64_encode: bool):
+        """
+        Put a binary report body on the response: the raw bytes always, the
+        base64 text only when asked for (encoded once per cached body)
+        """
+        raw = body[bytes_key]
+        report[bytes_key] = raw
+        report["size_bytes"] = len(raw)
+        report["status"] = "success"
+        if base64_encode:
+            encoded = body.get(data_key)
+            if encoded is None:
+                encoded = body[data_key] = base64.b64encode(raw).decode('ascii')
+            report[data_key] = encoded
+    
+    def _excel_xlsxwriter(self, metadata_fields, risk_rows, tx_rows) -> bytes:
+        """
+        Write the workbook with XlsxWriter in constant_memory mode: each row is
+        flushed as soon as the next one starts, so no cell objects accumulate
+        """
+        buffer = io.BytesIO()
+        wb = xlsxwriter.Workbook(buffer, {'constant_memory': True})
+        fmt = {name: wb.add_format(props) for name, props in _XLSX_FORMATS.items()}
+        
+        # Summary Sheet
+        ws_summary = wb.add_worksheet("Summary")
+        ws_summary.merge_range(0, 0, 0, 3, "EthGuardian AI - Investigation Report", fmt["title"])
+        for row, (label, value) in enumerate(metadata_fields, 2):
+            ws_summary.write(row, 0, label, fmt["bold"])
+            ws_summary.write(row, 1, value)
+        
+        # Risk Scores Sheet
+        ws_risk = wb.add_worksheet("Risk Scores")
+        ws_risk.write(0, 0, "Risk Assessment", fmt["sheet_title"])
+        ws_risk.write_row(2, 0, ('Metric', 'Score', 'Status'), fmt["header"])
+        for row, values in enumerate(risk_rows, 3):
+            ws_risk.write_row(row, 0, values)
+        
+        # Transactions Sheet (if available)
+        if tx_rows is not None:
+            ws_tx = wb.add_worksheet("Transactions")
+            ws_tx.write(0, 0, "Transaction History", fmt["sheet_title"])
+            ws_tx.write_row(2, 0, _TX_HEADERS, fmt["bold"])
+            for row, values in enumerate(tx_rows, 3):
+                ws_tx.write_row(row, 0, values)
+        
+        wb.close()
+        return buffer.getvalue()
+    
+    def _excel_raw(self, metadata_fields, risk_rows, tx_rows) -> bytes:
+        """Dependency-free writer: same sheets and styles, emitted as OOXML"""
+        summary = [(1, ("EthGuardian AI - Investigation Report",), _RAW_TITLE)]
+        summary += [(row, (label, value), (_RAW_BOLD, 0)) for row, (label, value) in enumerate(metadata_fields, 3)]
+        
+        risk = [
+            (1, ("Risk Assessment",), _RAW_SHEET_TITLE),
+            (3, ('Metric', 'Score', 'Status'), _RAW_HEADER)
+        ]
+        risk += [(row, values, 0) for row, values in enumerate(risk_rows, 4)]
+        
+        sheets = [("Summary", summary, "A1:D1"), ("Risk Scores", risk, None)]
+        
+        if tx_rows is not None:
+            def tx_sheet():
+                yield 1, ("Transaction History",), _RAW_SHEET_TITLE
+                yield 3, _TX_HEADERS, _RAW_BOLD
+                for row, values in enumerate(tx_rows, 4):
+                    yield row, values, 0
+            sheets.append(("Transactions", tx_sheet(), None))
+        
+        return _raw_xlsx(sheets)
+    
+    def _excel_openpyxl(self, metadata_fields, risk_rows, tx_rows) -> bytes:
+        """Fallback writer: write-only openpyxl workbook, one append per row"""
+        wb = Workbook(write_only=True)
+        
+        # Summary Sheet
+        ws_summary = wb.create_sheet("Summary")
+        ws_summary.append(_styled_cells(ws_summary, ["EthGuardian AI - Investigation Report"], _XLSX_TITLE_FONT))
+        ws_summary.append(())
+        for label, value in metadata_fields:
+            ws_summary.append(_styled_cells(ws_summary, [label], _XLSX_BOLD_FONT) + [value])
+        
+        # Risk Scores Sheet
+        ws_risk = wb.create_sheet("Risk Scores")
+        ws_risk.append(_styled_cells(ws_risk, ["Risk Assessment"], _XLSX_SHEET_TITLE_FONT))
+        ws_risk.append(())
+        ws_risk.append(_styled_cells(ws_risk, ['Metric', 'Score', 'Status'], _XLSX_HEADER_FONT, _XLSX_HEADER_FILL))
+        for values in risk_rows:
+            ws_risk.append(values)
+        
+        # Transactions Sheet (if available)
+        if tx_rows is not None:
+            ws_tx = wb.create_sheet("Transactions")
+            ws_tx.append(_styled_cells(ws_tx, ["Transaction History"], _XLSX_SHEET_TITLE_FONT))
+            ws_tx.append(())
+            ws_tx.append(_styled_cells(ws_tx, _TX_HEADERS, _XLSX_BOLD_FONT))
+            for values in tx_rows:
+                ws_tx.append(values)
+        
+        # Same as wb.save(), with the archive's compression level under our control
+        buffer = io.BytesIO()
+        archive = zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, allowZip64=True,
+                                  compresslevel=XLSX_COMPRESSLEVEL)
+        ExcelWriter(wb, archive).save()
+        return buffer.getvalue()
+    
     def generate_json_report(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate JSON report"""
         report = {
@@ -261,213 +827,114 @@ class ReportGenerator:
         }
         
         # Pretty print JSON
-        report["json_string"] = json.dumps(data, indent=2, default=str)
-        report["size_bytes"] = len(report["json_string"])
+        json_bytes = _json_dumps_pretty(data)
+        report["json_string"] = json_bytes.decode('utf-8')
+        report["size_bytes"] = len(json_bytes)
         report["status"] = "success"
         
         return report
     
-    def generate_html_report(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate HTML report"""
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>EthGuardian AI Report</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: linear-gradient(135deg, #0a0118 0%, #1a0b2e 50%, #0f051d 100%);
-            color: #f0f0ff;
-            margin: 0;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: rgba(20, 10, 40, 0.8);
-            border-radius: 16px;
-            padding: 40px;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
-        }}
-        .header {{
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 20px;
-            border-bottom: 2px solid rgba(168, 85, 247, 0.3);
-        }}
-        h1 {{
-            font-size: 36px;
-            background: linear-gradient(90deg, #a855f7, #06b6d4);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            margin: 0;
-        }}
-        .badge {{
-            display: inline-block;
-            padding: 8px 16px;
-            border-radius: 999px;
-            background: linear-gradient(135deg, #a855f7, #06b6d4);
-            color: white;
-            font-weight: 700;
-            margin: 10px 0;
-        }}
-        .section {{
-            margin: 30px 0;
-            padding: 20px;
-            background: rgba(13, 10, 25, 0.6);
-            border-radius: 12px;
-            border: 1px solid rgba(168, 85, 247, 0.2);
-        }}
-        .section h2 {{
-            color: #a855f7;
-            margin-top: 0;
-        }}
-        .metric {{
-            display: grid;
-            grid-template-columns: 200px 1fr;
-            gap: 20px;
-            padding: 12px 0;
-            border-bottom: 1px solid rgba(168, 85, 247, 0.1);
-        }}
-        .metric:last-child {{
-            border-bottom: none;
-        }}
-        .metric-label {{
-            color: #a78bfa;
-            font-weight: 600;
-        }}
-        .metric-value {{
-            color: #f0f0ff;
-        }}
-        .risk-high {{ color: #f43f5e; }}
-        .risk-medium {{ color: #FFA94D; }}
-        .risk-low {{ color: #10b981; }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }}
-        th {{
-            background: linear-gradient(135deg, #a855f7, #06b6d4);
-            color: white;
-            padding: 12px;
-            text-align: left;
-        }}
-        td {{
-            padding: 10px 12px;
-            border-bottom: 1px solid rgba(168, 85, 247, 0.1);
-        }}
-        code {{
-            background: rgba(0, 0, 0, 0.4);
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-family: 'Monaco', monospace;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🛡️ EthGuardian AI</h1>
-            <div class="badge">Investigation Report</div>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-        
-        <div class="section">
-            <h2>Report Summary</h2>
-            <div class="metric">
-                <div class="metric-label">Report ID:</div>
-                <div class="metric-value">{data.get('report_id', 'N/A')}</div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Address:</div>
-                <div class="metric-value"><code>{data.get('address', 'N/A')}</code></div>
-            </div>
-            <div class="metric">
-                <div class="metric-label">Risk Score:</div>
-                <div class="metric-value {self._get_risk_class(data.get('risk_score', 0))}">{data.get('risk_score', 0)}/100</div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>Risk Assessment</h2>
-            <table>
-                <tr>
-                    <th>Metric</th>
-                    <th>Score</th>
-                    <th>Status</th>
-                </tr>
-                <tr>
-                    <td>Overall Risk</td>
-                    <td>{data.get('risk_score', 0)}</td>
-                    <td class="{self._get_risk_class(data.get('risk_score', 0))}">{self._get_risk_status(data.get('risk_score', 0))}</td>
-                </tr>
-                <tr>
-                    <td>Pattern Score</td>
-                    <td>{data.get('pattern_score', 0)}</td>
-                    <td class="{self._get_risk_class(data.get('pattern_score', 0))}">{self._get_risk_status(data.get('pattern_score', 0))}</td>
-                </tr>
-                <tr>
-                    <td>Fraud Score</td>
-                    <td>{data.get('fraud_score', 0)}</td>
-                    <td class="{self._get_risk_class(data.get('fraud_score', 0))}">{self._get_risk_status(data.get('fraud_score', 0))}</td>
-                </tr>
-                <tr>
-                    <td>Analytics Score</td>
-                    <td>{data.get('analytics_score', 0)}</td>
-                    <td class="{self._get_risk_class(data.get('analytics_score', 0))}">{self._get_risk_status(data.get('analytics_score', 0))}</td>
-                </tr>
-            </table>
-        </div>
-        
-        <div class="section">
-            <h2>Findings</h2>
-            <pre style="background: rgba(0,0,0,0.3); padding: 20px; border-radius: 8px; overflow-x: auto;">
-{json.dumps(data.get('findings', {}), indent=2)}
-            </pre>
-        </div>
-        
-        <div class="section">
-            <p style="text-align: center; color: #a78bfa; font-size: 12px;">
-                Generated by EthGuardian AI - Ethereum AML Monitoring Platform
-            </p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+    def generate_html_report(self, data: Dict[str, Any], as_text: bool = True) -> Dict[str, Any]:
+        """
+        Generate HTML report. The page is returned as UTF-8 "html_bytes";
+        "html" (decoded text) is added only when as_text is set.
+        """
+        return self._html_report(data, as_text=as_text)
+    
+    def generate_html_reports(self, items: List[Dict[str, Any]], as_text: bool = True) -> List[Dict[str, Any]]:
+        """
+        Generate HTML reports for a batch of payloads. The risk level of every
+        score in the batch is computed in one vectorized pass.
+        """
+        if not items:
+            return []
         
+        scores = np.array(
+            [[data.get(field, 0) for _, field in _SCORE_FIELDS] for data in items],
+            dtype=np.float64
+        )
+        levels = ((scores >= 40).astype(np.int8) + (scores >= 70)).tolist()
+        return [self._html_report(data, row_levels, as_text) for data, row_levels in zip(items, levels)]
+    
+    def _html_report(self, data: Dict[str, Any], levels: Optional[List[int]] = None,
+                     as_text: bool = True) -> Dict[str, Any]:
+        """Build (or fetch from cache) one HTML report; levels are precomputed risk levels"""
         report = {
             "format": "HTML",
-            "generated_at": datetime.now().isoformat(),
-            "html": html,
-            "size_bytes": len(html),
-            "status": "success"
+            "generated_at": datetime.now().isoformat()
         }
+        cache_key = _report_cache_key("html", "investigation", data)
+        body = self._cache_get(cache_key)
+        if body is None:
+            body = {"html_bytes": self._render_html(data, levels)}
+            self._cache_put(cache_key, body)
+        else:
+            report["cached"] = True
+        
+        html_bytes = body["html_bytes"]
+        report["html_bytes"] = html_bytes
+        report["size_bytes"] = len(html_bytes)
+        report["status"] = "success"
+        if as_text:
+            html = body.get("html")
+            if html is None:
+                html = body["html"] = html_bytes.decode('utf-8')
+            report["html"] = html
         
         return report
     
-    def _get_risk_status(self, score: int) -> str:
+    @staticmethod
+    def _render_html(data: Dict[str, Any], levels: Optional[List[int]]) -> bytes:
+        """Render the report page to UTF-8 bytes around the pre-encoded static parts"""
+        # Escaping the UTF-8 JSON as bytes is the same as html.escape(quote=False)
+        findings_json = (
+            _json_dumps_pretty(data.get('findings', {}))
+            .replace(b"&", b"&amp;").replace(b"<", b"&lt;").replace(b">", b"&gt;")
+        )
+        
+        # Each score and its status/class are resolved once
+        report_id = data.get('report_id', 'N/A')
+        address = data.get('address', 'N/A')
+        values = [data.get(field, 0) for _, field in _SCORE_FIELDS]
+        if levels is None:
+            levels = [(score >= 40) + (score >= 70) for score in values]
+        scores = [
+            (label, score, _RISK_CLASS[level], _RISK_STATUS[level])
+            for (label, _), score, level in zip(_SCORE_FIELDS, values, levels)
+        ]
+        _, risk_score, risk_class, _ = scores[0]
+        
+        parts = [
+            _HTML_HEAD,
+            _HTML_SUMMARY.substitute(
+                generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                report_id=html_lib.escape(str(report_id)),
+                address=html_lib.escape(str(address)),
+                risk_class=risk_class,
+                risk_score=html_lib.escape(str(risk_score))
+            ).encode('utf-8'),
+            _HTML_RISK_TABLE_HEAD
+        ]
+        parts.extend(
+            _HTML_RISK_ROW.substitute(
+                label=label, score=html_lib.escape(str(score)), css_class=css_class, status=status
+            ).encode('utf-8')
+            for label, score, css_class, status in scores
+        )
+        parts.append(_HTML_FINDINGS_HEAD)
+        parts.append(findings_json)
+        parts.append(_HTML_FOOT)
+        return b"".join(parts)
+    
+    @staticmethod
+    def _get_risk_status(score: int) -> str:
         """Get risk status text"""
-        if score >= 70:
-            return "HIGH RISK"
-        elif score >= 40:
-            return "MEDIUM RISK"
-        else:
-            return "LOW RISK"
+        return _RISK_STATUS[(score >= 40) + (score >= 70)]
     
-    def _get_risk_class(self, score: int) -> str:
+    @staticmethod
+    def _get_risk_class(score: int) -> str:
         """Get CSS class for risk level"""
-        if score >= 70:
-            return "risk-high"
-        elif score >= 40:
-            return "risk-medium"
-        else:
-            return "risk-low"
+        return _RISK_CLASS[(score >= 40) + (score >= 70)]
 
 
 # Global report generator
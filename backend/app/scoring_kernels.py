@@ -0,0 +1,97 @@
+"""
+Scoring Kernels
+Numeric inner loops of the pattern detectors as array kernels:
+- Layering score (chain count, mean depth and speed)
+- Round amount hits
+- Peel chain monotonic check
+- Time-of-day / weekend fractions
+
+Kernels are compiled with Numba when it is installed and run as plain
+NumPy otherwise, so both paths return the same values.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional: fall back to the undecorated NumPy functions
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def score_layering(chain_count, mean_depth, mean_time_span_hours):
+    """Layering score (0-100) from chain count, mean depth and mean time span"""
+    if chain_count == 0:
+        return 0.0
+
+    # More chains = higher score
+    score = min(chain_count * 10.0, 40.0)
+    # Deeper chains = higher score
+    score += min(mean_depth * 5.0, 30.0)
+    # Faster chains = higher score
+    if mean_time_span_hours < 1.0:
+        score += 30.0
+    elif mean_time_span_hours < 6.0:
+        score += 20.0
+    elif mean_time_span_hours < 24.0:
+        score += 10.0
+    return min(score, 100.0)
+
+
+@njit(cache=True, fastmath=True)
+def count_round_amounts(values, round_numbers, tolerance):
+    """Count values within tolerance of a (sorted) round number"""
+    last = round_numbers.shape[0] - 1
+    idx = np.searchsorted(round_numbers, values)
+    lower = round_numbers[np.maximum(idx - 1, 0)]
+    upper = round_numbers[np.minimum(idx, last)]
+    hits = (np.abs(values - lower) < tolerance) | (np.abs(values - upper) < tolerance)
+    return hits.sum()
+
+
+@njit(cache=True)
+def is_strictly_decreasing(values):
+    """True when every value is below the previous one (NaN breaks the run)"""
+    if values.shape[0] < 2:
+        return True
+    return bool((np.diff(values) < 0.0).all())
+
+
+@njit(cache=True, fastmath=True)
+def score_time(hours, weekdays):
+    """Return (score, night_fraction, weekend_fraction) for UTC hours/weekdays"""
+    n = hours.shape[0]
+    if n == 0:
+        return 0.0, 0.0, 0.0
+
+    # Transactions in suspicious hours (2am - 6am) and on weekends
+    night = ((hours >= 2) & (hours <= 6)).sum() / n
+    weekend = (weekdays >= 5).sum() / n
+
+    score = 0.0
+    if night > 0.3:  # More than 30% at night
+        score += 50.0
+    if weekend > 0.5:  # More than 50% on weekends
+        score += 30.0
+    return min(score, 100.0), night, weekend
+
+
+def _warm_up():
+    """Trigger JIT compilation at import so the first request does not pay for it"""
+    floats = np.ones(2, dtype=np.float64)
+    ints = np.ones(2, dtype=np.int64)
+    score_layering(2, 1.0, 1.0)
+    count_round_amounts(floats, floats, 0.01)
+    is_strictly_decreasing(floats)
+    score_time(ints, ints)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
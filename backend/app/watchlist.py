@@ -3,73 +3,213 @@ Watchlist Monitoring Module
 24/7 monitoring of specific addresses with automatic alerts
 """
 
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import asyncio
 import threading
 
+import numpy as np
+
+# Concurrent address checks; each check waits on Neo4j, so threads overlap the round-trips
+CHECK_WORKERS = 16
+
+# Fields accepted by update_watchlist_entry
+_UPDATABLE_FIELDS = frozenset({"reason", "tags", "alert_threshold", "last_check", "alerts_triggered", "status"})
+
+# Updatable fields stored in integer columns, with their column's bounds
+_INT_FIELDS = {
+    "alert_threshold": np.iinfo(np.int32),
+    "alerts_triggered": np.iinfo(np.int64),
+}
+
+
+def _whole_number(value) -> Optional[int]:
+    """value as an int when it is a whole number (or a numeric string), else None"""
+    try:
+        number = int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return number if isinstance(value, str) or number == value else None
+
+
+def _int_field(field: str, value) -> int:
+    """Validated value for one of _INT_FIELDS (ValueError with a user-facing message)"""
+    number = _whole_number(value)
+    bounds = _INT_FIELDS[field]
+    if number is None or not bounds.min <= number <= bounds.max:
+        raise ValueError(f"{field} must be a whole number in [{bounds.min}, {bounds.max}], got {value!r}")
+    return number
+
 
 class WatchlistManager:
     """Manage watchlist of addresses for 24/7 monitoring"""
     
     def __init__(self, neo4j_driver):
         self.driver = neo4j_driver
-        self.watchlist: Dict[str, Dict[str, Any]] = {}
         self.monitoring_active = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()  # wakes the monitor loop on stop
+        self._lock = threading.Lock()  # guards the watchlist columns (checks run concurrently)
+        
+        # Watchlist as structure-of-arrays, one row per address in insertion order:
+        # the fields scanned in bulk (status, threshold, alert count) are NumPy
+        # columns, descriptive fields are plain lists
+        self._index: Dict[str, int] = {}  # address -> row
+        self._addresses: List[str] = []
+        self._added_at: List[str] = []
+        self._reasons: List[str] = []
+        self._tags: List[List[str]] = []
+        self._last_check: List[Optional[str]] = []
+        self._status = np.empty(0, dtype=object)
+        self._thresholds = np.zeros(0, dtype=np.int32)
+        self._alerts = np.zeros(0, dtype=np.int64)
+        
+        # Detectors are stateless apart from the driver: build them once, on first check
+        self._pattern_detector = None
+        self._fraud_detector = None
+    
+    def _entry(self, row: int) -> Dict[str, Any]:
+        """Watchlist entry of a row as a dict"""
+        return {
+            "address": self._addresses[row],
+            "added_at": self._added_at[row],
+            "reason": self._reasons[row],
+            "tags": self._tags[row],
+            "alert_threshold": int(self._thresholds[row]),
+            "last_check": self._last_check[row],
+            "alerts_triggered": int(self._alerts[row]),
+            "status": self._status[row]
+        }
+    
+    def _append_row(self, address: str) -> int:
+        """Add an empty row for address, growing the columns by doubling"""
+        row = len(self._addresses)
+        if row == self._status.shape[0]:
+            capacity = max(16, 2 * row)
+            self._status = np.resize(self._status, capacity)
+            self._thresholds = np.resize(self._thresholds, capacity)
+            self._alerts = np.resize(self._alerts, capacity)
+        
+        self._index[address] = row
+        self._addresses.append(address)
+        self._added_at.append("")
+        self._reasons.append("")
+        self._tags.append([])
+        self._last_check.append(None)
+        return row
     
     def add_to_watchlist(self, address: str, reason: str = "", tags: List[str] = None, alert_threshold: int = 50) -> Dict[str, Any]:
         """Add address to watchlist"""
         if tags is None:
             tags = []
         
-        entry = {
-            "address": address,
-            "added_at": datetime.now().isoformat(),
-            "reason": reason,
-            "tags": tags,
-            "alert_threshold": alert_threshold,
-            "last_check": None,
-            "alerts_triggered": 0,
-            "status": "active"
-        }
+        # Validated before any column is touched, so bad input leaves no half-added row
+        try:
+            alert_threshold = _int_field("alert_threshold", alert_threshold)
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}
+        
+        with self._lock:
+            row = self._index.get(address)
+            if row is None:
+                row = self._append_row(address)
+            
+            self._added_at[row] = datetime.now().isoformat()
+            self._reasons[row] = reason
+            self._tags[row] = tags
+            self._last_check[row] = None
+            self._thresholds[row] = alert_threshold
+            self._alerts[row] = 0
+            self._status[row] = "active"
+            entry = self._entry(row)
         
-        self.watchlist[address] = entry
         return {"ok": True, "entry": entry}
     
     def remove_from_watchlist(self, address: str) -> bool:
         """Remove address from watchlist"""
-        if address in self.watchlist:
-            del self.watchlist[address]
+        with self._lock:
+            row = self._index.pop(address, None)
+            if row is None:
+                return False
+            
+            # Shift later rows up one place to keep insertion order
+            size = len(self._addresses)
+            for column in (self._status, self._thresholds, self._alerts):
+                column[row:size - 1] = column[row + 1:size]
+            for column in (self._addresses, self._added_at, self._reasons, self._tags, self._last_check):
+                del column[row]
+            for moved, moved_address in enumerate(self._addresses[row:], row):
+                self._index[moved_address] = moved
             return True
-        return False
     
     def get_watchlist(self) -> List[Dict[str, Any]]:
         """Get all watchlist entries"""
-        return list(self.watchlist.values())
+        with self._lock:
+            return [self._entry(row) for row in range(len(self._addresses))]
     
     def get_watchlist_entry(self, address: str) -> Dict[str, Any]:
         """Get specific watchlist entry"""
-        return self.watchlist.get(address)
+        with self._lock:
+            row = self._index.get(address)
+            return self._entry(row) if row is not None else None
     
     def update_watchlist_entry(self, address: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update watchlist entry"""
-        if address not in self.watchlist:
-            return {"ok": False, "error": "Address not in watchlist"}
+        unknown = set(updates) - _UPDATABLE_FIELDS
+        if unknown:
+            return {"ok": False, "error": f"Fields cannot be updated: {', '.join(sorted(unknown))}"}
+        
+        # Integer columns only take whole numbers that fit (no silent truncation)
+        try:
+            numbers = {field: _int_field(field, updates[field]) for field in _INT_FIELDS.keys() & updates.keys()}
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}
+        
+        with self._lock:
+            row = self._index.get(address)
+            if row is None:
+                return {"ok": False, "error": "Address not in watchlist"}
+            
+            if "reason" in updates:
+                self._reasons[row] = updates["reason"]
+            if "tags" in updates:
+                self._tags[row] = updates["tags"]
+            if "alert_threshold" in updates:
+                self._thresholds[row] = numbers["alert_threshold"]
+            if "last_check" in updates:
+                self._last_check[row] = updates["last_check"]
+            if "alerts_triggered" in updates:
+                self._alerts[row] = numbers["alerts_triggered"]
+            if "status" in updates:
+                self._status[row] = updates["status"]
+            entry = self._entry(row)
         
-        self.watchlist[address].update(updates)
-        return {"ok": True, "entry": self.watchlist[address]}
+        return {"ok": True, "entry": entry}
+    
+    def _detectors(self):
+        """Shared PatternDetector / FraudDetector instances (created lazily)"""
+        if self._pattern_detector is None:
+            from .pattern_detection import PatternDetector
+            from .fraud_detection import FraudDetector
+            
+            with self._lock:
+                if self._pattern_detector is None:
+                    self._fraud_detector = FraudDetector(self.driver)
+                    self._pattern_detector = PatternDetector(self.driver)
+        return self._pattern_detector, self._fraud_detector
     
     def check_address(self, address: str) -> Dict[str, Any]:
         """Check a single watchlist address for new activity"""
-        from .pattern_detection import PatternDetector
-        from .fraud_detection import FraudDetector
         from .alerting import alert_manager
         
-        pattern_detector = PatternDetector(self.driver)
-        fraud_detector = FraudDetector(self.driver)
+        pattern_detector, fraud_detector = self._detectors()
         
         try:
+            with self._lock:
+                row = self._index[address]
+                alert_threshold = int(self._thresholds[row])
+                reason, tags = self._reasons[row], self._tags[row]
+            
             # Run analyses
             patterns = pattern_detector.detect_all_patterns(address)
             fraud = fraud_detector.detect_all_fraud_types(address)
@@ -80,27 +220,32 @@ class WatchlistManager:
                 fraud.get("overall_fraud_score", 0)
             )
             
-            # Update last check time
-            self.watchlist[address]["last_check"] = datetime.now().isoformat()
+            # Update last check time (the row may have moved while the analyses ran)
+            with self._lock:
+                row = self._index.get(address)
+                if row is not None:
+                    self._last_check[row] = datetime.now().isoformat()
             
             # Check if alert threshold exceeded
-            entry = self.watchlist[address]
-            if risk_score >= entry["alert_threshold"]:
+            if risk_score >= alert_threshold:
                 # Trigger alert
                 alert = alert_manager.create_alert(
                     alert_type="WATCHLIST_ALERT",
                     address=address,
                     risk_score=int(risk_score),
                     details={
-                        "watchlist_reason": entry["reason"],
-                        "tags": entry["tags"],
+                        "watchlist_reason": reason,
+                        "tags": tags,
                         "patterns": patterns,
                         "fraud": fraud
                     }
                 )
                 alert_manager.process_alert(alert)
                 
-                entry["alerts_triggered"] += 1
+                with self._lock:
+                    row = self._index.get(address)
+                    if row is not None:
+                        self._alerts[row] += 1
                 
                 return {
                     "address": address,
@@ -123,13 +268,16 @@ class WatchlistManager:
             }
     
     def check_all_addresses(self) -> List[Dict[str, Any]]:
-        """Check all watchlist addresses"""
-        results = []
-        for address in list(self.watchlist.keys()):
-            if self.watchlist[address]["status"] == "active":
-                result = self.check_address(address)
-                results.append(result)
-        return results
+        """Check all active watchlist addresses concurrently (results keep watchlist order)"""
+        with self._lock:
+            rows = np.flatnonzero(self._status[:len(self._addresses)] == "active")
+            active = [self._addresses[row] for row in rows]
+        if not active:
+            return []
+        
+        # Each check opens its own sessions on the shared (thread-safe) driver
+        with ThreadPoolExecutor(max_workers=min(CHECK_WORKERS, len(active))) as executor:
+            return list(executor.map(self.check_address, active))
     
     def start_monitoring(self, check_interval_minutes: int = 60):
         """Start continuous monitoring"""
@@ -137,19 +285,18 @@ class WatchlistManager:
             return {"ok": False, "message": "Monitoring already active"}
         
         self.monitoring_active = True
+        self._stop_event.clear()
         
         def monitor_loop():
             while self.monitoring_active:
-                print(f"[Watchlist] Checking {len(self.watchlist)} addresses...")
+                print(f"[Watchlist] Checking {len(self._addresses)} addresses...")
                 results = self.check_all_addresses()
                 alerts = sum(1 for r in results if r.get("alert_triggered"))
                 print(f"[Watchlist] Check complete. {alerts} alerts triggered.")
                 
-                # Sleep for interval
-                for _ in range(check_interval_minutes * 60):
-                    if not self.monitoring_active:
-                        break
-                    asyncio.sleep(1)
+                # Sleep for interval (returns early when monitoring is stopped)
+                if self._stop_event.wait(check_interval_minutes * 60):
+                    break
         
         self.monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
         self.monitor_thread.start()
@@ -159,18 +306,21 @@ class WatchlistManager:
     def stop_monitoring(self):
         """Stop continuous monitoring"""
         self.monitoring_active = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
         return {"ok": True, "message": "Monitoring stopped"}
     
     def get_monitoring_status(self) -> Dict[str, Any]:
         """Get monitoring status"""
-        return {
-            "monitoring_active": self.monitoring_active,
-            "watchlist_size": len(self.watchlist),
-            "active_addresses": sum(1 for e in self.watchlist.values() if e["status"] == "active"),
-            "total_alerts_triggered": sum(e["alerts_triggered"] for e in self.watchlist.values())
-        }
+        with self._lock:
+            size = len(self._addresses)
+            return {
+                "monitoring_active": self.monitoring_active,
+                "watchlist_size": size,
+                "active_addresses": int((self._status[:size] == "active").sum()),
+                "total_alerts_triggered": int(self._alerts[:size].sum())
+            }
 
 
 # Global watchlist manager
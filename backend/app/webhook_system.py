@@ -4,12 +4,55 @@ Send real-time notifications via HTTP webhooks
 """
 
 from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime
 import hashlib
 import hmac
 
+logger = logging.getLogger("aml.webhooks")
+
+# Concurrent deliveries per event; each one mostly waits on the remote endpoint
+DELIVERY_WORKERS = 16
+
+# Keep-alive pool shared by all deliveries (sized above the worker count)
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 128
+
+# Seconds an event's subscriber list is served from memory
+SUBSCRIBER_CACHE_TTL = 5.0
+
+# HTTP timeouts (seconds): normal, and for endpoints that failed last time
+DELIVERY_TIMEOUT = 10
+SUSPECT_TIMEOUT = 3
+
+# Cap on the exponential back-off after consecutive failures (seconds)
+MAX_BACKOFF = 60.0
+
+# Seconds queued events wait for more events to the same webhook before one POST
+COALESCE_WINDOW = 0.025
+
+# All active webhooks subscribed to an event
+SUBSCRIBERS_QUERY = """
+MATCH (w:Webhook)
+WHERE w.active = true AND $event IN w.events
+RETURN w
+"""
+
+# Events that have at least one active subscriber
+ACTIVE_EVENTS_QUERY = """
+MATCH (w:Webhook)
+WHERE w.active = true
+UNWIND w.events AS event
+RETURN DISTINCT event
+"""
+
 
 class WebhookManager:
     """Manage webhook subscriptions and delivery"""
@@ -17,8 +60,8 @@ class WebhookManager:
     def __init__(self, neo4j_driver):
         self.driver = neo4j_driver
         
-        # Webhook events
-        self.events = [
+        # Webhook events (ordered for listing, plus a set for validation)
+        self.events = (
             "alert.created",
             "alert.updated",
             "case.created",
@@ -27,21 +70,101 @@ class WebhookManager:
             "analysis.completed",
             "transaction.detected",
             "risk.threshold_exceeded"
-        ]
+        )
+        self._event_set = frozenset(self.events)
+        
+        # One pooled session: repeat deliveries to a host reuse the TCP/TLS connection.
+        # Only failed connects are retried: once the request is sent the receiver may
+        # have processed it, so a read timeout or 5xx must not post the event twice
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "User-Agent": "EthGuardian-Webhook/1.0"
+        })
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=2,
+                connect=2,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=0.2,
+                raise_on_status=False
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Keyed HMAC state per webhook: (secret, hmac primed with the key)
+        self._hmac_templates: Dict[str, tuple] = {}
+        
+        # webhook_id -> (consecutive failures, monotonic time of next attempt)
+        self._backoff: Dict[str, tuple] = {}
+        
+        # event -> (loaded_at, subscribed webhooks); cleared whenever webhooks change
+        self._sub_cache: Dict[str, tuple] = {}
+        self._sub_cache_lock = threading.Lock()
+        
+        # (loaded_at, events with any active subscriber), None = reload on next use.
+        # Expires like _sub_cache so webhooks registered by other workers show up;
+        # the version guards against storing a set loaded before an invalidation
+        self._events_with_subs: Optional[tuple] = None
+        self._subs_version = 0
+        
+        # webhook_id -> (webhook, queued messages) waiting for the coalescing window
+        self._outbox: Dict[str, tuple] = {}
+        self._outbox_lock = threading.Lock()
+    
+    def _invalidate_subscribers(self):
+        """Drop cached subscriber lists after a webhook is added, removed or disabled"""
+        with self._sub_cache_lock:
+            self._sub_cache.clear()
+            self._events_with_subs = None
+            self._subs_version += 1
+    
+    def _has_subscribers(self, event: str) -> bool:
+        """Whether any active webhook listens to the event (reloaded every SUBSCRIBER_CACHE_TTL)"""
+        cached = self._events_with_subs
+        if cached is not None and time.monotonic() - cached[0] < SUBSCRIBER_CACHE_TTL:
+            return event in cached[1]
+        
+        version = self._subs_version
+        loaded_at = time.monotonic()
+        with self.driver.session() as session:
+            events = frozenset(record["event"] for record in session.run(ACTIVE_EVENTS_QUERY))
+        with self._sub_cache_lock:
+            if version == self._subs_version:
+                self._events_with_subs = (loaded_at, events)
+        return event in events
+    
+    def _cached_subscribers(self, event: str) -> Optional[List[Dict[str, Any]]]:
+        """Subscriber list of an event if it was loaded less than SUBSCRIBER_CACHE_TTL ago"""
+        with self._sub_cache_lock:
+            cached = self._sub_cache.get(event)
+        if cached is not None and time.monotonic() - cached[0] < SUBSCRIBER_CACHE_TTL:
+            return cached[1]
+        return None
+    
+    def _store_subscribers(self, event: str, loaded_at: float, webhooks: List[Dict[str, Any]]):
+        with self._sub_cache_lock:
+            self._sub_cache[event] = (loaded_at, webhooks)
     
     def register_webhook(self, url: str, events: List[str], user_id: str, 
                         secret: Optional[str] = None, description: Optional[str] = None) -> Dict[str, Any]:
         """Register a new webhook endpoint"""
         
         # Validate events
-        invalid_events = [e for e in events if e not in self.events]
+        invalid_events = [e for e in events if e not in self._event_set]
         if invalid_events:
             return {
                 "error": f"Invalid events: {invalid_events}",
-                "valid_events": self.events
+                "valid_events": list(self.events)
             }
         
-        webhook_id = f"wh_{int(datetime.now().timestamp())}_{user_id}"
+        created_at = time.time_ns() // 1_000_000_000
+        webhook_id = f"wh_{created_at}_{user_id}"
         
         query = """
         CREATE (w:Webhook {
@@ -68,8 +191,9 @@ class WebhookManager:
                 user_id=user_id,
                 secret=secret or "",
                 description=description or "",
-                timestamp=int(datetime.now().timestamp())
+                timestamp=created_at
             )
+            self._invalidate_subscribers()
             
             return {
                 "webhook_id": webhook_id,
@@ -82,157 +206,247 @@ class WebhookManager:
     def send_webhook(self, event: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Send webhook to all subscribed endpoints"""
         
-        # Get all active webhooks subscribed to this event
-        query = """
-        MATCH (w:Webhook)
-        WHERE w.active = true AND $event IN w.events
-        RETURN w
+        # Nothing listens to this event: skip payload, query and pool entirely
+        if not self._has_subscribers(event):
+            return {
+                "event": event,
+                "webhooks_triggered": 0,
+                "successful_deliveries": 0,
+                "failed_deliveries": 0,
+                "skipped_deliveries": 0,
+                "results": []
+            }
+        
+        # Prepare payload, serialized once: the same bytes are signed and sent
+        webhook_payload = {
+            "event": event,
+            "timestamp": datetime.now().isoformat(),
+            "data": payload
+        }
+        body = json.dumps(webhook_payload, separators=(",", ":")).encode()
+        
+        def deliver(webhook: Dict[str, Any]) -> Dict[str, Any]:
+            # Add signature if secret is configured
+            signature = None
+            if webhook.get("secret"):
+                signature = self._generate_signature(body, webhook["secret"], webhook["webhook_id"])
+            
+            # Send HTTP POST request
+            return self._deliver_webhook(
+                webhook["webhook_id"],
+                webhook["url"],
+                body,
+                signature
+            )
+        
+        webhooks = self._cached_subscribers(event)
+        
+        # Fan out: total latency is the slowest endpoint, not the sum of all of them.
+        # On a cache miss each delivery starts as soon as its record is streamed from Neo4j.
+        with ThreadPoolExecutor(max_workers=DELIVERY_WORKERS) as executor:
+            if webhooks is None:
+                loaded_at = time.monotonic()
+                webhooks = []
+                futures = []
+                with self.driver.session() as session:
+                    for record in session.run(SUBSCRIBERS_QUERY, event=event):
+                        webhook = dict(record["w"])
+                        webhooks.append(webhook)
+                        futures.append(executor.submit(deliver, webhook))
+                self._store_subscribers(event, loaded_at, webhooks)
+            else:
+                futures = [executor.submit(deliver, webhook) for webhook in webhooks]
+            delivery_results = [future.result() for future in futures]
+        
+        # Stats and logs for the whole fan-out go to Neo4j in a single round-trip
+        self._record_deliveries(delivery_results)
+        
+        successful = sum(1 for r in delivery_results if r["success"])
+        skipped = sum(1 for r in delivery_results if r.get("skipped"))
+        return {
+            "event": event,
+            "webhooks_triggered": len(futures),
+            "successful_deliveries": successful,
+            "failed_deliveries": len(delivery_results) - successful - skipped,
+            "skipped_deliveries": skipped,
+            "results": delivery_results
+        }
+    
+    def enqueue_webhook(self, event: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue an event for its subscribers instead of posting it right away.
+        An event alone in its COALESCE_WINDOW is posted as the usual
+        {"event", "timestamp", "data"} payload; several events queued for the
+        same webhook are sent as one signed POST {"events": [<payload>, ...]}.
         """
+        if not self._has_subscribers(event):
+            return {"event": event, "webhooks_queued": 0}
         
-        with self.driver.session() as session:
-            result = session.run(query, event=event)
-            webhooks = list(result)
+        message = {
+            "event": event,
+            "timestamp": datetime.now().isoformat(),
+            "data": payload
+        }
+        
+        webhooks = self._cached_subscribers(event)
+        if webhooks is None:
+            loaded_at = time.monotonic()
+            with self.driver.session() as session:
+                result = session.run(SUBSCRIBERS_QUERY, event=event)
+                webhooks = [dict(record["w"]) for record in result]
+            self._store_subscribers(event, loaded_at, webhooks)
+        
+        for webhook in webhooks:
+            webhook_id = webhook["webhook_id"]
+            with self._outbox_lock:
+                pending = self._outbox.get(webhook_id)
+                if pending is not None:
+                    pending[1].append(message)
+                    continue
+                self._outbox[webhook_id] = (webhook, [message])
             
-            delivery_results = []
+            # First event for this webhook opens the window
+            timer = threading.Timer(COALESCE_WINDOW, self._flush_outbox, args=(webhook_id,))
+            timer.daemon = True
+            timer.start()
+        
+        return {
+            "event": event,
+            "webhooks_queued": len(webhooks)
+        }
+    
+    def _flush_outbox(self, webhook_id: str):
+        """Send everything queued for a webhook in one POST (runs on a timer thread)"""
+        with self._outbox_lock:
+            webhook, messages = self._outbox.pop(webhook_id)
+        
+        # Nothing above the timer thread would see an exception, so log it here
+        try:
+            # A lone event keeps the shape of send_webhook/test_webhook payloads
+            batch = messages[0] if len(messages) == 1 else {"events": messages}
+            body = json.dumps(batch, separators=(",", ":"), default=str).encode()
             
-            for record in webhooks:
-                webhook = dict(record["w"])
-                
-                # Prepare payload
-                webhook_payload = {
-                    "event": event,
-                    "timestamp": datetime.now().isoformat(),
-                    "data": payload
-                }
-                
-                # Add signature if secret is configured
-                signature = None
-                if webhook.get("secret"):
-                    signature = self._generate_signature(
-                        json.dumps(webhook_payload),
-                        webhook["secret"]
-                    )
-                
-                # Send HTTP POST request
-                delivery_result = self._deliver_webhook(
-                    webhook["webhook_id"],
-                    webhook["url"],
-                    webhook_payload,
-                    signature
-                )
-                
-                delivery_results.append(delivery_result)
+            signature = None
+            if webhook.get("secret"):
+                signature = self._generate_signature(body, webhook["secret"], webhook_id)
             
-            return {
-                "event": event,
-                "webhooks_triggered": len(webhooks),
-                "successful_deliveries": len([r for r in delivery_results if r["success"]]),
-                "failed_deliveries": len([r for r in delivery_results if not r["success"]]),
-                "results": delivery_results
-            }
+            result = self._deliver_webhook(webhook_id, webhook["url"], body, signature)
+            self._record_deliveries([result])
+        except Exception as e:
+            logger.error("Webhook batch of %d event(s) for %s failed: %s", len(messages), webhook_id, e)
     
-    def _deliver_webhook(self, webhook_id: str, url: str, payload: Dict[str, Any], 
+    def _deliver_webhook(self, webhook_id: str, url: str, body: bytes, 
                         signature: Optional[str] = None) -> Dict[str, Any]:
-        """Deliver webhook to endpoint"""
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "EthGuardian-Webhook/1.0"
-        }
+        """Deliver webhook to endpoint (body is the serialized JSON payload)"""
+        # Circuit breaker: a failing endpoint is not retried until its back-off ends
+        failures, retry_at = self._backoff.get(webhook_id, (0, 0.0))
+        if failures and time.monotonic() < retry_at:
+            return {
+                "webhook_id": webhook_id,
+                "url": url,
+                "success": False,
+                "skipped": True,
+                "error": "Endpoint backing off after consecutive failures"
+            }
+        
+        # Content-Type and User-Agent come from the session
+        headers = {}
         
         if signature:
             headers["X-Webhook-Signature"] = signature
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
-                json=payload,
+                data=body,
                 headers=headers,
-                timeout=10
+                timeout=SUSPECT_TIMEOUT if failures else DELIVERY_TIMEOUT
             )
             
-            success = response.status_code < 400
-            
-            # Update delivery stats
-            self._update_delivery_stats(webhook_id, success)
-            
-            # Log delivery
-            self._log_delivery(webhook_id, success, response.status_code)
-            
-            return {
+            result = {
                 "webhook_id": webhook_id,
                 "url": url,
-                "success": success,
+                "success": response.status_code < 400,
                 "status_code": response.status_code,
                 "response": response.text[:200]  # First 200 chars
             }
         
         except requests.exceptions.RequestException as e:
-            # Update failure stats
-            self._update_delivery_stats(webhook_id, False)
-            
-            # Log delivery failure
-            self._log_delivery(webhook_id, False, 0, str(e))
-            
-            return {
+            result = {
                 "webhook_id": webhook_id,
                 "url": url,
                 "success": False,
                 "error": str(e)
             }
+        
+        if result["success"]:
+            self._backoff.pop(webhook_id, None)
+        else:
+            failures += 1
+            self._backoff[webhook_id] = (failures, time.monotonic() + min(MAX_BACKOFF, 2.0 ** failures))
+        
+        return result
     
-    def _generate_signature(self, payload: str, secret: str) -> str:
+    def _generate_signature(self, payload: bytes, secret: str, webhook_id: str) -> str:
         """Generate HMAC signature for webhook payload"""
-        return hmac.new(
-            secret.encode(),
-            payload.encode(),
-            hashlib.sha256
-        ).hexdigest()
-    
-    def _update_delivery_stats(self, webhook_id: str, success: bool):
-        """Update delivery statistics"""
-        if success:
-            query = """
-            MATCH (w:Webhook {webhook_id: $webhook_id})
-            SET w.delivery_count = w.delivery_count + 1,
-                w.last_delivery = timestamp()
-            """
-        else:
-            query = """
-            MATCH (w:Webhook {webhook_id: $webhook_id})
-            SET w.failure_count = w.failure_count + 1,
-                w.last_failure = timestamp()
-            WITH w
-            WHERE w.failure_count > 10
-            SET w.active = false
-            """
+        # The keyed HMAC state is built once per webhook and copied per message
+        cached = self._hmac_templates.get(webhook_id)
+        if cached is None or cached[0] != secret:
+            cached = (secret, hmac.new(secret.encode(), digestmod=hashlib.sha256))
+            self._hmac_templates[webhook_id] = cached
         
-        with self.driver.session() as session:
-            session.run(query, webhook_id=webhook_id)
+        mac = cached[1].copy()
+        mac.update(payload)
+        return mac.hexdigest()
+    
+    @staticmethod
+    def verify_signature(payload: bytes, signature: str, secret: str) -> bool:
+        """Check an X-Webhook-Signature header against the raw request body"""
+        expected = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
     
-    def _log_delivery(self, webhook_id: str, success: bool, status_code: int, 
-                     error: Optional[str] = None):
-        """Log webhook delivery"""
+    def _record_deliveries(self, results: List[Dict[str, Any]]):
+        """Update delivery statistics and log every delivery in one write"""
+        # Deliveries skipped by the circuit breaker were never attempted
+        results = [r for r in results if not r.get("skipped")]
+        if not results:
+            return
+        
         query = """
-        MATCH (w:Webhook {webhook_id: $webhook_id})
+        UNWIND $rows AS r
+        MATCH (w:Webhook {webhook_id: r.webhook_id})
+        SET w.delivery_count = w.delivery_count + CASE WHEN r.success THEN 1 ELSE 0 END,
+            w.failure_count = w.failure_count + CASE WHEN r.success THEN 0 ELSE 1 END,
+            w.last_delivery = CASE WHEN r.success THEN timestamp() ELSE w.last_delivery END,
+            w.last_failure = CASE WHEN r.success THEN w.last_failure ELSE timestamp() END
+        SET w.active = CASE WHEN NOT r.success AND w.failure_count > 10 THEN false ELSE w.active END
         CREATE (log:WebhookLog {
             log_id: randomUUID(),
-            webhook_id: $webhook_id,
-            success: $success,
-            status_code: $status_code,
-            error: $error,
+            webhook_id: r.webhook_id,
+            success: r.success,
+            status_code: r.status_code,
+            error: r.error,
             timestamp: timestamp()
         })
         CREATE (w)-[:HAS_LOG]->(log)
         """
         
+        rows = [
+            {
+                "webhook_id": r["webhook_id"],
+                "success": r["success"],
+                "status_code": r.get("status_code", 0),
+                "error": r.get("error", "")
+            }
+            for r in results
+        ]
+        
         with self.driver.session() as session:
-            session.run(
-                query,
-                webhook_id=webhook_id,
-                success=success,
-                status_code=status_code,
-                error=error or ""
-            )
+            session.run(query, rows=rows).consume()
+        
+        # A failure may have disabled a webhook
+        if not all(row["success"] for row in rows):
+            self._invalidate_subscribers()
     
     def get_user_webhooks(self, user_id: str) -> Dict[str, Any]:
         """Get all webhooks for a user"""
@@ -244,9 +458,7 @@ class WebhookManager:
         
         with self.driver.session() as session:
             result = session.run(query, user_id=user_id)
-            records = list(result)
-            
-            webhooks = [dict(record["w"]) for record in records]
+            webhooks = [dict(record["w"]) for record in result]
             
             return {
                 "user_id": user_id,
@@ -267,6 +479,9 @@ class WebhookManager:
             record = result.single()
             
             if record["deleted"] > 0:
+                self._hmac_templates.pop(webhook_id, None)
+                self._backoff.pop(webhook_id, None)
+                self._invalidate_subscribers()
                 return {"message": "Webhook deleted successfully"}
             else:
                 return {"error": "Webhook not found"}
@@ -297,26 +512,26 @@ class WebhookManager:
                 }
             }
             
+            body = json.dumps(test_payload, separators=(",", ":")).encode()
+            
             signature = None
             if webhook.get("secret"):
-                signature = self._generate_signature(
-                    json.dumps(test_payload),
-                    webhook["secret"]
-                )
+                signature = self._generate_signature(body, webhook["secret"], webhook_id)
             
             result = self._deliver_webhook(
                 webhook_id,
                 webhook["url"],
-                test_payload,
+                body,
                 signature
             )
+            self._record_deliveries([result])
             
             return result
     
     def get_available_events(self) -> Dict[str, Any]:
         """Get list of available webhook events"""
         return {
-            "events": self.events,
+            "events": list(self.events),
             "descriptions": {
                 "alert.created": "Triggered when a new alert is created",
                 "alert.updated": "Triggered when an alert is updated",
@@ -326,6 +541,11 @@ class WebhookManager:
                 "analysis.completed": "Triggered when analysis completes",
                 "transaction.detected": "Triggered when suspicious transaction detected",
                 "risk.threshold_exceeded": "Triggered when risk score exceeds threshold"
+            },
+            "payload_formats": {
+                "single": '{"event": "<event>", "timestamp": "<ISO 8601>", "data": {...}}',
+                "batch": '{"events": [<single payload>, ...]} when several events for one webhook '
+                         'are queued within the coalescing window'
             }
         }
 
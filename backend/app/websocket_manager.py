@@ -3,95 +3,163 @@ WebSocket Manager for Real-Time Updates
 Push notifications to connected clients
 """
 
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Optional, Tuple
 from fastapi import WebSocket
 import json
 import asyncio
+import time
 from datetime import datetime
 
+try:
+    import orjson
+    
+    def _dumps(message: Dict[str, Any]) -> str:
+        """Serialize a message to the JSON text sent in a frame"""
+        return orjson.dumps(message, default=str).decode('utf-8')
+except ImportError:
+    def _dumps(message: Dict[str, Any]) -> str:
+        """Serialize a message to the JSON text sent in a frame"""
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    # Clients asking for msgpack fall back to JSON text frames
+    MSGPACK_AVAILABLE = False
+
+# A message ready to send: (JSON text, MessagePack bytes or None)
+Frames = Tuple[str, Optional[bytes]]
+
+
+# ISO timestamp of the current second, rebuilt only when the second changes
+_last_second = 0
+_last_iso = ""
+
+
+def _now_iso() -> str:
+    """Local ISO timestamp (second precision) shared by all messages in that second"""
+    global _last_second, _last_iso
+    second = time.time_ns() // 1_000_000_000
+    if second != _last_second:
+        _last_iso = datetime.fromtimestamp(second).isoformat()
+        _last_second = second
+    return _last_iso
+
 
 class WebSocketManager:
     """Manage WebSocket connections for real-time updates"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.subscriptions: Dict[str, Set[WebSocket]] = {}
+        # Reverse index: topics each connection is subscribed to
+        self._ws_topics: Dict[WebSocket, Set[str]] = {}
+        # Clients that connected with ?encoding=msgpack (binary frames)
+        self._msgpack_clients: Set[WebSocket] = set()
     
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        if MSGPACK_AVAILABLE and websocket.query_params.get("encoding") == "msgpack":
+            self._msgpack_clients.add(websocket)
         
         # Send welcome message
         await self.send_personal_message({
             "type": "connection",
             "message": "Connected to EthGuardian AI",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }, websocket)
     
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._msgpack_clients.discard(websocket)
         
-        # Remove from all subscriptions
-        for topic in self.subscriptions:
-            if websocket in self.subscriptions[topic]:
-                self.subscriptions[topic].remove(websocket)
+        # Remove from its own subscriptions only; empty topics are dropped
+        for topic in self._ws_topics.pop(websocket, ()):
+            self._remove_subscriber(topic, websocket)
     
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """Send message to specific client"""
         try:
-            await websocket.send_json(message)
+            if websocket in self._msgpack_clients:
+                await websocket.send_bytes(msgpack.packb(message, default=str))
+            else:
+                await websocket.send_text(_dumps(message))
         except:
             self.disconnect(websocket)
     
-    async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast message to all connected clients"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                disconnected.append(connection)
+    def _frames(self, message: Dict[str, Any]) -> Frames:
+        """Encode a message once per format; msgpack only while such clients exist"""
+        packed = msgpack.packb(message, default=str) if self._msgpack_clients else None
+        return _dumps(message), packed
+    
+    def _send_frame(self, connection: WebSocket, frames: Frames):
+        text, packed = frames
+        if packed is not None and connection in self._msgpack_clients:
+            return connection.send_bytes(packed)
+        return connection.send_text(text)
+    
+    async def _fan_out(self, connections: List[WebSocket], frames: Frames):
+        """Send one encoded message to many clients concurrently; drop the ones that fail"""
+        if not connections:
+            return
+        
+        results = await asyncio.gather(
+            *(self._send_frame(connection, frames) for connection in connections),
+            return_exceptions=True
+        )
         
         # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
+    
+    async def broadcast(self, message: Dict[str, Any]):
+        """Broadcast message to all connected clients"""
+        await self._fan_out(list(self.active_connections), self._frames(message))
     
     async def broadcast_to_topic(self, topic: str, message: Dict[str, Any]):
         """Broadcast message to clients subscribed to specific topic"""
+        await self._send_to_topic(topic, self._frames(message))
+    
+    async def _send_to_topic(self, topic: str, frames: Frames):
+        """Send an already encoded message to a topic's subscribers"""
         if topic not in self.subscriptions:
             return
         
-        disconnected = []
-        for connection in self.subscriptions[topic]:
-            try:
-                await connection.send_json(message)
-            except:
-                disconnected.append(connection)
-        
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection)
+        await self._fan_out(list(self.subscriptions[topic]), frames)
     
     def subscribe(self, websocket: WebSocket, topic: str):
         """Subscribe client to topic"""
         if topic not in self.subscriptions:
             self.subscriptions[topic] = set()
         self.subscriptions[topic].add(websocket)
+        self._ws_topics.setdefault(websocket, set()).add(topic)
     
     def unsubscribe(self, websocket: WebSocket, topic: str):
         """Unsubscribe client from topic"""
-        if topic in self.subscriptions and websocket in self.subscriptions[topic]:
-            self.subscriptions[topic].remove(websocket)
+        topics = self._ws_topics.get(websocket)
+        if topics is not None:
+            topics.discard(topic)
+        self._remove_subscriber(topic, websocket)
+    
+    def _remove_subscriber(self, topic: str, websocket: WebSocket):
+        """Remove a client from a topic, dropping the topic once it is empty"""
+        subscribers = self.subscriptions.get(topic)
+        if subscribers is not None:
+            subscribers.discard(websocket)
+            if not subscribers:
+                del self.subscriptions[topic]
     
     async def send_alert(self, alert: Dict[str, Any]):
         """Send alert notification to all clients"""
         message = {
             "type": "alert",
             "data": alert,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
         await self.broadcast_to_topic("alerts", message)
     
@@ -101,17 +169,19 @@ class WebSocketManager:
             "type": "analysis_update",
             "address": address,
             "data": analysis,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
-        await self.broadcast_to_topic(f"address_{address}", message)
-        await self.broadcast_to_topic("analysis", message)
+        # Encoded once for both topics
+        frames = self._frames(message)
+        await self._send_to_topic(f"address_{address}", frames)
+        await self._send_to_topic("analysis", frames)
     
     async def send_transaction_feed(self, transaction: Dict[str, Any]):
         """Send real-time transaction to feed"""
         message = {
             "type": "transaction",
             "data": transaction,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
         await self.broadcast_to_topic("transactions", message)
     
@@ -121,7 +191,7 @@ class WebSocketManager:
             "type": "job_update",
             "job_id": job_id,
             "data": status,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
         await self.broadcast_to_topic("jobs", message)
     
@@ -129,6 +199,7 @@ class WebSocketManager:
         """Get WebSocket connection statistics"""
         return {
             "active_connections": len(self.active_connections),
+            "msgpack_connections": len(self._msgpack_clients),
             "topics": list(self.subscriptions.keys()),
             "subscriptions_by_topic": {
                 topic: len(subs) for topic, subs in self.subscriptions.items()
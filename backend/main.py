@@ -1,10 +1,17 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import router as api_router
+from app.api import router as api_router, graphql_resolver
+from app.monitor import warm_up as warm_up_monitor
 from app.core import init_constraints
 from app.websocket_manager import ws_manager
+from app.etag import ETagMiddleware
 import json
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 app = FastAPI(
     title="EthGuardian AI",
     description="AI-Powered Ethereum AML & Forensics Platform",
@@ -27,16 +34,60 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ETag + 304 nos GETs da API (o SDK revalida com If-None-Match)
+app.add_middleware(ETagMiddleware)
+
 @app.on_event("startup")
 def on_startup():
     # Cria constraints idempotentes
     init_constraints()
+    # Pré-planeja as consultas quentes (EXPLAIN) para o cache de planos
+    graphql_resolver.warm_up()
+    warm_up_monitor()
 
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
 
+# Static pong frame, serialized once
+_PONG_FRAME = json.dumps({"type": "pong", "message": "pong"})
+
+
+async def _ws_subscribe(websocket: WebSocket, message: dict):
+    topic = message.get("topic")
+    if topic:
+        ws_manager.subscribe(websocket, topic)
+        await ws_manager.send_personal_message({
+            "type": "subscription",
+            "message": f"Subscribed to {topic}",
+            "topic": topic
+        }, websocket)
+
+
+async def _ws_unsubscribe(websocket: WebSocket, message: dict):
+    topic = message.get("topic")
+    if topic:
+        ws_manager.unsubscribe(websocket, topic)
+        await ws_manager.send_personal_message({
+            "type": "unsubscription",
+            "message": f"Unsubscribed from {topic}",
+            "topic": topic
+        }, websocket)
+
+
+async def _ws_ping(websocket: WebSocket, message: dict):
+    await websocket.send_text(_PONG_FRAME)
+
+
+# Client action -> handler
+_WS_HANDLERS = {
+    "subscribe": _ws_subscribe,
+    "unsubscribe": _ws_unsubscribe,
+    "ping": _ws_ping,
+}
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -50,44 +101,38 @@ async def websocket_endpoint(websocket: WebSocket):
     - address_{address}: Receive updates for specific address
     
     Send message: {"action": "subscribe", "topic": "alerts"}
+    
+    Connect with ?encoding=msgpack to receive MessagePack binary frames
+    instead of JSON text (client commands are still JSON text).
     """
     await ws_manager.connect(websocket)
     try:
         while True:
             # Receive messages from client
             data = await websocket.receive_text()
-            message = json.loads(data)
-            
-            action = message.get("action")
-            
-            if action == "subscribe":
-                topic = message.get("topic")
-                if topic:
-                    ws_manager.subscribe(websocket, topic)
-                    await ws_manager.send_personal_message({
-                        "type": "subscription",
-                        "message": f"Subscribed to {topic}",
-                        "topic": topic
-                    }, websocket)
+            message = _json_loads(data)
             
-            elif action == "unsubscribe":
-                topic = message.get("topic")
-                if topic:
-                    ws_manager.unsubscribe(websocket, topic)
-                    await ws_manager.send_personal_message({
-                        "type": "unsubscription",
-                        "message": f"Unsubscribed from {topic}",
-                        "topic": topic
-                    }, websocket)
-            
-            elif action == "ping":
-                await ws_manager.send_personal_message({
-                    "type": "pong",
-                    "message": "pong"
-                }, websocket)
+            handler = _WS_HANDLERS.get(message.get("action"))
+            if handler is not None:
+                await handler(websocket, message)
     
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket)
 
 
 app.include_router(api_router, prefix="")
+
+
+if __name__ == "__main__":
+    import os
+    import uvicorn
+    
+    # libuv event loop and C HTTP parser (both ship with uvicorn[standard])
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8001")),
+        loop="uvloop",
+        http="httptools",
+        ws="websockets"
+    )
@@ -3,8 +3,23 @@ EthGuardian Python SDK
 AI-Powered Ethereum AML & Forensics Platform
 """
 
-from .client import EthGuardianClient
-
 __version__ = "1.0.0"
-__all__ = ["EthGuardianClient"]
+__all__ = ["EthGuardianClient", "AsyncEthGuardianClient"]
+
 
+def __getattr__(name):
+    # Clients are imported on first access, so ethguardian.cli starts without requests/httpx
+    if name == "EthGuardianClient":
+        from .client import EthGuardianClient
+        globals()[name] = EthGuardianClient
+    elif name in ("AsyncEthGuardianClient", "ASYNC_AVAILABLE"):
+        try:
+            from .async_client import AsyncEthGuardianClient
+        except ImportError:
+            # Needs the "async" extra (httpx)
+            AsyncEthGuardianClient = None
+        globals().update(AsyncEthGuardianClient=AsyncEthGuardianClient,
+                         ASYNC_AVAILABLE=AsyncEthGuardianClient is not None)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals()[name]
@@ -0,0 +1,222 @@
+"""
+EthGuardian Async API Client
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, AsyncIterator
+
+import httpx
+
+from .client import (
+    EthGuardianClient, _json_loads, _bulk_request_body, _decode_bulk, BULK_ACCEPT,
+    _AUDIT_CALLS, IJSON_AVAILABLE, STREAM_CHUNK_SIZE
+)
+
+if IJSON_AVAILABLE:
+    import ijson
+
+
+class _AsyncReader:
+    """Async file-like view of an httpx byte stream (what ijson.items_async reads from)"""
+    
+    __slots__ = ("_chunks",)
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to tell bytes from str; that must not consume a chunk
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class AsyncEthGuardianClient(EthGuardianClient):
+    """
+    Async variant of EthGuardianClient on a pooled HTTP/2 httpx connection.
+    
+    Every endpoint method of EthGuardianClient is available and returns an
+    awaitable, e.g. ``await client.analyze(address)``.
+    get_graph_iter returns an async iterator instead (``async for node in ...``).
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, base_url: str = "http://localhost:8000", api_key: Optional[str] = None,
+                 max_connections: int = 100, max_keepalive_connections: int = 20):
+        """
+        Initialize async EthGuardian client
+        
+        Args:
+            base_url: Base URL of the API
+            api_key: Optional API key for authentication
+            max_connections: Connection pool size
+            max_keepalive_connections: Idle connections kept open for reuse
+        """
+        self.base_url = base_url.rstrip("/")
+        self._api_prefix = self.base_url + "/api"
+        self.api_key = api_key
+        
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        self.session = httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+        
+        # GETs are not revalidated here; the empty cache keeps the inherited clear_cache() working
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        await self.session.aclose()
+    
+    async def _request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                       data: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make request and return the decoded JSON body"""
+        response = await self.session.request(method, self._api_prefix + endpoint, params=params, json=data)
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def _get(self, endpoint: str, params: Optional[Dict] = None):
+        """Make GET request (awaitable)"""
+        return self._request("GET", endpoint, params=params)
+    
+    # httpx buffers the body itself; large GETs need no separate streaming path
+    _get_streaming = _get
+    
+    async def _iter_items(self, endpoint: str, prefix: str,
+                          params: Optional[Dict] = None) -> AsyncIterator[Any]:
+        """Yield the elements of one array in a JSON response as they are parsed (async for)"""
+        async with self.session.stream("GET", self._api_prefix + endpoint, params=params) as response:
+            response.raise_for_status()
+            chunks = response.aiter_bytes(STREAM_CHUNK_SIZE)
+            if IJSON_AVAILABLE:
+                async for item in ijson.items_async(_AsyncReader(chunks), f"{prefix}.item"):
+                    yield item
+            else:
+                body = _json_loads(b"".join([chunk async for chunk in chunks]))
+                for item in body.get(prefix, []):
+                    yield item
+    
+    async def full_audit(self, address: str) -> Dict[str, Any]:
+        """Run analysis, pattern, fraud, mixer and compliance checks concurrently"""
+        results = await asyncio.gather(*(getattr(self, method)(address) for _, method in _AUDIT_CALLS))
+        return {key: result for (key, _), result in zip(_AUDIT_CALLS, results)}
+    
+    async def bulk_analyze_fast(self, addresses: List[str], max_workers: int = 5):
+        """Analyze multiple addresses, decoding the results into typed structs (needs msgspec)"""
+        body = _bulk_request_body(addresses, max_workers)
+        response = await self.session.post(
+            self._api_prefix + "/bulk/analyze",
+            content=body,
+            headers={"Content-Type": "application/json", "Accept": BULK_ACCEPT}
+        )
+        response.raise_for_status()
+        return _decode_bulk(response)
+    
+    async def analyze_many(self, addresses: List[str], max_workers: int = 5) -> Dict[str, Any]:
+        """
+        Analyze multiple addresses concurrently from the client side, with at
+        most max_workers requests in flight (no server-side bulk endpoint needed)
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def analyze_one(address: str):
+            async with semaphore:
+                return await self.analyze(address)
+        
+        results = await asyncio.gather(
+            *(analyze_one(address) for address in addresses),
+            return_exceptions=True
+        )
+        
+        successful = {}
+        failed = {}
+        for address, result in zip(addresses, results):
+            if isinstance(result, Exception):
+                failed[address] = str(result)
+            else:
+                successful[address] = result
+        
+        return {
+            "total": len(addresses),
+            "successful": len(successful),
+            "failed": len(failed),
+            "results": successful,
+            "errors": failed
+        }
+    
+    if TYPE_CHECKING:
+        # The endpoint methods inherited from EthGuardianClient return awaitables here
+        
+        # Core Analysis Methods
+        async def ingest(self, address: str) -> Dict[str, Any]: ...
+        async def analyze(self, address: str) -> Dict[str, Any]: ...
+        async def get_profile(self, address: str) -> Dict[str, Any]: ...
+        async def get_graph(self, address: str) -> Dict[str, Any]: ...
+        async def get_alerts(self) -> List[Dict[str, Any]]: ...
+        
+        # Pattern Detection
+        async def detect_patterns(self, address: str) -> Dict[str, Any]: ...
+        async def detect_layering(self, address: str) -> Dict[str, Any]: ...
+        async def detect_peel_chains(self, address: str) -> Dict[str, Any]: ...
+        async def detect_wash_trading(self, address: str) -> Dict[str, Any]: ...
+        
+        # Fraud Detection
+        async def detect_fraud(self, address: str) -> Dict[str, Any]: ...
+        async def detect_rug_pull(self, address: str) -> Dict[str, Any]: ...
+        async def detect_ponzi(self, address: str) -> Dict[str, Any]: ...
+        async def detect_phishing(self, address: str) -> Dict[str, Any]: ...
+        async def detect_mev_bot(self, address: str) -> Dict[str, Any]: ...
+        
+        # Advanced Detection
+        async def detect_mixer_usage(self, address: str) -> Dict[str, Any]: ...
+        async def analyze_smart_contracts(self, address: str) -> Dict[str, Any]: ...
+        async def analyze_token_holdings(self, address: str) -> Dict[str, Any]: ...
+        async def detect_bridge_usage(self, address: str) -> Dict[str, Any]: ...
+        async def analyze_all_advanced(self, address: str) -> Dict[str, Any]: ...
+        
+        # NFT Fraud
+        async def detect_nft_wash_trading(self, address: str) -> Dict[str, Any]: ...
+        async def detect_fake_collection(self, contract: str) -> Dict[str, Any]: ...
+        async def track_stolen_nft(self, contract: str, token_id: str) -> Dict[str, Any]: ...
+        
+        # Machine Learning
+        async def detect_anomalies_ml(self, address: str) -> Dict[str, Any]: ...
+        async def deep_pattern_recognition(self, address: str) -> Dict[str, Any]: ...
+        
+        # Cross-Chain
+        async def correlate_addresses(self, address: str) -> Dict[str, Any]: ...
+        async def assess_multi_chain_risk(self, address: str) -> Dict[str, Any]: ...
+        
+        # Compliance
+        async def check_compliance(self, address: str) -> Dict[str, Any]: ...
+        
+        # Watchlist
+        async def get_watchlist(self) -> Dict[str, Any]: ...
+        async def remove_from_watchlist(self, address: str) -> Dict[str, Any]: ...
+        async def start_watchlist_monitoring(self) -> Dict[str, Any]: ...
+        async def stop_watchlist_monitoring(self) -> Dict[str, Any]: ...
+        
+        # Graph Tools
+        async def detect_community(self, address: str) -> Dict[str, Any]: ...
+        
+        # Webhooks
+        async def get_user_webhooks(self, user_id: str) -> Dict[str, Any]: ...
+        async def test_webhook(self, webhook_id: str) -> Dict[str, Any]: ...
@@ -0,0 +1,659 @@
+"""
+EthGuardian CLI Tool
+Command-line interface for EthGuardian AML Platform
+
+Installed as the ``ethguardian-cli`` console script; the client itself is
+imported only once a command runs.
+"""
+
+import os
+import re
+import sys
+import argparse
+
+
+try:
+    import orjson
+    
+    def dump_json(data):
+        """Pretty-printed JSON as UTF-8 bytes"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+except ImportError:
+    import json
+    
+    def dump_json(data):
+        """Pretty-printed JSON as UTF-8 bytes"""
+        return json.dumps(data, indent=2, sort_keys=True).encode('utf-8')
+
+
+def format_json(data):
+    """Pretty print JSON"""
+    return dump_json(data).decode('utf-8')
+
+
+def write_json(data, stream=None):
+    """Write pretty-printed JSON to stdout, as bytes when the stream allows it"""
+    stream = stream or sys.stdout
+    payload = dump_json(data) + b"\n"
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is None:
+        # Text-only streams, e.g. captured output while serving as a daemon
+        stream.write(payload.decode('utf-8'))
+        return
+    
+    # One write and one flush, skipping print's decode/encode round-trip
+    stream.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
+# 0x followed by 40 hex digits
+_ETH_RE = re.compile(r'0x[0-9a-fA-F]{40}')
+
+
+def eth_address(value):
+    """argparse type: reject malformed addresses before any request is made"""
+    if _ETH_RE.fullmatch(value) is None:
+        raise argparse.ArgumentTypeError(f"invalid Ethereum address: {value!r} (expected 0x + 40 hex digits)")
+    return value
+
+
+def run_concurrently(tasks):
+    """Run independent client calls in parallel; returns {name: result}"""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # The client's requests.Session pools connections, so the calls overlap their round-trips
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {name: executor.submit(call) for name, call in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _build_ingest_parser(subparsers):
+    """Ingest command"""
+    ingest_parser = subparsers.add_parser('ingest', help='Ingest address data')
+    ingest_parser.add_argument('address', type=eth_address, help='Ethereum address')
+
+
+def _build_analyze_parser(subparsers):
+    """Analyze command"""
+    analyze_parser = subparsers.add_parser('analyze', help='Analyze address')
+    analyze_parser.add_argument('address', type=eth_address, help='Ethereum address')
+
+
+def _build_audit_parser(subparsers):
+    """Audit command"""
+    audit_parser = subparsers.add_parser('audit', help='Full audit (analysis, patterns, fraud, mixer, compliance)')
+    audit_parser.add_argument('address', type=eth_address, help='Ethereum address')
+
+
+def _build_profile_parser(subparsers):
+    """Profile command"""
+    profile_parser = subparsers.add_parser('profile', help='Get address profile')
+    profile_parser.add_argument('address', type=eth_address, help='Ethereum address')
+
+
+def _build_graph_parser(subparsers):
+    """Graph command"""
+    graph_parser = subparsers.add_parser('graph', help='Get transaction graph')
+    graph_parser.add_argument('address', type=eth_address, help='Ethereum address')
+
+
+def _build_alerts_parser(subparsers):
+    """Alerts command"""
+    subparsers.add_parser('alerts', help='List all alerts')
+
+
+def _build_patterns_parser(subparsers):
+    """Patterns command"""
+    patterns_parser = subparsers.add_parser('patterns', help='Detect patterns')
+    patterns_parser.add_argument('address', type=eth_address, help='Ethereum address')
+    patterns_parser.add_argument('--type', choices=['layering', 'peel-chains', 'wash-trading', 'all'],
+                                default='all', help='Pattern type')
+
+
+def _build_fraud_parser(subparsers):
+    """Fraud command"""
+    fraud_parser = subparsers.add_parser('fraud', help='Detect fraud')
+    fraud_parser.add_argument('address', type=eth_address, help='Ethereum address')
+    fraud_parser.add_argument('--type', choices=['rug-pull', 'ponzi', 'phishing', 'mev-bot', 'all'],
+                             default='all', help='Fraud type')
+
+
+def _build_mixer_parser(subparsers):
+    """Mixer command"""
+    mixer_parser = subparsers.add_parser('mixer', help='Detect mixer usage')
+    mixer_parser.add_argument('address', type=eth_address, help='Ethereum address')
+
+
+def _build_nft_parser(subparsers):
+    """NFT command"""
+    nft_parser = subparsers.add_parser('nft', help='NFT fraud detection')
+    nft_parser.add_argument('--wash-trading', metavar='ADDRESS', type=eth_address, help='Detect wash trading')
+    nft_parser.add_argument('--fake-collection', metavar='CONTRACT', type=eth_address, help='Detect fake collection')
+    nft_parser.add_argument('--stolen', nargs=2, metavar=('CONTRACT', 'TOKEN_ID'),
+                           help='Track stolen NFT')
+
+
+def _build_ml_parser(subparsers):
+    """ML command"""
+    ml_parser = subparsers.add_parser('ml', help='Machine learning analysis')
+    ml_parser.add_argument('address', type=eth_address, help='Ethereum address')
+    ml_parser.add_argument('--type', choices=['lstm', 'autoencoder', 'deep-pattern', 'all'],
+                          default='all', help='ML analysis type')
+
+
+def _build_cross_chain_parser(subparsers):
+    """Cross-chain command"""
+    cross_chain_parser = subparsers.add_parser('cross-chain', help='Cross-chain analysis')
+    cross_chain_parser.add_argument('address', type=eth_address, help='Ethereum address')
+    cross_chain_parser.add_argument('--type', choices=['movement', 'correlation', 'risk', 'all'],
+                                    default='all', help='Analysis type')
+
+
+def _build_watchlist_parser(subparsers):
+    """Watchlist command"""
+    watchlist_parser = subparsers.add_parser('watchlist', help='Manage watchlist')
+    watchlist_parser.add_argument('--add', metavar='ADDRESS', type=eth_address, help='Add to watchlist')
+    watchlist_parser.add_argument('--remove', metavar='ADDRESS', type=eth_address, help='Remove from watchlist')
+    watchlist_parser.add_argument('--list', action='store_true', help='List watchlist')
+    watchlist_parser.add_argument('--reason', help='Reason for adding (required with --add)')
+    watchlist_parser.add_argument('--added-by', help='Added by (required with --add)')
+    watchlist_parser.add_argument('--start', action='store_true', help='Start monitoring')
+    watchlist_parser.add_argument('--stop', action='store_true', help='Stop monitoring')
+
+
+def _build_bulk_parser(subparsers):
+    """Bulk analyze command"""
+    bulk_parser = subparsers.add_parser('bulk', help='Bulk analyze addresses')
+    bulk_parser.add_argument('addresses', nargs='+', type=eth_address, help='Ethereum addresses')
+    bulk_parser.add_argument('--workers', type=int, default=5, help='Number of workers')
+    bulk_parser.add_argument('--local', action='store_true',
+                            help='Fan out from the client (async, HTTP/2) instead of the bulk endpoint')
+
+
+def _build_case_parser(subparsers):
+    """Case command"""
+    case_parser = subparsers.add_parser('case', help='Case management')
+    case_parser.add_argument('--create', action='store_true', help='Create case')
+    case_parser.add_argument('--get', metavar='CASE_ID', help='Get case')
+    case_parser.add_argument('--list', metavar='USER', help='List user cases')
+    case_parser.add_argument('--title', help='Case title (for create)')
+    case_parser.add_argument('--address', type=eth_address, help='Address (for create)')
+    case_parser.add_argument('--type', help='Case type (for create)')
+    case_parser.add_argument('--priority', help='Priority (for create)')
+    case_parser.add_argument('--assigned-to', help='Assigned to (for create)')
+    case_parser.add_argument('--created-by', help='Created by (for create)')
+    case_parser.add_argument('--user-role', default='analyst', help='User role')
+
+
+def _build_compliance_parser(subparsers):
+    """Compliance command"""
+    compliance_parser = subparsers.add_parser('compliance', help='Compliance reports')
+    compliance_parser.add_argument('address', type=eth_address, help='Ethereum address')
+    compliance_parser.add_argument('--sar', action='store_true', help='Generate SAR')
+    compliance_parser.add_argument('--ctr', action='store_true', help='Generate CTR')
+    compliance_parser.add_argument('--check', action='store_true', help='Check compliance')
+    compliance_parser.add_argument('--analyst', help='Analyst name')
+    compliance_parser.add_argument('--findings', help='Findings (for SAR)')
+    compliance_parser.add_argument('--amount', type=float, help='Amount (for CTR)')
+
+
+def _build_report_parser(subparsers):
+    """Report command"""
+    report_parser = subparsers.add_parser('report', help='Generate reports')
+    report_parser.add_argument('address', type=eth_address, help='Ethereum address')
+    report_parser.add_argument('--format', choices=['pdf', 'excel', 'html', 'json'],
+                              default='pdf', help='Report format')
+
+
+# Subcommand -> builder, in help order
+_SUBPARSER_BUILDERS = {
+    'ingest': _build_ingest_parser,
+    'analyze': _build_analyze_parser,
+    'audit': _build_audit_parser,
+    'profile': _build_profile_parser,
+    'graph': _build_graph_parser,
+    'alerts': _build_alerts_parser,
+    'patterns': _build_patterns_parser,
+    'fraud': _build_fraud_parser,
+    'mixer': _build_mixer_parser,
+    'nft': _build_nft_parser,
+    'ml': _build_ml_parser,
+    'cross-chain': _build_cross_chain_parser,
+    'watchlist': _build_watchlist_parser,
+    'bulk': _build_bulk_parser,
+    'case': _build_case_parser,
+    'compliance': _build_compliance_parser,
+    'report': _build_report_parser
+}
+
+# Global options that take a value
+_VALUE_OPTIONS = frozenset({'--url', '--api-key'})
+
+
+def _sniff_subcommand(argv):
+    """
+    First positional token of argv (the subcommand), skipping global options
+    and their values. None when a top-level -h/--help comes first.
+    """
+    skip = False
+    for token in argv:
+        if skip:
+            skip = False
+        elif token in _VALUE_OPTIONS:
+            skip = True
+        elif token in ('-h', '--help'):
+            return None
+        elif not token.startswith('-'):
+            return token
+    return None
+
+
+# Clients reused across commands when serving as a daemon: (url, api_key) -> client
+_CLIENTS = {}
+
+
+def get_client(url, api_key):
+    """EthGuardianClient for url/api_key (imported and created on first use)"""
+    client = _CLIENTS.get((url, api_key))
+    if client is None:
+        # Deferred so --help and argument errors don't pay for importing requests
+        from ethguardian import EthGuardianClient
+        client = _CLIENTS[(url, api_key)] = EthGuardianClient(base_url=url, api_key=api_key, warm=False)
+    return client
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = argparse.ArgumentParser(
+        description='EthGuardian CLI - AI-Powered Ethereum AML & Forensics',
+        epilog='Run with --daemon (alone) to keep a warm background process; '
+               'later invocations are forwarded to it automatically.'
+    )
+    
+    parser.add_argument('--url', default='http://localhost:8000',
+                       help='API base URL (default: http://localhost:8000)')
+    parser.add_argument('--api-key', help='API key for authentication')
+    
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+    
+    # Only the invoked subcommand's parser is built; help, typos and missing
+    # commands fall back to building all of them
+    builder = _SUBPARSER_BUILDERS.get(_sniff_subcommand(argv))
+    if builder is not None:
+        builder(subparsers)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
+    
+    args = parser.parse_args(argv)
+    
+    # --stolen takes CONTRACT TOKEN_ID, so its contract is checked here
+    if getattr(args, 'stolen', None) and _ETH_RE.fullmatch(args.stolen[0]) is None:
+        parser.error(f"argument --stolen: invalid Ethereum address: {args.stolen[0]!r}")
+    
+    if not args.command:
+        parser.print_help()
+        return 1
+    
+    # Initialize client
+    client = get_client(args.url, args.api_key)
+    
+    try:
+        # Execute command
+        result = None
+        
+        if args.command == 'ingest':
+            result = client.ingest(args.address)
+        
+        elif args.command == 'analyze':
+            result = client.analyze(args.address)
+        
+        elif args.command == 'audit':
+            result = client.full_audit(args.address)
+        
+        elif args.command == 'profile':
+            result = client.get_profile(args.address)
+        
+        elif args.command == 'graph':
+            result = client.get_graph(args.address)
+        
+        elif args.command == 'alerts':
+            result = client.get_alerts()
+        
+        elif args.command == 'patterns':
+            if args.type == 'all':
+                result = client.detect_patterns(args.address)
+            elif args.type == 'layering':
+                result = client.detect_layering(args.address)
+            elif args.type == 'peel-chains':
+                result = client.detect_peel_chains(args.address)
+            elif args.type == 'wash-trading':
+                result = client.detect_wash_trading(args.address)
+        
+        elif args.command == 'fraud':
+            if args.type == 'all':
+                result = client.detect_fraud(args.address)
+            elif args.type == 'rug-pull':
+                result = client.detect_rug_pull(args.address)
+            elif args.type == 'ponzi':
+                result = client.detect_ponzi(args.address)
+            elif args.type == 'phishing':
+                result = client.detect_phishing(args.address)
+            elif args.type == 'mev-bot':
+                result = client.detect_mev_bot(args.address)
+        
+        elif args.command == 'mixer':
+            result = client.detect_mixer_usage(args.address)
+        
+        elif args.command == 'nft':
+            if args.wash_trading:
+                result = client.detect_nft_wash_trading(args.wash_trading)
+            elif args.fake_collection:
+                result = client.detect_fake_collection(args.fake_collection)
+            elif args.stolen:
+                result = client.track_stolen_nft(args.stolen[0], args.stolen[1])
+        
+        elif args.command == 'ml':
+            if args.type == 'all':
+                result = run_concurrently({
+                    'lstm': lambda: client.predict_future_risk(args.address),
+                    'autoencoder': lambda: client.detect_anomalies_ml(args.address),
+                    'deep_pattern': lambda: client.deep_pattern_recognition(args.address)
+                })
+            elif args.type == 'lstm':
+                result = client.predict_future_risk(args.address)
+            elif args.type == 'autoencoder':
+                result = client.detect_anomalies_ml(args.address)
+            elif args.type == 'deep-pattern':
+                result = client.deep_pattern_recognition(args.address)
+        
+        elif args.command == 'cross-chain':
+            if args.type == 'all':
+                result = run_concurrently({
+                    'movement': lambda: client.detect_cross_chain_movement(args.address),
+                    'correlation': lambda: client.correlate_addresses(args.address),
+                    'risk': lambda: client.assess_multi_chain_risk(args.address)
+                })
+            elif args.type == 'movement':
+                result = client.detect_cross_chain_movement(args.address)
+            elif args.type == 'correlation':
+                result = client.correlate_addresses(args.address)
+            elif args.type == 'risk':
+                result = client.assess_multi_chain_risk(args.address)
+        
+        elif args.command == 'watchlist':
+            if args.add:
+                if not args.reason or not args.added_by:
+                    print("Error: --reason and --added-by required with --add")
+                    return 1
+                result = client.add_to_watchlist(args.add, args.reason, args.added_by)
+            elif args.remove:
+                result = client.remove_from_watchlist(args.remove)
+            elif args.list:
+                result = client.get_watchlist()
+            elif args.start:
+                result = client.start_watchlist_monitoring()
+            elif args.stop:
+                result = client.stop_watchlist_monitoring()
+        
+        elif args.command == 'bulk':
+            if args.local:
+                import asyncio
+                from ethguardian import AsyncEthGuardianClient
+                if AsyncEthGuardianClient is None:
+                    print("Error: --local requires the async extra (pip install ethguardian[async])")
+                    return 1
+                
+                async def analyze_local():
+                    async with AsyncEthGuardianClient(base_url=args.url, api_key=args.api_key) as async_client:
+                        return await async_client.analyze_many(args.addresses, args.workers)
+                
+                result = asyncio.run(analyze_local())
+            else:
+                result = client.bulk_analyze(args.addresses, args.workers)
+        
+        elif args.command == 'case':
+            if args.create:
+                if not all([args.title, args.address, args.type, args.priority,
+                           args.assigned_to, args.created_by]):
+                    print("Error: All fields required for case creation")
+                    return 1
+                result = client.create_case(
+                    args.title, args.address, args.type, args.priority,
+                    args.assigned_to, args.created_by
+                )
+            elif args.get:
+                result = client.get_case(args.get, 'cli_user', args.user_role)
+            elif args.list:
+                result = client.get_user_cases(args.list, args.user_role)
+        
+        elif args.command == 'compliance':
+            if args.check:
+                result = client.check_compliance(args.address)
+            elif args.sar:
+                if not args.analyst or not args.findings:
+                    print("Error: --analyst and --findings required for SAR")
+                    return 1
+                result = client.generate_sar(args.address, args.analyst, args.findings)
+            elif args.ctr:
+                if not args.analyst or not args.amount:
+                    print("Error: --analyst and --amount required for CTR")
+                    return 1
+                result = client.generate_ctr(args.address, args.amount, args.analyst)
+        
+        elif args.command == 'report':
+            if args.format == 'pdf':
+                result = client.generate_pdf_report(args.address)
+            elif args.format == 'excel':
+                result = client.generate_excel_report(args.address)
+        
+        # Print result
+        if result:
+            write_json(result)
+            return 0
+        else:
+            print("No result returned")
+            return 1
+    
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+# ============================================================================
+# DAEMON MODE - a warm process that runs commands forwarded over a Unix socket
+# ============================================================================
+
+def _socket_path():
+    """Per-user socket path: $XDG_RUNTIME_DIR, else a private (0700) directory in the temp dir"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'ethguardian.sock')
+    import tempfile
+    return os.path.join(tempfile.gettempdir(), f'ethguardian-{os.getuid()}', 'ethguardian.sock')
+
+
+def _private_dir(path):
+    """True when path is a directory (not a symlink) owned by this user that nobody else can write"""
+    import stat
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and not info.st_mode & 0o022
+
+
+def _own_socket(path):
+    """True when path is a socket (not a symlink) owned by this user, in a private directory"""
+    import stat
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid() and _private_dir(os.path.dirname(path))
+
+
+def _peer_is_user(sock):
+    """The process on the other end runs as this user (SO_PEERCRED where the platform has it)"""
+    import socket
+    import struct
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return True
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    return struct.unpack('3i', creds)[1] == os.getuid()
+
+
+def _send_frame(sock, payload):
+    """Write one length-prefixed JSON frame"""
+    import json
+    import struct
+    data = json.dumps(payload).encode('utf-8')
+    sock.sendall(struct.pack('!I', len(data)) + data)
+
+
+def _recv_frame(sock):
+    """Read one length-prefixed JSON frame (None if the peer closed)"""
+    import json
+    import struct
+    header = _recv_exact(sock, 4)
+    if header is None:
+        return None
+    data = _recv_exact(sock, struct.unpack('!I', header)[0])
+    return None if data is None else json.loads(data)
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def forward_to_daemon(argv):
+    """Run argv in a running daemon; returns the exit code, or None when no daemon is up"""
+    import socket
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    
+    # argv can carry --api-key: only talk to a socket this user owns, served by this user
+    path = _socket_path()
+    if not _own_socket(path):
+        return None
+    
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    if not _peer_is_user(sock):
+        sock.close()
+        return None
+    
+    with sock:
+        _send_frame(sock, {'argv': argv})
+        reply = _recv_frame(sock)
+    if reply is None:
+        return None
+    
+    sys.stdout.write(reply['stdout'])
+    sys.stderr.write(reply['stderr'])
+    return reply['code']
+
+
+def serve_daemon():
+    """Serve forwarded commands until interrupted, keeping imports and sessions warm"""
+    import io
+    import signal
+    import socket
+    from contextlib import redirect_stdout, redirect_stderr
+    
+    # Pay the SDK import once, up front
+    from ethguardian import EthGuardianClient  # noqa: F401
+    
+    path = _socket_path()
+    directory = os.path.dirname(path)
+    if not os.environ.get('XDG_RUNTIME_DIR'):
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+    if not _private_dir(directory):
+        print(f"Error: {directory} must be a directory owned by you and writable only by you",
+              file=sys.stderr)
+        return 1
+    
+    if os.path.lexists(path):
+        if not _own_socket(path):
+            print(f"Error: {path} exists and is not your socket; not replacing it", file=sys.stderr)
+            return 1
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)  # stale socket left by a daemon that died
+        else:
+            print(f"Error: a daemon is already listening on {path}", file=sys.stderr)
+            return 1
+        finally:
+            probe.close()
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket only accessible by this user
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    # Clean up the socket file on SIGTERM too
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"EthGuardian CLI daemon listening on {path}", file=sys.stderr)
+    
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                request = _recv_frame(conn)
+                if request is None:
+                    continue
+                
+                # Commands run one at a time: stdout/stderr are captured per command
+                out, err = io.StringIO(), io.StringIO()
+                with redirect_stdout(out), redirect_stderr(err):
+                    try:
+                        code = main(request['argv'])
+                    except SystemExit as e:  # argparse help/usage errors
+                        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                _send_frame(conn, {'code': code, 'stdout': out.getvalue(), 'stderr': err.getvalue()})
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def run(argv=None):
+    """Entry point: --daemon serves, otherwise forward to a daemon if one is running"""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if argv == ['--daemon']:
+        return serve_daemon()
+    
+    code = forward_to_daemon(argv)
+    if code is None:
+        code = main(argv)
+    return code
+
+
+if __name__ == '__main__':
+    sys.exit(run())
+
@@ -3,178 +3,248 @@ EthGuardian API Client
 """
 
 import requests
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from string import Formatter
+from inspect import Parameter, Signature
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Iterator
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    # bulk_analyze_fast needs the "fast" extra; bulk_analyze works without it
+    MSGSPEC_AVAILABLE = False
+
+# Bytes read per chunk when streaming large responses
+STREAM_CHUNK_SIZE = 65536
+
+# Keep-alive pool for bursts of calls to the same API host (bulk runs, CLI fan-outs)
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Seconds the background connection warm-up may take
+WARM_UP_TIMEOUT = 2
+
+# Max GET responses kept for conditional revalidation
+CACHE_SIZE = 1024
+
+# Independent checks run together by full_audit: result key -> client method
+_AUDIT_CALLS = (
+    ("analysis", "analyze"),
+    ("patterns", "detect_patterns"),
+    ("fraud", "detect_fraud"),
+    ("mixer", "detect_mixer_usage"),
+    ("compliance", "check_compliance"),
+)
+
+# Bulk results as MessagePack, JSON when the server can't send it
+BULK_ACCEPT = "application/x-msgpack, application/json;q=0.5"
+
+if MSGSPEC_AVAILABLE:
+    class BulkAnalyzeRequest(msgspec.Struct):
+        """Body of POST /bulk/analyze"""
+        addresses: List[str]
+        max_workers: int = 5
+    
+    class BulkAnalysisItem(msgspec.Struct):
+        """Quick analysis of one address"""
+        address: str
+        status: str
+        risk_score: Optional[float] = None
+        layering_detected: bool = False
+        wash_trading_detected: bool = False
+        phishing_detected: bool = False
+        error: Optional[str] = None
+    
+    class BulkAnalyzeResult(msgspec.Struct):
+        """Response of POST /bulk/analyze"""
+        total_addresses: int
+        analyzed: int
+        errors: int
+        high_risk_count: int
+        duration_seconds: float
+        addresses_per_second: float
+        results: List[BulkAnalysisItem]
+        ok: bool = True
+    
+    _BULK_MSGPACK_DECODER = msgspec.msgpack.Decoder(BulkAnalyzeResult)
+    _BULK_JSON_DECODER = msgspec.json.Decoder(BulkAnalyzeResult)
+    _JSON_ENCODER = msgspec.json.Encoder()
+
+
+def _bulk_request_body(addresses: List[str], max_workers: int) -> bytes:
+    """Encoded bulk request (raises ImportError without msgspec)"""
+    if not MSGSPEC_AVAILABLE:
+        raise ImportError("bulk_analyze_fast requires msgspec (pip install ethguardian[fast])")
+    return _JSON_ENCODER.encode(BulkAnalyzeRequest(addresses, max_workers))
+
+
+def _decode_bulk(response) -> "BulkAnalyzeResult":
+    """Decode a bulk response into BulkAnalyzeResult, whichever format the server picked"""
+    if response.headers.get("Content-Type", "").startswith("application/x-msgpack"):
+        return _BULK_MSGPACK_DECODER.decode(response.content)
+    return _BULK_JSON_DECODER.decode(response.content)
+
+
+def _check(response: requests.Response) -> None:
+    """Raise requests.HTTPError for 4xx/5xx responses (one read and one branch on success)"""
+    code = response.status_code
+    if code < 400:
+        return
+    raise requests.HTTPError(f"{code} {response.reason} for {response.url}", response=response)
 
 
 class EthGuardianClient:
     """Python SDK for EthGuardian API"""
     
-    def __init__(self, base_url: str = "http://localhost:8000", api_key: Optional[str] = None):
+    # No per-instance __dict__; subclasses declare their own __slots__
+    __slots__ = ("base_url", "_api_prefix", "api_key", "session", "_cache", "_cache_lock")
+    
+    def __init__(self, base_url: str = "http://localhost:8000", api_key: Optional[str] = None,
+                 warm: bool = True):
         """
         Initialize EthGuardian client
         
         Args:
             base_url: Base URL of the API
             api_key: Optional API key for authentication
+            warm: Open a keep-alive connection in the background so the first call reuses it
         """
         self.base_url = base_url.rstrip("/")
+        self._api_prefix = self.base_url + "/api"
         self.api_key = api_key
         self.session = requests.Session()
         
         if api_key:
             self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+        
+        # Larger pool and retries on gateway errors (idempotent methods only, not POST)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                              raise_on_status=False)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # (endpoint, params) -> (ETag, parsed body), most recently used last
+        self._cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        if warm:
+            threading.Thread(target=self._warm_up, daemon=True).start()
+    
+    def _warm_up(self):
+        """Connect to the API ahead of the first call (failures are left to that call)"""
+        try:
+            self.session.get(self.base_url + "/health", timeout=WARM_UP_TIMEOUT).close()
+        except Exception:
+            pass
     
     def _get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make GET request"""
-        url = f"{self.base_url}/api{endpoint}"
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        """Make GET request (revalidated with If-None-Match when an ETag is cached)"""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        response = self.session.get(self._api_prefix + endpoint, params=params, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        _check(response)
+        body = _json_loads(response.content)
+        
+        # Only responses the server can revalidate are kept
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._cache_lock:
+                self._cache[key] = (etag, body)
+                self._cache.move_to_end(key)
+                if len(self._cache) > CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return body
+    
+    def _get_streaming(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """GET a large JSON body, receiving it in chunks before a single parse"""
+        with self.session.get(self._api_prefix + endpoint, params=params, stream=True) as response:
+            _check(response)
+            return _json_loads(b"".join(response.iter_content(STREAM_CHUNK_SIZE)))
+    
+    def _iter_items(self, endpoint: str, prefix: str, params: Optional[Dict] = None) -> Iterator[Any]:
+        """Yield the elements of one array in a JSON response as they are parsed"""
+        with self.session.get(self._api_prefix + endpoint, params=params, stream=True) as response:
+            _check(response)
+            if IJSON_AVAILABLE:
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, f"{prefix}.item")
+            else:
+                body = _json_loads(b"".join(response.iter_content(STREAM_CHUNK_SIZE)))
+                yield from body.get(prefix, [])
+    
+    def clear_cache(self):
+        """Forget cached GET responses"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                 data: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make a (state-changing) request and return the decoded JSON body"""
+        self.clear_cache()
+        response = self.session.request(method, self._api_prefix + endpoint, params=params, json=data)
+        _check(response)
+        return _json_loads(response.content)
     
     def _post(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """Make POST request"""
-        url = f"{self.base_url}/api{endpoint}"
-        response = self.session.post(url, json=data)
-        response.raise_for_status()
-        return response.json()
+        return self._request("POST", endpoint, data=data)
     
     def _put(self, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """Make PUT request"""
-        url = f"{self.base_url}/api{endpoint}"
-        response = self.session.put(url, json=data)
-        response.raise_for_status()
-        return response.json()
+        return self._request("PUT", endpoint, data=data)
     
     def _delete(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make DELETE request"""
-        url = f"{self.base_url}/api{endpoint}"
-        response = self.session.delete(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("DELETE", endpoint, params=params)
     
     # Core Analysis Methods
-    def ingest(self, address: str) -> Dict[str, Any]:
-        """Ingest address data from blockchain"""
-        return self._post(f"/ingest/{address}")
-    
-    def analyze(self, address: str) -> Dict[str, Any]:
-        """Run full analysis on address"""
-        return self._post(f"/analyze/{address}")
-    
-    def get_profile(self, address: str) -> Dict[str, Any]:
-        """Get address profile"""
-        return self._get(f"/profile/{address}")
-    
-    def get_graph(self, address: str) -> Dict[str, Any]:
-        """Get transaction graph"""
-        return self._get(f"/graph/{address}")
-    
-    def get_alerts(self) -> List[Dict[str, Any]]:
-        """Get all alerts"""
-        return self._get("/alerts")
-    
-    # Pattern Detection
-    def detect_patterns(self, address: str) -> Dict[str, Any]:
-        """Detect suspicious patterns"""
-        return self._get(f"/patterns/{address}")
-    
-    def detect_layering(self, address: str) -> Dict[str, Any]:
-        """Detect layering patterns"""
-        return self._get(f"/patterns/{address}/layering")
-    
-    def detect_peel_chains(self, address: str) -> Dict[str, Any]:
-        """Detect peel chain patterns"""
-        return self._get(f"/patterns/{address}/peel-chains")
-    
-    def detect_wash_trading(self, address: str) -> Dict[str, Any]:
-        """Detect wash trading"""
-        return self._get(f"/patterns/{address}/wash-trading")
-    
-    # Fraud Detection
-    def detect_fraud(self, address: str) -> Dict[str, Any]:
-        """Detect fraud patterns"""
-        return self._get(f"/fraud/{address}")
-    
-    def detect_rug_pull(self, address: str) -> Dict[str, Any]:
-        """Detect rug pull pattern"""
-        return self._get(f"/fraud/{address}/rug-pull")
-    
-    def detect_ponzi(self, address: str) -> Dict[str, Any]:
-        """Detect Ponzi scheme"""
-        return self._get(f"/fraud/{address}/ponzi")
-    
-    def detect_phishing(self, address: str) -> Dict[str, Any]:
-        """Detect phishing"""
-        return self._get(f"/fraud/{address}/phishing")
-    
-    def detect_mev_bot(self, address: str) -> Dict[str, Any]:
-        """Detect MEV bot"""
-        return self._get(f"/fraud/{address}/mev-bot")
-    
-    # Advanced Detection
-    def detect_mixer_usage(self, address: str) -> Dict[str, Any]:
-        """Detect mixer/tumbler usage"""
-        return self._get(f"/advanced/mixer/{address}")
-    
-    def analyze_smart_contracts(self, address: str) -> Dict[str, Any]:
-        """Analyze smart contract interactions"""
-        return self._get(f"/advanced/contracts/{address}")
-    
-    def analyze_token_holdings(self, address: str) -> Dict[str, Any]:
-        """Analyze token holdings"""
-        return self._get(f"/advanced/tokens/{address}")
-    
-    def detect_bridge_usage(self, address: str) -> Dict[str, Any]:
-        """Detect bridge usage"""
-        return self._get(f"/advanced/bridges/{address}")
-    
-    def analyze_all_advanced(self, address: str) -> Dict[str, Any]:
-        """Run all advanced detection"""
-        return self._get(f"/advanced/all/{address}")
-    
-    # NFT Fraud
-    def detect_nft_wash_trading(self, address: str) -> Dict[str, Any]:
-        """Detect NFT wash trading"""
-        return self._get(f"/nft/wash-trading/{address}")
-    
-    def detect_fake_collection(self, contract: str) -> Dict[str, Any]:
-        """Detect fake NFT collection"""
-        return self._get(f"/nft/fake-collection/{contract}")
-    
-    def track_stolen_nft(self, contract: str, token_id: str) -> Dict[str, Any]:
-        """Track stolen NFT"""
-        return self._get(f"/nft/stolen/{contract}/{token_id}")
+    def get_graph_iter(self, address: str, part: str = "nodes") -> Iterator[Dict[str, Any]]:
+        """Iterate over the graph's nodes (or links) without loading the whole graph"""
+        return self._iter_items(f"/graph/{address}", part)
     
     # Machine Learning
     def predict_future_risk(self, address: str, forecast_days: int = 7) -> Dict[str, Any]:
         """LSTM-based risk prediction"""
         return self._get(f"/ml/lstm/{address}", {"forecast_days": forecast_days})
     
-    def detect_anomalies_ml(self, address: str) -> Dict[str, Any]:
-        """Autoencoder anomaly detection"""
-        return self._get(f"/ml/autoencoder/{address}")
-    
     def hierarchical_clustering(self, min_addresses: int = 10) -> Dict[str, Any]:
         """Hierarchical clustering"""
         return self._get("/ml/clustering", {"min_addresses": min_addresses})
     
-    def deep_pattern_recognition(self, address: str) -> Dict[str, Any]:
-        """Deep learning pattern recognition"""
-        return self._get(f"/ml/deep-pattern/{address}")
-    
     # Cross-Chain
     def detect_cross_chain_movement(self, address: str, chain: str = "ethereum") -> Dict[str, Any]:
         """Detect cross-chain movement"""
         return self._get(f"/cross-chain/movement/{address}", {"chain": chain})
     
-    def correlate_addresses(self, address: str) -> Dict[str, Any]:
-        """Correlate addresses across chains"""
-        return self._get(f"/cross-chain/correlation/{address}")
-    
-    def assess_multi_chain_risk(self, address: str) -> Dict[str, Any]:
-        """Assess multi-chain risk"""
-        return self._get(f"/cross-chain/risk/{address}")
-    
     # Case Management
     def create_case(self, title: str, address: str, case_type: str, priority: str,
                    assigned_to: str, created_by: str, description: Optional[str] = None) -> Dict[str, Any]:
@@ -224,10 +294,6 @@ class EthGuardianClient:
         data = {"address": address, "amount": amount, "analyst": analyst}
         return self._post("/compliance/ctr", data)
     
-    def check_compliance(self, address: str) -> Dict[str, Any]:
-        """Check compliance status"""
-        return self._get(f"/compliance/check/{address}")
-    
     # Reports
     def generate_pdf_report(self, address: str) -> Dict[str, Any]:
         """Generate PDF report"""
@@ -252,28 +318,31 @@ class EthGuardianClient:
         }
         return self._post("/watchlist/add", data)
     
-    def get_watchlist(self) -> Dict[str, Any]:
-        """Get all watchlist entries"""
-        return self._get("/watchlist")
-    
-    def remove_from_watchlist(self, address: str) -> Dict[str, Any]:
-        """Remove from watchlist"""
-        return self._delete(f"/watchlist/{address}")
-    
-    def start_watchlist_monitoring(self) -> Dict[str, Any]:
-        """Start 24/7 watchlist monitoring"""
-        return self._post("/watchlist/monitoring/start")
-    
-    def stop_watchlist_monitoring(self) -> Dict[str, Any]:
-        """Stop watchlist monitoring"""
-        return self._post("/watchlist/monitoring/stop")
-    
     # Bulk Analysis
     def bulk_analyze(self, addresses: List[str], max_workers: int = 5) -> Dict[str, Any]:
         """Analyze multiple addresses in parallel"""
         data = {"addresses": addresses, "max_workers": max_workers}
         return self._post("/bulk/analyze", data)
     
+    def full_audit(self, address: str) -> Dict[str, Any]:
+        """Run analysis, pattern, fraud, mixer and compliance checks concurrently"""
+        # The pooled session lets the five round-trips overlap
+        with ThreadPoolExecutor(max_workers=len(_AUDIT_CALLS)) as executor:
+            futures = {key: executor.submit(getattr(self, method), address) for key, method in _AUDIT_CALLS}
+            return {key: future.result() for key, future in futures.items()}
+    
+    def bulk_analyze_fast(self, addresses: List[str], max_workers: int = 5) -> "BulkAnalyzeResult":
+        """Analyze multiple addresses, decoding the results into typed structs (needs msgspec)"""
+        body = _bulk_request_body(addresses, max_workers)
+        self.clear_cache()
+        response = self.session.post(
+            self._api_prefix + "/bulk/analyze",
+            data=body,
+            headers={"Content-Type": "application/json", "Accept": BULK_ACCEPT}
+        )
+        _check(response)
+        return _decode_bulk(response)
+    
     # Graph Tools
     def shortest_path(self, from_address: str, to_address: str) -> Dict[str, Any]:
         """Find shortest path between addresses"""
@@ -285,10 +354,6 @@ class EthGuardianClient:
         params = {"address1": address1, "address2": address2}
         return self._get("/graph/common-neighbors", params)
     
-    def detect_community(self, address: str) -> Dict[str, Any]:
-        """Detect community/cluster"""
-        return self._get(f"/graph/community/{address}")
-    
     # Webhooks
     def register_webhook(self, url: str, events: List[str], user_id: str,
                         secret: Optional[str] = None) -> Dict[str, Any]:
@@ -301,15 +366,175 @@ class EthGuardianClient:
         }
         return self._post("/webhooks/register", data)
     
-    def get_user_webhooks(self, user_id: str) -> Dict[str, Any]:
-        """Get user webhooks"""
-        return self._get(f"/webhooks/user/{user_id}")
-    
     def delete_webhook(self, webhook_id: str, user_id: str) -> Dict[str, Any]:
         """Delete webhook"""
         return self._delete(f"/webhooks/{webhook_id}", {"user_id": user_id})
     
-    def test_webhook(self, webhook_id: str) -> Dict[str, Any]:
-        """Test webhook"""
-        return self._post(f"/webhooks/{webhook_id}/test")
+    if TYPE_CHECKING:
+        # Declarations of the methods generated from _ENDPOINTS below, for IDEs and
+        # type checkers; keep them in step with that table
+        
+        # Core Analysis Methods
+        def ingest(self, address: str) -> Dict[str, Any]: ...
+        def analyze(self, address: str) -> Dict[str, Any]: ...
+        def get_profile(self, address: str) -> Dict[str, Any]: ...
+        def get_graph(self, address: str) -> Dict[str, Any]: ...
+        def get_alerts(self) -> List[Dict[str, Any]]: ...
+        
+        # Pattern Detection
+        def detect_patterns(self, address: str) -> Dict[str, Any]: ...
+        def detect_layering(self, address: str) -> Dict[str, Any]: ...
+        def detect_peel_chains(self, address: str) -> Dict[str, Any]: ...
+        def detect_wash_trading(self, address: str) -> Dict[str, Any]: ...
+        
+        # Fraud Detection
+        def detect_fraud(self, address: str) -> Dict[str, Any]: ...
+        def detect_rug_pull(self, address: str) -> Dict[str, Any]: ...
+        def detect_ponzi(self, address: str) -> Dict[str, Any]: ...
+        def detect_phishing(self, address: str) -> Dict[str, Any]: ...
+        def detect_mev_bot(self, address: str) -> Dict[str, Any]: ...
+        
+        # Advanced Detection
+        def detect_mixer_usage(self, address: str) -> Dict[str, Any]: ...
+        def analyze_smart_contracts(self, address: str) -> Dict[str, Any]: ...
+        def analyze_token_holdings(self, address: str) -> Dict[str, Any]: ...
+        def detect_bridge_usage(self, address: str) -> Dict[str, Any]: ...
+        def analyze_all_advanced(self, address: str) -> Dict[str, Any]: ...
+        
+        # NFT Fraud
+        def detect_nft_wash_trading(self, address: str) -> Dict[str, Any]: ...
+        def detect_fake_collection(self, contract: str) -> Dict[str, Any]: ...
+        def track_stolen_nft(self, contract: str, token_id: str) -> Dict[str, Any]: ...
+        
+        # Machine Learning
+        def detect_anomalies_ml(self, address: str) -> Dict[str, Any]: ...
+        def deep_pattern_recognition(self, address: str) -> Dict[str, Any]: ...
+        
+        # Cross-Chain
+        def correlate_addresses(self, address: str) -> Dict[str, Any]: ...
+        def assess_multi_chain_risk(self, address: str) -> Dict[str, Any]: ...
+        
+        # Compliance
+        def check_compliance(self, address: str) -> Dict[str, Any]: ...
+        
+        # Watchlist
+        def get_watchlist(self) -> Dict[str, Any]: ...
+        def remove_from_watchlist(self, address: str) -> Dict[str, Any]: ...
+        def start_watchlist_monitoring(self) -> Dict[str, Any]: ...
+        def stop_watchlist_monitoring(self) -> Dict[str, Any]: ...
+        
+        # Graph Tools
+        def detect_community(self, address: str) -> Dict[str, Any]: ...
+        
+        # Webhooks
+        def get_user_webhooks(self, user_id: str) -> Dict[str, Any]: ...
+        def test_webhook(self, webhook_id: str) -> Dict[str, Any]: ...
+
+
+# Endpoints that only fill a path: method name -> (request helper, path template, docstring).
+# Path fields become the method's arguments, in template order.
+_ENDPOINTS = {
+    # Core Analysis Methods
+    "ingest": ("_post", "/ingest/{address}", "Ingest address data from blockchain"),
+    "analyze": ("_post", "/analyze/{address}", "Run full analysis on address"),
+    "get_profile": ("_get", "/profile/{address}", "Get address profile"),
+    "get_graph": ("_get_streaming", "/graph/{address}", "Get transaction graph"),
+    "get_alerts": ("_get", "/alerts", "Get all alerts"),
+    # Pattern Detection
+    "detect_patterns": ("_get", "/patterns/{address}", "Detect suspicious patterns"),
+    "detect_layering": ("_get", "/patterns/{address}/layering", "Detect layering patterns"),
+    "detect_peel_chains": ("_get", "/patterns/{address}/peel-chains", "Detect peel chain patterns"),
+    "detect_wash_trading": ("_get", "/patterns/{address}/wash-trading", "Detect wash trading"),
+    # Fraud Detection
+    "detect_fraud": ("_get", "/fraud/{address}", "Detect fraud patterns"),
+    "detect_rug_pull": ("_get", "/fraud/{address}/rug-pull", "Detect rug pull pattern"),
+    "detect_ponzi": ("_get", "/fraud/{address}/ponzi", "Detect Ponzi scheme"),
+    "detect_phishing": ("_get", "/fraud/{address}/phishing", "Detect phishing"),
+    "detect_mev_bot": ("_get", "/fraud/{address}/mev-bot", "Detect MEV bot"),
+    # Advanced Detection
+    "detect_mixer_usage": ("_get", "/advanced/mixer/{address}", "Detect mixer/tumbler usage"),
+    "analyze_smart_contracts": ("_get", "/advanced/contracts/{address}", "Analyze smart contract interactions"),
+    "analyze_token_holdings": ("_get", "/advanced/tokens/{address}", "Analyze token holdings"),
+    "detect_bridge_usage": ("_get", "/advanced/bridges/{address}", "Detect bridge usage"),
+    "analyze_all_advanced": ("_get", "/advanced/all/{address}", "Run all advanced detection"),
+    # NFT Fraud
+    "detect_nft_wash_trading": ("_get", "/nft/wash-trading/{address}", "Detect NFT wash trading"),
+    "detect_fake_collection": ("_get", "/nft/fake-collection/{contract}", "Detect fake NFT collection"),
+    "track_stolen_nft": ("_get", "/nft/stolen/{contract}/{token_id}", "Track stolen NFT"),
+    # Machine Learning
+    "detect_anomalies_ml": ("_get", "/ml/autoencoder/{address}", "Autoencoder anomaly detection"),
+    "deep_pattern_recognition": ("_get", "/ml/deep-pattern/{address}", "Deep learning pattern recognition"),
+    # Cross-Chain
+    "correlate_addresses": ("_get", "/cross-chain/correlation/{address}", "Correlate addresses across chains"),
+    "assess_multi_chain_risk": ("_get", "/cross-chain/risk/{address}", "Assess multi-chain risk"),
+    # Compliance
+    "check_compliance": ("_get", "/compliance/check/{address}", "Check compliance status"),
+    # Watchlist
+    "get_watchlist": ("_get", "/watchlist", "Get all watchlist entries"),
+    "remove_from_watchlist": ("_delete", "/watchlist/{address}", "Remove from watchlist"),
+    "start_watchlist_monitoring": ("_post", "/watchlist/monitoring/start", "Start 24/7 watchlist monitoring"),
+    "stop_watchlist_monitoring": ("_post", "/watchlist/monitoring/stop", "Stop watchlist monitoring"),
+    # Graph Tools
+    "detect_community": ("_get", "/graph/community/{address}", "Detect community/cluster"),
+    # Webhooks
+    "get_user_webhooks": ("_get", "/webhooks/user/{user_id}", "Get user webhooks"),
+    "test_webhook": ("_post", "/webhooks/{webhook_id}/test", "Test webhook"),
+}
+
+
+# Return types that differ from Dict[str, Any]
+_ENDPOINT_RETURNS = {
+    "get_alerts": List[Dict[str, Any]],
+}
+
+
+def _make_endpoint(name: str, helper: str, template: str, doc: str):
+    """Build an EthGuardianClient method that fills the path template and calls the helper"""
+    parsed = list(Formatter().parse(template))
+    fields = tuple(field for _, field, _, _ in parsed if field)
+    
+    def bind(args, kwargs):
+        """Path values in template order, from positional and keyword arguments"""
+        values = dict(zip(fields, args), **kwargs)
+        if len(args) + len(kwargs) != len(fields) or values.keys() != set(fields):
+            raise TypeError(f"{name}() takes the arguments: {', '.join(fields) or 'none'}")
+        return [values[field] for field in fields]
+    
+    # Templates are parsed once here; getattr(self, helper) is resolved per call
+    # so subclasses (e.g. the async client) supply their own helpers
+    if len(fields) == 1:
+        # Nearly every endpoint: interned prefix + value + suffix
+        head = sys.intern(parsed[0][0])
+        tail = sys.intern(parsed[1][0]) if len(parsed) > 1 else ""
+        
+        def endpoint(self, *args, **kwargs):
+            (value,) = args if len(args) == 1 and not kwargs else bind(args, kwargs)
+            return getattr(self, helper)(f"{head}{value}{tail}")
+    elif not fields:
+        path = sys.intern(template)
+        
+        def endpoint(self, *args, **kwargs):
+            if args or kwargs:
+                bind(args, kwargs)
+            return getattr(self, helper)(path)
+    else:
+        def endpoint(self, *args, **kwargs):
+            return getattr(self, helper)(template.format_map(dict(zip(fields, bind(args, kwargs)))))
+    
+    # help() and inspect see the same signature a hand-written def would have;
+    # static tools read the TYPE_CHECKING declarations in EthGuardianClient instead
+    returns = _ENDPOINT_RETURNS.get(name, Dict[str, Any])
+    endpoint.__name__ = name
+    endpoint.__qualname__ = f"EthGuardianClient.{name}"
+    endpoint.__doc__ = doc
+    endpoint.__annotations__ = {**{field: str for field in fields}, "return": returns}
+    endpoint.__signature__ = Signature(
+        [Parameter("self", Parameter.POSITIONAL_OR_KEYWORD)]
+        + [Parameter(field, Parameter.POSITIONAL_OR_KEYWORD, annotation=str) for field in fields],
+        return_annotation=returns
+    )
+    return endpoint
+
 
+for _name, _spec in _ENDPOINTS.items():
+    setattr(EthGuardianClient, _name, _make_endpoint(_name, *_spec))
@@ -0,0 +1,32 @@
+# PyOxidizer config for a standalone ethguardian-cli binary: the interpreter
+# and the SDK's precompiled bytecode are embedded and imported from memory.
+#
+#   cd sdk/python && pyoxidizer build --release
+
+def make_exe():
+    dist = default_python_distribution()
+
+    policy = dist.make_python_packaging_policy()
+    policy.resources_location = "in-memory"
+    policy.resources_location_fallback = "filesystem-relative:lib"
+
+    python_config = dist.make_python_interpreter_config()
+    python_config.run_module = "ethguardian.cli"
+
+    exe = dist.to_python_executable(
+        name = "ethguardian-cli",
+        packaging_policy = policy,
+        config = python_config,
+    )
+    exe.add_python_resources(exe.pip_install([CWD]))
+    return exe
+
+def make_install(exe):
+    files = FileManifest()
+    files.add_python_resource(".", exe)
+    return files
+
+register_target("exe", make_exe)
+register_target("install", make_install, depends = ["exe"], default = True)
+
+resolve_targets()
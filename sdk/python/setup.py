@@ -10,7 +10,15 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.28.0",
+        "orjson>=3.10",
     ],
+    extras_require={
+        "async": ["httpx[http2]>=0.27"],
+        "fast": ["msgspec>=0.18"],
+    },
+    entry_points={
+        "console_scripts": ["ethguardian-cli = ethguardian.cli:run"],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 4 - Beta",